@@ -0,0 +1,370 @@
+import random
+from typing import Callable, Dict, List
+
+from limit_order_sdk import (
+    Address,
+    BytesBuilder,
+    BytesIter,
+    Extension,
+    ExtensionBuilder,
+    ExtensionCache,
+    FillSimulator,
+    IngestPipeline,
+    Interaction,
+    LadderLevel,
+    LadderManager,
+    LimitOrder,
+    LimitOrderContract,
+    MakerTraits,
+    OrderBatch,
+    OrderInfoData,
+    OrderSigner,
+    OrderTemplate,
+    RfqPair,
+    RfqQuoter,
+    TakerTraits,
+    UINT_40_MAX,
+    decode_logs,
+    encode_order_record,
+    validate_orders,
+)
+from limit_order_sdk.events.event_decoder import ORDER_FILLED_TOPIC
+
+# A case takes the number of orders and returns a callable doing the measured work for all of them.
+# Input generation happens outside of the returned callable, so only the SDK code is timed.
+BenchCase = Callable[[int], Callable[[], None]]
+
+CASES: Dict[str, BenchCase] = {}
+
+SEED = 1337
+CHAIN_ID = 1
+SIGNATURE = "0x" + "11" * 32 + "22" * 32 + "1b"
+
+
+def bench_case(name: str) -> Callable[[BenchCase], BenchCase]:
+    def register(case: BenchCase) -> BenchCase:
+        CASES[name] = case
+        return case
+
+    return register
+
+
+def random_address(rnd: random.Random) -> Address:
+    return Address.from_int(rnd.getrandbits(160))
+
+
+def make_order_infos(size: int, rnd: random.Random) -> List[OrderInfoData]:
+    maker_asset = random_address(rnd)
+    taker_asset = random_address(rnd)
+    return [
+        OrderInfoData(
+            maker_asset=maker_asset,
+            taker_asset=taker_asset,
+            making_amount=rnd.getrandbits(96),
+            taking_amount=rnd.getrandbits(96),
+            maker=random_address(rnd),
+            salt=rnd.getrandbits(96),
+        )
+        for _ in range(size)
+    ]
+
+
+def make_extensions(size: int, rnd: random.Random) -> List[Extension]:
+    return [
+        ExtensionBuilder()
+        .with_making_amount_data(random_address(rnd), "0x" + rnd.randbytes(32).hex())
+        .with_taking_amount_data(random_address(rnd), "0x" + rnd.randbytes(32).hex())
+        .with_predicate("0x" + rnd.randbytes(64).hex())
+        .with_post_interaction(Interaction(random_address(rnd), "0x" + rnd.randbytes(16).hex()))
+        .build()
+        for _ in range(size)
+    ]
+
+
+def make_orders(size: int, rnd: random.Random) -> List[LimitOrder]:
+    return [LimitOrder(info, MakerTraits.default()) for info in make_order_infos(size, rnd)]
+
+
+@bench_case("order_construction")
+def order_construction(size: int) -> Callable[[], None]:
+    infos = make_order_infos(size, random.Random(SEED))
+
+    def run() -> None:
+        for info in infos:
+            LimitOrder(info, MakerTraits.default())
+
+    return run
+
+
+@bench_case("maker_traits_build")
+def maker_traits_build(size: int) -> Callable[[], None]:
+    rnd = random.Random(SEED)
+    params = [(random_address(rnd), rnd.randint(0, UINT_40_MAX), rnd.randint(0, UINT_40_MAX)) for _ in range(size)]
+
+    def run() -> None:
+        for sender, expiration, nonce in params:
+            MakerTraits.default().with_allowed_sender(sender).with_expiration(expiration).with_nonce(nonce).allow_multiple_fills().enable_post_interaction().as_int()
+
+    return run
+
+
+@bench_case("extension_encode")
+def extension_encode(size: int) -> Callable[[], None]:
+    extensions = make_extensions(size, random.Random(SEED))
+
+    def run() -> None:
+        for ext in extensions:
+            ext._encode()  # bypasses the per-instance cache of `encode`
+
+    return run
+
+
+@bench_case("extension_decode")
+def extension_decode(size: int) -> Callable[[], None]:
+    encoded = [ext.encode() for ext in make_extensions(size, random.Random(SEED))]
+
+    def run() -> None:
+        for data in encoded:
+            Extension.decode(data)
+
+    return run
+
+
+@bench_case("extension_cache_decode")
+def extension_cache_decode(size: int) -> Callable[[], None]:
+    # Books share a few integrator extensions, every distinct one repeats for ~100 orders
+    rnd = random.Random(SEED)
+    distinct = [ext.encode() for ext in make_extensions(max(1, size // 100), rnd)]
+    encoded = [rnd.choice(distinct) for _ in range(size)]
+
+    def run() -> None:
+        cache = ExtensionCache()
+        for data in encoded:
+            cache.decode(data).keccak256()
+
+    return run
+
+
+@bench_case("get_order_hash")
+def get_order_hash(size: int) -> Callable[[], None]:
+    orders = make_orders(size, random.Random(SEED))
+
+    def run() -> None:
+        for order in orders:
+            order.__dict__.pop("_cached", None)  # measure the computation, not the cache of the previous round
+            order.get_order_hash(CHAIN_ID)
+
+    return run
+
+
+@bench_case("to_calldata")
+def to_calldata(size: int) -> Callable[[], None]:
+    orders = make_orders(size, random.Random(SEED))
+
+    def run() -> None:
+        for order in orders:
+            order.__dict__.pop("_cached", None)  # measure the computation, not the cache of the previous round
+            order.to_calldata()
+
+    return run
+
+
+@bench_case("order_submit_data")
+def order_submit_data(size: int) -> Callable[[], None]:
+    orders = make_orders(size, random.Random(SEED))
+
+    def run() -> None:
+        # Data read by `Api.submit_order` and fill calldata encoding, built once per order and then served from its cache
+        for order in orders:
+            order.get_order_hash(CHAIN_ID)
+            order.build().to_dict()
+            order.to_calldata()
+
+    return run
+
+
+@bench_case("order_sign")
+def order_sign(size: int) -> Callable[[], None]:
+    rnd = random.Random(SEED)
+    signer = OrderSigner(rnd.randbytes(32))
+    orders = make_orders(size, rnd)
+
+    def run() -> None:
+        for order in orders:
+            order.__dict__.pop("_cached", None)  # hash every round, like a freshly built order
+        signer.sign_orders(orders, CHAIN_ID)
+
+    return run
+
+
+@bench_case("from_calldata")
+def from_calldata(size: int) -> Callable[[], None]:
+    calldata = [order.to_calldata() for order in make_orders(size, random.Random(SEED))]
+
+    def run() -> None:
+        for data in calldata:
+            LimitOrder.from_calldata(data)
+
+    return run
+
+
+@bench_case("bytes_builder")
+def bytes_builder(size: int) -> Callable[[], None]:
+    # One builder per order, writing the same 8 words an order struct occupies
+    structs = [order.build().to_int_tuple() for order in make_orders(size, random.Random(SEED))]
+
+    def run() -> None:
+        for struct in structs:
+            builder = BytesBuilder()
+            for word in struct:
+                builder.add_uint256(word)
+            builder.as_hex()
+
+    return run
+
+
+@bench_case("bytes_iter")
+def bytes_iter(size: int) -> Callable[[], None]:
+    calldata = [order.to_calldata() for order in make_orders(size, random.Random(SEED))]
+
+    def run() -> None:
+        for data in calldata:
+            words = BytesIter.to_int(data)
+            while not words.is_empty():
+                words.next_uint256()
+
+    return run
+
+
+@bench_case("fill_order_calldata")
+def fill_order_calldata(size: int) -> Callable[[], None]:
+    structs = [order.build() for order in make_orders(size, random.Random(SEED))]
+
+    def run() -> None:
+        for struct in structs:
+            LimitOrderContract.get_fill_order_calldata(struct, SIGNATURE, TakerTraits.default(), struct.makingAmount)
+
+    return run
+
+
+@bench_case("order_batch_filter")
+def order_batch_filter(size: int) -> Callable[[], None]:
+    rnd = random.Random(SEED)
+    orders = [LimitOrder(info, MakerTraits.default().with_expiration(rnd.randint(0, UINT_40_MAX))) for info in make_order_infos(size, rnd)]
+    batch = OrderBatch(orders)
+    maker_asset, taker_asset = orders[0].maker_asset, orders[0].taker_asset
+    batch.expired_at(0)  # expiration index is built once per batch
+
+    def run() -> None:
+        mask = batch.for_pair(maker_asset, taker_asset) & batch.allows_partial_fills() & batch.invert(batch.expired_at(UINT_40_MAX // 2) | batch.is_private())
+        batch.indices(mask)
+
+    return run
+
+
+@bench_case("validate_orders")
+def validate_orders_case(size: int) -> Callable[[], None]:
+    rnd = random.Random(SEED)
+    orders = []
+    for i, info in enumerate(make_order_infos(size, rnd)):
+        traits = MakerTraits.default().with_expiration(rnd.randint(0, UINT_40_MAX))
+        if i % 2:
+            extension = ExtensionBuilder().with_post_interaction(Interaction(random_address(rnd), "0x" + rnd.randbytes(32).hex())).build()
+            info.salt = LimitOrder.build_salt(extension, info.salt)
+            orders.append(LimitOrder(info, traits.enable_post_interaction(), extension))
+        else:
+            orders.append(LimitOrder(info, traits))
+
+    def run() -> None:
+        validate_orders(orders, now=UINT_40_MAX // 2)
+
+    return run
+
+
+@bench_case("order_template_stamp")
+def order_template_stamp(size: int) -> Callable[[], None]:
+    rnd = random.Random(SEED)
+    template = OrderTemplate(random_address(rnd), random_address(rnd), random_address(rnd), maker_traits=MakerTraits.default().allow_multiple_fills())
+    making_amounts = [rnd.getrandbits(96) for _ in range(size)]
+    taking_amounts = [rnd.getrandbits(96) for _ in range(size)]
+    expirations = [rnd.randint(0, UINT_40_MAX) for _ in range(size)]
+
+    def run() -> None:
+        template.get_order_hashes(template.stamp(making_amounts, taking_amounts, expirations=expirations), CHAIN_ID)
+
+    return run
+
+
+@bench_case("rfq_quotes")
+def rfq_quotes(size: int) -> Callable[[], None]:
+    # Signed quotes, the per-order time is the inverse of quotes per second of one core
+    rnd = random.Random(SEED)
+    quoter = RfqQuoter(rnd.randbytes(32), CHAIN_ID)
+    pair = RfqPair(random_address(rnd), random_address(rnd), ttl=30)
+    making_amounts = [rnd.getrandbits(96) for _ in range(size)]
+    taking_amounts = [rnd.getrandbits(96) for _ in range(size)]
+
+    def run() -> None:
+        quoter.quotes(pair, making_amounts, taking_amounts)
+
+    return run
+
+
+@bench_case("ladder_refresh")
+def ladder_refresh(size: int) -> Callable[[], None]:
+    # Ticks alternate between two ladders differing in every tenth level, per-order time is per ladder level
+    rnd = random.Random(SEED)
+    manager = LadderManager(RfqQuoter(rnd.randbytes(32), CHAIN_ID), RfqPair(random_address(rnd), random_address(rnd), ttl=3600))
+    ladders = [[LadderLevel(10**18, 1400 * 10**6 + i * 10**5 + (tick if i % 10 == 0 else 0)) for i in range(size)] for tick in range(2)]
+    manager.refresh(ladders[1])
+    ticks = [1]
+
+    def run() -> None:
+        ticks[0] += 1
+        manager.refresh(ladders[ticks[0] % 2])
+
+    return run
+
+
+@bench_case("fill_simulation")
+def fill_simulation(size: int) -> Callable[[], None]:
+    # One pair book, the swap walks through the whole of it
+    rnd = random.Random(SEED)
+    infos = make_order_infos(size, rnd)
+    for info in infos:
+        info.maker_asset, info.taker_asset = infos[0].maker_asset, infos[0].taker_asset
+    orders = [LimitOrder(info, MakerTraits.default()) for info in infos]
+    simulator = FillSimulator(orders)
+    amount = sum(order.taking_amount for order in orders)
+
+    def run() -> None:
+        simulator.simulate(amount)
+
+    return run
+
+
+@bench_case("decode_logs")
+def decode_logs_case(size: int) -> Callable[[], None]:
+    # OrderFilled logs in the JSON-RPC format, as in `eth_getLogs` dumps
+    rnd = random.Random(SEED)
+    logs = [{"topics": [ORDER_FILLED_TOPIC], "data": "0x" + rnd.randbytes(32).hex() + rnd.getrandbits(96).to_bytes(32, "big").hex(), "blockNumber": hex(i), "logIndex": "0x0"} for i in range(size)]
+
+    def run() -> None:
+        for _ in decode_logs(logs):
+            pass
+
+    return run
+
+
+@bench_case("ingest_pipeline")
+def ingest_pipeline(size: int) -> Callable[[], None]:
+    # In-process stages, per-core cost of the pipeline: shared memory batches, decode and hash
+    rnd = random.Random(SEED)
+    records = [encode_order_record(order, SIGNATURE) for order in make_orders(size, rnd)]
+    pipeline = IngestPipeline(CHAIN_ID, workers=0)
+
+    def run() -> None:
+        for _ in pipeline.run(records):
+            pass
+
+    return run
@@ -0,0 +1,147 @@
+"""
+Runs the benchmark suite and compares results against stored baselines.
+
+    python -m benchmarks.run                        # run all cases, compare with benchmarks/baseline.json
+    python -m benchmarks.run --sizes 1 1000         # quick run, skipping the 100k orders size
+    python -m benchmarks.run --cases get_order_hash --sizes 1000
+    python -m benchmarks.run --save-baseline        # store current results as the new baseline
+
+The process exits with code 1 when any case is slower than its baseline by more than `--threshold`.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Sequence
+
+from benchmarks.cases import CASES
+
+DEFAULT_SIZES = (1, 1_000, 100_000)
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+# Small sizes are too quick to measure reliably with a single run, so they are repeated
+# until at least this many orders are processed in total.
+MIN_ORDERS_PER_CASE = 1_000
+
+
+@dataclass
+class BenchResult:
+    case: str
+    size: int
+    rounds: int
+    per_op_s: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.case}[{self.size}]"
+
+    @property
+    def ops_per_s(self) -> float:
+        return 1 / self.per_op_s if self.per_op_s else float("inf")
+
+
+@dataclass
+class Comparison:
+    result: BenchResult
+    baseline_per_op_s: Optional[float]
+    ratio: Optional[float]
+    is_regression: bool
+
+
+def run_case(name: str, size: int, repeat: int) -> BenchResult:
+    """
+    Times case `name` for `size` orders and returns the best per-order time among the rounds.
+    """
+    run = CASES[name](size)
+    rounds = max(repeat, -(-MIN_ORDERS_PER_CASE // size))
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return BenchResult(case=name, size=size, rounds=rounds, per_op_s=best / size)
+
+
+def run_suite(cases: Sequence[str], sizes: Sequence[int], repeat: int) -> List[BenchResult]:
+    results = []
+    for name in cases:
+        # Warm up lazy imports and caches so they do not end up in the first measurement
+        CASES[name](1)()
+        for size in sizes:
+            result = run_case(name, size, repeat)
+            print(f"  {result.key:<32} {result.per_op_s * 1e6:>12.2f} us/op {result.ops_per_s:>14.0f} ops/s", file=sys.stderr)
+            results.append(result)
+    return results
+
+
+def load_baseline(path: str) -> Dict[str, float]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return {key: entry["per_op_s"] for key, entry in json.load(f)["results"].items()}
+
+
+def save_baseline(path: str, results: List[BenchResult]) -> None:
+    data = {
+        "machine": {"python": platform.python_version(), "implementation": platform.python_implementation(), "platform": platform.platform(), "processor": platform.machine()},
+        "results": {result.key: asdict(result) for result in results},
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(results: List[BenchResult], baseline: Dict[str, float], threshold: float) -> List[Comparison]:
+    comparisons = []
+    for result in results:
+        baseline_per_op_s = baseline.get(result.key)
+        ratio = result.per_op_s / baseline_per_op_s if baseline_per_op_s else None
+        comparisons.append(Comparison(result=result, baseline_per_op_s=baseline_per_op_s, ratio=ratio, is_regression=ratio is not None and ratio > 1 + threshold))
+    return comparisons
+
+
+def format_report(comparisons: List[Comparison], threshold: float) -> str:
+    lines = [f"{'case':<32} {'us/op':>12} {'baseline':>12} {'change':>9}  status", "-" * 76]
+    for comparison in comparisons:
+        result = comparison.result
+        if comparison.ratio is None:
+            baseline, change, status = "-", "-", "new"
+        else:
+            baseline = f"{comparison.baseline_per_op_s * 1e6:.2f}"
+            change = f"{(comparison.ratio - 1) * 100:+.1f}%"
+            status = "REGRESSION" if comparison.is_regression else ("faster" if comparison.ratio < 1 - threshold else "ok")
+        lines.append(f"{result.key:<32} {result.per_op_s * 1e6:>12.2f} {baseline:>12} {change:>9}  {status}")
+
+    regressions = [c for c in comparisons if c.is_regression]
+    lines.append("")
+    lines.append(f"{len(regressions)} regression(s) over {threshold * 100:.0f}% threshold" if regressions else "No regressions")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="limit_order_sdk benchmark suite")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES), help="cases to run, all by default")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="number of orders per case")
+    parser.add_argument("--repeat", type=int, default=3, help="rounds per case, the best one is reported")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="baseline file to compare with or to save to")
+    parser.add_argument("--threshold", type=float, default=0.25, help="relative slowdown reported as a regression")
+    parser.add_argument("--save-baseline", action="store_true", help="store results as the new baseline instead of comparing")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.cases, args.sizes, args.repeat)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    comparisons = compare(results, load_baseline(args.baseline), args.threshold)
+    print(format_report(comparisons, args.threshold))
+    return 1 if any(c.is_regression for c in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,171 @@
-from limit_order_sdk.api import *
-from limit_order_sdk.libs.byte_utils import *
-from limit_order_sdk.limit_order_contract import *
-from limit_order_sdk.limit_order import *
-from limit_order_sdk.rfq_order import *
-from limit_order_sdk.utils import *
-from limit_order_sdk.address import *
-from limit_order_sdk.constants import *
-from limit_order_sdk.validations import *
+import importlib
+from typing import Any, Dict, List
+
+# Public names are resolved on first access, so `import limit_order_sdk` stays cheap
+# and heavy dependencies (web3, eth_abi, eth_account, requests) load only when a feature needs them.
+_LAZY_ATTRS: Dict[str, str] = {
+    # api
+    "AuthError": "limit_order_sdk.api.errors",
+    "DEV_PORTAL_LIMIT_ORDER_BASE_URL": "limit_order_sdk.api.constants",
+    "ApiConfig": "limit_order_sdk.api.custom_types",
+    "LimitOrderApiItem": "limit_order_sdk.api.custom_types",
+    "StatusKey": "limit_order_sdk.api.custom_types",
+    "SortKey": "limit_order_sdk.api.custom_types",
+    "Pager": "limit_order_sdk.api.pager",
+    "Api": "limit_order_sdk.api.api",
+    "HttpProviderConnector": "limit_order_sdk.api.connector.http.http_provider",
+    "FetchProviderConnector": "limit_order_sdk.api.connector.http.fetch_provider",
+    # libs.byte_utils
+    "BytesIter": "limit_order_sdk.libs.byte_utils.bytes_iter",
+    "Side": "limit_order_sdk.libs.byte_utils.bytes_iter",
+    "BitMask": "limit_order_sdk.libs.byte_utils.bit_mask",
+    "BN": "limit_order_sdk.libs.byte_utils.bn",
+    "BytesBuilder": "limit_order_sdk.libs.byte_utils.bytes_builder",
+    "UINT_8_MAX": "limit_order_sdk.libs.byte_utils.constants",
+    "UINT_24_MAX": "limit_order_sdk.libs.byte_utils.constants",
+    "UINT_32_MAX": "limit_order_sdk.libs.byte_utils.constants",
+    "UINT_40_MAX": "limit_order_sdk.libs.byte_utils.constants",
+    "UINT_80_MAX": "limit_order_sdk.libs.byte_utils.constants",
+    "UINT_160_MAX": "limit_order_sdk.libs.byte_utils.constants",
+    "UINT_256_MAX": "limit_order_sdk.libs.byte_utils.constants",
+    "is_hex_string": "limit_order_sdk.libs.byte_utils.validations",
+    "is_hex_bytes": "limit_order_sdk.libs.byte_utils.validations",
+    "as_bytes": "limit_order_sdk.libs.byte_utils.utils.as_bytes",
+    "get_bytes_count": "limit_order_sdk.libs.byte_utils.utils.get_bytes_count",
+    "trim_0x": "limit_order_sdk.libs.byte_utils.utils.zero_x_prefix",
+    "add_0x": "limit_order_sdk.libs.byte_utils.utils.zero_x_prefix",
+    # limit_order_contract
+    "LimitOrderContract": "limit_order_sdk.limit_order_contract.limit_order_contract",
+    "CancelCall": "limit_order_sdk.limit_order_contract.cancel_calls",
+    "CancelFunction": "limit_order_sdk.limit_order_contract.cancel_calls",
+    "build_cancel_calls": "limit_order_sdk.limit_order_contract.cancel_calls",
+    # limit_order
+    "Interaction": "limit_order_sdk.limit_order.interaction",
+    "FrozenInteraction": "limit_order_sdk.limit_order.interaction",
+    "Extension": "limit_order_sdk.limit_order.extension",
+    "FrozenExtension": "limit_order_sdk.limit_order.extension",
+    "MakerTraits": "limit_order_sdk.limit_order.maker_traits",
+    "FrozenMakerTraits": "limit_order_sdk.limit_order.maker_traits",
+    "LimitOrderV4Struct": "limit_order_sdk.limit_order.custom_types",
+    "OrderInfoData": "limit_order_sdk.limit_order.custom_types",
+    "LimitOrder": "limit_order_sdk.limit_order.limit_order",
+    "FrozenLimitOrder": "limit_order_sdk.limit_order.frozen_limit_order",
+    "ExtensionBuilder": "limit_order_sdk.limit_order.extension_builder",
+    "TakerTraits": "limit_order_sdk.limit_order.taker_traits",
+    "AmountMode": "limit_order_sdk.limit_order.taker_traits",
+    "SaltGenerator": "limit_order_sdk.limit_order.salt_generator",
+    "default_salt_generator": "limit_order_sdk.limit_order.salt_generator",
+    "OrderTemplate": "limit_order_sdk.limit_order.order_template",
+    "OrderSigner": "limit_order_sdk.limit_order.order_signer",
+    "ExtensionCache": "limit_order_sdk.limit_order.extension_cache",
+    "default_extension_cache": "limit_order_sdk.limit_order.extension_cache",
+    # rfq_order
+    "RfqOrder": "limit_order_sdk.rfq_order.rfq_order",
+    "NonceAllocator": "limit_order_sdk.rfq_order.rfq_quoter",
+    "RfqPair": "limit_order_sdk.rfq_order.rfq_quoter",
+    "RfqQuote": "limit_order_sdk.rfq_order.rfq_quoter",
+    "RfqQuoter": "limit_order_sdk.rfq_order.rfq_quoter",
+    # utils
+    "get_contract_web3": "limit_order_sdk.utils.contract",
+    "rand_int": "limit_order_sdk.utils.rand_int",
+    "signature_to_r_vs": "limit_order_sdk.utils.signature",
+    # address
+    "is_address": "limit_order_sdk.address",
+    "Address": "limit_order_sdk.address",
+    "NATIVE_CURRENCY": "limit_order_sdk.address",
+    "ZERO_ADDRESS": "limit_order_sdk.address",
+    # constants
+    "ZX": "limit_order_sdk.constants",
+    "ONE_INCH_LIMIT_ORDER_V4": "limit_order_sdk.constants",
+    "ONE_INCH_LIMIT_ORDER_V4_ZK_SYNC": "limit_order_sdk.constants",
+    "get_limit_order_contract": "limit_order_sdk.constants",
+    # chain_context
+    "ChainContext": "limit_order_sdk.chain_context",
+    "ChainLike": "limit_order_sdk.chain_context",
+    "get_chain_context": "limit_order_sdk.chain_context",
+    # validations
+    "is_int": "limit_order_sdk.validations",
+    # metrics
+    "MetricsSink": "limit_order_sdk.metrics.sinks",
+    "CallbackSink": "limit_order_sdk.metrics.sinks",
+    "InMemoryRecorder": "limit_order_sdk.metrics.sinks",
+    "PrometheusSink": "limit_order_sdk.metrics.sinks",
+    "instrumented": "limit_order_sdk.metrics.instrumented",
+    "set_metrics_sink": "limit_order_sdk.metrics.instrumented",
+    "get_metrics_sink": "limit_order_sdk.metrics.instrumented",
+    # order_archive
+    "ORDER_HEAD_SIZE": "limit_order_sdk.order_archive.record",
+    "OrderRecord": "limit_order_sdk.order_archive.record",
+    "encode_order_head": "limit_order_sdk.order_archive.record",
+    "decode_order_head": "limit_order_sdk.order_archive.record",
+    "encode_order_record": "limit_order_sdk.order_archive.record",
+    "decode_order_record": "limit_order_sdk.order_archive.record",
+    "OrderArchiveWriter": "limit_order_sdk.order_archive.archive",
+    "OrderArchiveReader": "limit_order_sdk.order_archive.archive",
+    # order_batch
+    "OrderBatch": "limit_order_sdk.order_batch.order_batch",
+    "IndexMask": "limit_order_sdk.order_batch.order_batch",
+    "ValidationReason": "limit_order_sdk.order_batch.batch_validator",
+    "describe_reasons": "limit_order_sdk.order_batch.batch_validator",
+    "validate_orders": "limit_order_sdk.order_batch.batch_validator",
+    # expiry
+    "ExpiryScheduler": "limit_order_sdk.expiry.expiry_scheduler",
+    # predicate
+    "Predicate": "limit_order_sdk.predicate.predicate",
+    "And": "limit_order_sdk.predicate.predicate",
+    "Or": "limit_order_sdk.predicate.predicate",
+    "Not": "limit_order_sdk.predicate.predicate",
+    "Eq": "limit_order_sdk.predicate.predicate",
+    "Lt": "limit_order_sdk.predicate.predicate",
+    "Gt": "limit_order_sdk.predicate.predicate",
+    "ArbitraryStaticCall": "limit_order_sdk.predicate.predicate",
+    "TimestampBelow": "limit_order_sdk.predicate.predicate",
+    "EpochEquals": "limit_order_sdk.predicate.predicate",
+    "Call": "limit_order_sdk.predicate.predicate",
+    "decode_predicate": "limit_order_sdk.predicate.predicate",
+    "PredicateResolver": "limit_order_sdk.predicate.predicate_evaluator",
+    "PredicateEvaluator": "limit_order_sdk.predicate.predicate_evaluator",
+    "StaticCallFailed": "limit_order_sdk.predicate.predicate_evaluator",
+    # fill_simulator
+    "FillSimulator": "limit_order_sdk.fill_simulator.fill_simulator",
+    "FillPlan": "limit_order_sdk.fill_simulator.fill_simulator",
+    "OrderFill": "limit_order_sdk.fill_simulator.fill_simulator",
+    # order_state
+    "OrderStateTracker": "limit_order_sdk.order_state.order_state_tracker",
+    # events
+    "OrderFilledEvent": "limit_order_sdk.events.event_decoder",
+    "OrderCancelledEvent": "limit_order_sdk.events.event_decoder",
+    "BitInvalidatorUpdatedEvent": "limit_order_sdk.events.event_decoder",
+    "EpochIncreasedEvent": "limit_order_sdk.events.event_decoder",
+    "LimitOrderEvent": "limit_order_sdk.events.event_decoder",
+    "decode_log": "limit_order_sdk.events.event_decoder",
+    "decode_logs": "limit_order_sdk.events.event_decoder",
+    "read_jsonl_logs": "limit_order_sdk.events.event_decoder",
+    "decode_jsonl_logs": "limit_order_sdk.events.event_decoder",
+    # ingest
+    "IngestPipeline": "limit_order_sdk.ingest.ingest_pipeline",
+    "IngestedOrder": "limit_order_sdk.ingest.ingest_pipeline",
+    "OrderValidator": "limit_order_sdk.ingest.ingest_pipeline",
+    # ladder
+    "LadderLevel": "limit_order_sdk.ladder.ladder_manager",
+    "LadderManager": "limit_order_sdk.ladder.ladder_manager",
+    "LadderRefresh": "limit_order_sdk.ladder.ladder_manager",
+    "LadderStats": "limit_order_sdk.ladder.ladder_manager",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so subsequent lookups skip `__getattr__`
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,5 @@
+import sys
+
+from limit_order_sdk.cli import main
+
+sys.exit(main())
@@ -1,30 +1,115 @@
-from web3 import Web3
-from limit_order_sdk.libs.byte_utils import add_0x
+import weakref
+from typing import Optional, Union
+
+ADDRESS_LENGTH = 20
+
+
+def _parse_address(val: str) -> Optional[bytes]:
+    # Returns 20 address bytes or None if `val` is not a valid address.
+    # Addresses without mixed case carry no checksum, so only mixed-case input is passed on to web3.
+    body = val[2:] if val[:2] == "0x" else val
+    if len(body) != 2 * ADDRESS_LENGTH:
+        return None
+    try:
+        raw = bytes.fromhex(body)
+    except ValueError:
+        return None
+    if len(raw) != ADDRESS_LENGTH:  # `bytes.fromhex` skips whitespace
+        return None
+    if body.islower() or body.isupper() or body.isdigit():
+        return raw
+
+    from web3 import Web3
+
+    return raw if Web3.is_address(val) else None
+
+
+def is_address(val: str) -> bool:
+    """
+    Checks that `val` is a valid address. Mixed-case input is checked with `Web3.is_address`, the rest without loading web3.
+
+    Parameters:
+        val (str): The string to check.
+
+    Returns:
+        bool: True if `val` is a valid address; False otherwise.
+    """
+    return _parse_address(val) is not None
 
 
 class Address:
+    """
+    EVM address. Canonical form is its 20 bytes, addresses are equal and hash the same when their bytes are equal.
+
+    `Address.interned` returns one shared instance per address, to keep repeated makers and assets of large books
+    in a single object.
+    """
+
+    __slots__ = ("val", "_bytes", "__weakref__")
+
+    _interned: "weakref.WeakValueDictionary[bytes, Address]" = weakref.WeakValueDictionary()
+
     def __init__(self, val: str):
-        assert Web3.is_address(val), f"Invalid address {val}"
-        self.val = val.lower()
+        raw = _parse_address(val)
+        assert raw is not None, f"Invalid address {val}"
+        self._bytes = raw
+        self.val = "0x" + raw.hex()
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> "Address":
+        """Creates an Address instance from 20 address bytes."""
+        assert len(raw) == ADDRESS_LENGTH, f"Invalid address length {len(raw)}"
+        address = cls.__new__(cls)
+        address._bytes = bytes(raw)
+        address.val = "0x" + address._bytes.hex()
+        return address
 
     @classmethod
     def from_int(cls, val: int) -> "Address":
         """Creates an Address instance from int value."""
-        address: str = hex(val)[2:].zfill(40)
-        return cls(add_0x(address))
+        return cls.from_bytes(val.to_bytes(ADDRESS_LENGTH, "big"))
 
     @classmethod
     def from_first_bytes(cls, bytes: str) -> "Address":
         """Creates an Address instance from the first bytes of a given string."""
         return cls(bytes[:42])
 
+    @classmethod
+    def interned(cls, val: Union[str, bytes, "Address"]) -> "Address":
+        """
+        Returns the shared Address instance for `val`, creating it on first use.
+        Instances are kept while referenced anywhere, so the table does not grow past the live addresses.
+        """
+        if isinstance(val, Address):
+            address = val
+        elif isinstance(val, bytes):
+            address = cls.from_bytes(val)
+        else:
+            address = cls(val)
+        return cls._interned.setdefault(address._bytes, address)
+
+    def to_bytes(self) -> bytes:
+        """Returns the 20 address bytes."""
+        return self._bytes
+
     def __str__(self) -> str:
         """Returns the string representation of the Address."""
         return self.val
 
+    def __repr__(self) -> str:
+        return f"Address({self.val})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Address):
+            return NotImplemented
+        return self._bytes == other._bytes
+
+    def __hash__(self) -> int:
+        return hash(self._bytes)
+
     def equal(self, other: "Address") -> bool:
         """Checks if this Address is equal to another."""
-        return self.val == other.val
+        return self._bytes == other._bytes
 
     def is_native(self) -> bool:
         """Checks if this Address is the native currency address."""
@@ -35,5 +120,5 @@ class Address:
         return self.equal(ZERO_ADDRESS)
 
 
-NATIVE_CURRENCY = Address("0xeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee")
-ZERO_ADDRESS = Address("0x0000000000000000000000000000000000000000")
+NATIVE_CURRENCY = Address.interned("0xeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee")
+ZERO_ADDRESS = Address.interned("0x0000000000000000000000000000000000000000")
@@ -1,10 +1,10 @@
-import requests
 from typing import Any, Dict, Union, Optional, List
 from urllib.parse import urlencode
 from limit_order_sdk.api import ApiConfig, LimitOrderApiItem, StatusKey, SortKey, DEV_PORTAL_LIMIT_ORDER_BASE_URL, Pager
 from limit_order_sdk.api.connector import HttpProviderConnector
 from limit_order_sdk.limit_order import LimitOrder
 from limit_order_sdk.address import Address
+from limit_order_sdk.metrics.instrumented import instrumented
 
 
 class Api:
@@ -20,9 +20,9 @@ class Api:
         @param order
         @param signature
         """
-        data = {"orderHash": order.get_order_hash(self.chain_id), "signature": signature, "data": {**(order.build().__dict__), "extension": order.extension.encode()}}
+        data = {"orderHash": order.get_order_hash(self.chain_id), "signature": signature, "data": {**order.build().to_dict(), "extension": order.extension.encode()}}
         print(f"http_client {self.http_client}, url: {self.url('/')}, headers: {self.headers()}, data: {data}")
-        res = self.http_client.post(
+        res = self.http_post(
             self.url("/"),
             data,
             headers=self.headers(),
@@ -37,14 +37,24 @@ class Api:
         params: Dict[str, Any] = {"limit": None, "page": None, "statuses": None, "makerAsset": None, "takerAsset": None, "sortBy": sort_key}
         if filters:
             params.update(filters)
-        return self.http_client.get(self.url(f"/address/{maker}", params), headers=self.headers())
+        return self.http_get(self.url(f"/address/{maker}", params), headers=self.headers())
 
     def get_order_by_hash(self, hash: str) -> LimitOrderApiItem:
         """
         Get limit order by hash
         Error will be thrown if order is not found
         """
-        return self.http_client.get(self.url(f"/order/{hash}"), self.headers())
+        return self.http_get(self.url(f"/order/{hash}"), self.headers())
+
+    @instrumented("api.http_get")
+    def http_get(self, url: str, headers: Dict[str, str]) -> Any:
+        """Sends GET request through the configured connector"""
+        return self.http_client.get(url, headers=headers)
+
+    @instrumented("api.http_post")
+    def http_post(self, url: str, data: Dict[str, Any], headers: Dict[str, str]) -> Any:
+        """Sends POST request through the configured connector"""
+        return self.http_client.post(url, data, headers=headers)
 
     def url(self, path: str, params: Optional[Dict[str, str]] = None):
         if params:
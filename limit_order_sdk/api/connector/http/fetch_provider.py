@@ -1,4 +1,3 @@
-import requests
 from typing import Any, Dict
 from limit_order_sdk.api.connector.http import HttpProviderConnector
 from limit_order_sdk.api.errors import AuthError
@@ -13,6 +12,8 @@ class FetchProviderConnector(HttpProviderConnector):
             AuthError: If the response has a status code of 401.
             Exception: For other unsuccessful status codes.
         """
+        import requests
+
         response = requests.get(url, headers=headers)
         if response.status_code == 401:
             raise AuthError("Authorization failed")
@@ -27,6 +28,8 @@ class FetchProviderConnector(HttpProviderConnector):
             AuthError: If the response has a status code of 401.
             Exception: For other unsuccessful status codes.
         """
+        import requests
+
         headers.update({"Content-Type": "application/json"})
         response = requests.post(url, json=data, headers=headers)
         if response.status_code == 401:
@@ -0,0 +1,82 @@
+import threading
+from types import MappingProxyType
+from typing import Dict, Union
+
+from limit_order_sdk.constants import get_limit_order_contract
+from limit_order_sdk.libs.byte_utils import add_0x
+
+
+class ChainContext:
+    """
+    Everything chain-specific the SDK needs to hash and sign orders and to call the limit order contract,
+    computed once per chain. Contexts are immutable and shared, get them with `get_chain_context`.
+
+    APIs taking a `chain_id` also accept a ChainContext, which skips the per-call domain lookup.
+
+    Attributes:
+        chain_id (int): Chain id.
+        verifying_contract (str): Limit order contract address, the EIP-712 verifying contract and the target of contract calls.
+        domain (Mapping[str, Union[str, int]]): Read-only EIP-712 domain of limit orders, as used in typed data.
+        domain_separator (bytes): 32 bytes of the EIP-712 domain separator, same as `DOMAIN_SEPARATOR()` of the contract.
+    """
+
+    __slots__ = ("chain_id", "verifying_contract", "domain", "domain_separator", "_digest_prefix")
+
+    def __init__(self, chain_id: int):
+        # Imported here, `limit_order` modules import this one
+        from limit_order_sdk.limit_order.eip712 import LimitOrderV4TypeDataName, LimitOrderV4TypeDataVersion, hash_domain
+
+        verifying_contract = get_limit_order_contract(chain_id)
+        domain_separator = hash_domain(LimitOrderV4TypeDataName, LimitOrderV4TypeDataVersion, chain_id, verifying_contract)
+        object.__setattr__(self, "chain_id", chain_id)
+        object.__setattr__(self, "verifying_contract", verifying_contract)
+        object.__setattr__(self, "domain", MappingProxyType({"name": LimitOrderV4TypeDataName, "version": LimitOrderV4TypeDataVersion, "chainId": chain_id, "verifyingContract": verifying_contract}))
+        object.__setattr__(self, "domain_separator", domain_separator)
+        object.__setattr__(self, "_digest_prefix", b"\x19\x01" + domain_separator)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ChainContext is immutable")
+
+    def __repr__(self) -> str:
+        return f"ChainContext({self.chain_id})"
+
+    def domain_dict(self) -> Dict[str, Union[str, int]]:
+        """Returns a new dict of the EIP-712 domain, e.g. for `encode_typed_data`."""
+        return dict(self.domain)
+
+    def domain_separator_hex(self) -> str:
+        return add_0x(self.domain_separator.hex())
+
+    def digest(self, struct_hash: bytes) -> bytes:
+        """
+        Returns the EIP-712 digest of a struct hash: keccak256(0x1901 ‖ domainSeparator ‖ structHash),
+        the value signed by the maker and the order hash of the contract.
+        """
+        from eth_utils import keccak
+
+        return keccak(self._digest_prefix + struct_hash)
+
+
+ChainLike = Union[int, ChainContext]
+
+_contexts: Dict[int, ChainContext] = {}
+_contexts_lock = threading.Lock()
+
+
+def get_chain_context(chain: ChainLike) -> ChainContext:
+    """
+    Returns the shared context of a chain, building it on first use. Thread-safe.
+
+    Args:
+        chain (ChainLike): Chain id or a context, which is returned as is.
+    """
+    if isinstance(chain, ChainContext):
+        return chain
+    context = _contexts.get(chain)
+    if context is not None:
+        return context
+    with _contexts_lock:
+        context = _contexts.get(chain)
+        if context is None:
+            context = _contexts[chain] = ChainContext(chain)
+        return context
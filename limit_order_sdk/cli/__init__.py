@@ -0,0 +1 @@
+from limit_order_sdk.cli.cli import main
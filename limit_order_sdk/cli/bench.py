@@ -0,0 +1,143 @@
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from limit_order_sdk.address import Address
+from limit_order_sdk.limit_order import Extension, ExtensionBuilder, Interaction, LimitOrder, MakerTraits, OrderInfoData, OrderSigner, TakerTraits
+from limit_order_sdk.limit_order_contract import LimitOrderContract
+from limit_order_sdk.rfq_order import RfqOrder
+
+
+class OrderKind:
+    LIMIT = "limit"
+    EXTENSION = "extension"
+    RFQ = "rfq"
+
+
+KINDS = (OrderKind.LIMIT, OrderKind.EXTENSION, OrderKind.RFQ)
+OPERATIONS = ("construct", "hash", "sign", "calldata", "extension_decode")
+
+SEED = 1337
+SIGNATURE = "0x" + "11" * 32 + "22" * 32 + "1b"
+
+
+@dataclass
+class BenchStats:
+    """
+    Timings of one operation over all orders of one kind, every order is processed once.
+
+    Attributes:
+        operation (str): One of `OPERATIONS`.
+        kind (str): One of `OrderKind`.
+        count (int): Number of orders.
+        total_s (float): Sum of per-order latencies.
+        p50_us, p90_us, p99_us, max_us (float): Per-order latency percentiles, in microseconds.
+    """
+
+    operation: str
+    kind: str
+    count: int
+    total_s: float
+    p50_us: float
+    p90_us: float
+    p99_us: float
+    max_us: float
+
+    @property
+    def orders_per_s(self) -> float:
+        return self.count / self.total_s if self.total_s else float("inf")
+
+
+def _random_address(rnd: random.Random) -> Address:
+    return Address.from_int(rnd.getrandbits(160))
+
+
+def _order_factories(kind: str, count: int, rnd: random.Random) -> List[Callable[[], LimitOrder]]:
+    # Inputs are generated up front and every order gets its own extension, so caches don't skew the timings
+    maker_asset, taker_asset = _random_address(rnd), _random_address(rnd)
+    factories: List[Callable[[], LimitOrder]] = []
+    for i in range(count):
+        info = OrderInfoData(maker_asset=maker_asset, taker_asset=taker_asset, making_amount=rnd.getrandbits(96), taking_amount=rnd.getrandbits(96), maker=_random_address(rnd))
+        expiration = 1_700_000_000 + rnd.getrandbits(24)
+        if kind == OrderKind.RFQ:
+            options = {"nonce": rnd.getrandbits(40), "expiration": expiration, "allowed_sender": _random_address(rnd)}
+            factories.append(lambda info=info, options=options: RfqOrder(info, options))
+        elif kind == OrderKind.EXTENSION:
+            extension = (
+                ExtensionBuilder()
+                .with_maker_permit(maker_asset, "0x" + rnd.randbytes(224).hex())
+                .with_post_interaction(Interaction(_random_address(rnd), "0x" + rnd.randbytes(64).hex()))
+                .with_custom_data("0x" + rnd.randbytes(32).hex())
+                .build()
+            )
+            traits = MakerTraits.default().allow_multiple_fills().with_expiration(expiration).enable_post_interaction()
+            factories.append(lambda info=info, traits=traits, extension=extension: LimitOrder(info, traits, extension))
+        else:
+            traits = MakerTraits.default().allow_multiple_fills().with_expiration(expiration)
+            factories.append(lambda info=info, traits=traits: LimitOrder(info, traits))
+    return factories
+
+
+def _operation_calls(operation: str, kind: str, count: int, chain_id: int, rnd: random.Random) -> List[Callable[[], object]]:
+    factories = _order_factories(kind, count, rnd)
+    if operation == "construct":
+        return factories
+
+    orders = [factory() for factory in factories]
+    if operation == "hash":
+        return [lambda order=order: order.get_order_hash(chain_id) for order in orders]
+    if operation == "sign":
+        signer = OrderSigner(rnd.randbytes(32))
+        return [lambda order=order: signer.sign(order, chain_id) for order in orders]
+    if operation == "calldata":
+        if kind == OrderKind.EXTENSION:
+            return [lambda order=order: LimitOrderContract.get_fill_order_args_calldata(order.build(), SIGNATURE, TakerTraits.default().set_extension(order.extension), order.making_amount) for order in orders]
+        return [lambda order=order: LimitOrderContract.get_fill_order_calldata(order.build(), SIGNATURE, TakerTraits.default(), order.making_amount) for order in orders]
+    if operation == "extension_decode":
+        return [lambda encoded=order.extension.encode(): Extension.decode(encoded) for order in orders]
+    raise ValueError(f"Unknown operation {operation}")
+
+
+def _percentile(sorted_ns: Sequence[int], fraction: float) -> float:
+    return sorted_ns[min(len(sorted_ns) - 1, int(fraction * len(sorted_ns)))] / 1000
+
+
+def measure(calls: Sequence[Callable[[], object]]) -> List[int]:
+    """Calls every callable once and returns their latencies in nanoseconds."""
+    clock = time.perf_counter_ns
+    latencies = []
+    for call in calls:
+        start = clock()
+        call()
+        latencies.append(clock() - start)
+    return latencies
+
+
+def run_bench(count: int = 1000, operations: Sequence[str] = OPERATIONS, kinds: Sequence[str] = KINDS, chain_id: int = 1, seed: int = SEED) -> List[BenchStats]:
+    """
+    Benchmarks `operations` on `count` synthetic orders of every kind in `kinds`.
+    `extension_decode` only runs for orders with extensions.
+    """
+    assert count > 0, "count must be positive"
+    results: List[BenchStats] = []
+    for operation in operations:
+        for kind in kinds:
+            if operation == "extension_decode" and kind != OrderKind.EXTENSION:
+                continue
+            # Warm up lazy imports and per-process caches outside of the measurement
+            measure(_operation_calls(operation, kind, 2, chain_id, random.Random(seed - 1)))
+            latencies = sorted(measure(_operation_calls(operation, kind, count, chain_id, random.Random(seed))))
+            results.append(BenchStats(operation, kind, count, sum(latencies) / 1e9, _percentile(latencies, 0.5), _percentile(latencies, 0.9), _percentile(latencies, 0.99), latencies[-1] / 1000))
+    return results
+
+
+def format_stats(results: Sequence[BenchStats]) -> str:
+    header: Tuple[str, ...] = ("operation", "kind", "orders/s", "p50 us", "p90 us", "p99 us", "max us")
+    rows = [header] + [(r.operation, r.kind, f"{r.orders_per_s:.0f}", f"{r.p50_us:.1f}", f"{r.p90_us:.1f}", f"{r.p99_us:.1f}", f"{r.max_us:.1f}") for r in results]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return "\n".join("  ".join(cell.ljust(width) if i < 2 else cell.rjust(width) for i, (cell, width) in enumerate(zip(row, widths))) for row in rows)
+
+
+def stats_to_json(results: Sequence[BenchStats]) -> List[Dict[str, object]]:
+    return [{"operation": r.operation, "kind": r.kind, "count": r.count, "orders_per_s": r.orders_per_s, "p50_us": r.p50_us, "p90_us": r.p90_us, "p99_us": r.p99_us, "max_us": r.max_us} for r in results]
@@ -0,0 +1,90 @@
+"""
+Command line tools, run with `python -m limit_order_sdk`.
+
+    python -m limit_order_sdk validate orders.jsonl               # one JSON result per order to stdout
+    python -m limit_order_sdk hash --chain-id 137 - < orders.jsonl
+    python -m limit_order_sdk decode calldata.txt -o orders.jsonl --workers 4
+    python -m limit_order_sdk bench --count 2000 --operations hash calldata
+
+Input is one order per line: calldata hex or orderbook API JSON. A throughput summary is printed to stderr.
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import IO, List, Optional
+
+from limit_order_sdk.cli.bench import KINDS, OPERATIONS, format_stats, run_bench, stats_to_json
+from limit_order_sdk.cli.order_stream import INPUT_FORMATS, MODES, InputFormat, Mode, StreamSummary, stream_process
+
+
+def _open_input(path: str) -> IO[str]:
+    return sys.stdin if path == "-" else open(path, "r")
+
+
+def _open_output(path: str) -> IO[str]:
+    return sys.stdout if path == "-" else open(path, "w")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m limit_order_sdk", description="1inch limit order SDK tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    help_by_mode = {
+        Mode.VALIDATE: "check orders, and orderHash when present in the input",
+        Mode.HASH: "compute order hashes",
+        Mode.ENCODE: "re-encode orders as calldata and extension",
+        Mode.DECODE: "decode orders to orderbook API JSON",
+    }
+    for mode in MODES:
+        command = commands.add_parser(mode, help=help_by_mode[mode])
+        command.add_argument("input", nargs="?", default="-", help="input file, one order per line, `-` for stdin (default)")
+        command.add_argument("-o", "--output", default="-", help="output JSONL file, `-` for stdout (default)")
+        command.add_argument("--chain-id", type=int, default=1, help="chain of the order hashes (default: 1)")
+        command.add_argument("--input-format", choices=INPUT_FORMATS, default=InputFormat.AUTO, help="input line format (default: auto)")
+        command.add_argument("--workers", type=int, default=0, help="worker processes, 0 processes in the main process (default: 0)")
+        command.add_argument("--chunk-size", type=int, default=1000, help="lines per processed chunk (default: 1000)")
+
+    bench = commands.add_parser("bench", help="measure SDK throughput on synthetic orders")
+    bench.add_argument("--count", type=int, default=1000, help="orders per operation and kind (default: 1000)")
+    bench.add_argument("--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS), help="operations to measure (default: all)")
+    bench.add_argument("--kinds", nargs="+", choices=KINDS, default=list(KINDS), help="order kinds (default: all)")
+    bench.add_argument("--chain-id", type=int, default=1, help="chain of the order hashes and signatures (default: 1)")
+    bench.add_argument("--json", action="store_true", help="print results as JSON")
+    return parser
+
+
+def run_stream(args: argparse.Namespace) -> int:
+    summary = StreamSummary()
+    start = time.perf_counter()
+    source, target = _open_input(args.input), _open_output(args.output)
+    try:
+        for line in stream_process(args.command, source, args.chain_id, args.input_format, args.workers, args.chunk_size, summary):
+            target.write(line)
+            target.write("\n")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+        else:
+            target.flush()
+
+    elapsed = time.perf_counter() - start
+    rate = summary.orders / elapsed if elapsed > 0 else 0.0
+    print(f"{args.command}: {summary.orders} orders, {summary.errors} errors in {elapsed:.2f}s ({rate:.0f} orders/s)", file=sys.stderr)
+    return 1 if args.command == Mode.VALIDATE and summary.errors else 0
+
+
+def run_bench_command(args: argparse.Namespace) -> int:
+    results = run_bench(args.count, args.operations, args.kinds, args.chain_id)
+    print(json.dumps(stats_to_json(results), indent=2) if args.json else format_stats(results))
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "bench":
+        return run_bench_command(args)
+    return run_stream(args)
@@ -0,0 +1,194 @@
+import json
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from limit_order_sdk.address import ZERO_ADDRESS
+from limit_order_sdk.limit_order import LimitOrder, LimitOrderV4Struct, default_extension_cache
+from limit_order_sdk.order_batch.batch_validator import ValidationReason, describe_reasons, validate_orders
+
+
+class Mode:
+    VALIDATE = "validate"
+    HASH = "hash"
+    ENCODE = "encode"
+    DECODE = "decode"
+
+
+MODES = (Mode.VALIDATE, Mode.HASH, Mode.ENCODE, Mode.DECODE)
+
+
+class InputFormat:
+    AUTO = "auto"
+    JSON = "json"
+    CALLDATA = "calldata"
+
+
+INPUT_FORMATS = (InputFormat.AUTO, InputFormat.JSON, InputFormat.CALLDATA)
+
+
+@dataclass
+class ParsedOrder:
+    order: LimitOrder
+    signature: Optional[str] = None
+    order_hash: Optional[str] = None
+
+
+def _uint(value: Any) -> int:
+    if isinstance(value, int):
+        return value
+    return int(value, 16) if value.startswith("0x") else int(value)
+
+
+def parse_order_line(line: str, input_format: str = InputFormat.AUTO) -> ParsedOrder:
+    """
+    Parses an order from a single input line.
+
+    Args:
+        line (str): Order calldata hex (`LimitOrder.to_calldata`), or a JSON object shaped like the orderbook API
+            `{"orderHash": ..., "signature": ..., "data": {"salt": ..., "maker": ..., "extension": ..., ...}}` or like its `data` alone.
+        input_format (str): One of `InputFormat`, `auto` tells calldata from JSON by the first character.
+
+    Raises:
+        ValueError, KeyError, AssertionError, DecodingError: If the line is not a valid order.
+    """
+    text = line.strip()
+    if input_format == InputFormat.CALLDATA or (input_format == InputFormat.AUTO and not text.startswith("{")):
+        return ParsedOrder(LimitOrder.from_calldata(text))
+
+    obj = json.loads(text)
+    data = obj.get("data", obj)
+    struct = LimitOrderV4Struct(
+        salt=_uint(data["salt"]),
+        maker=data["maker"],
+        receiver=data.get("receiver") or str(ZERO_ADDRESS),
+        makerAsset=data["makerAsset"],
+        takerAsset=data["takerAsset"],
+        makingAmount=_uint(data["makingAmount"]),
+        takingAmount=_uint(data["takingAmount"]),
+        makerTraits=_uint(data.get("makerTraits", 0)),
+    )
+    extension = default_extension_cache.decode(data.get("extension") or "0x")
+    return ParsedOrder(LimitOrder.from_data_and_extension(struct, extension), obj.get("signature"), obj.get("orderHash"))
+
+
+def order_to_json(order: LimitOrder) -> Dict[str, str]:
+    """Returns the `data` object of the orderbook API, with numbers as decimal strings."""
+    struct = order.build()
+    return {
+        "salt": str(struct.salt),
+        "maker": struct.maker,
+        "receiver": struct.receiver,
+        "makerAsset": struct.makerAsset,
+        "takerAsset": struct.takerAsset,
+        "makingAmount": str(struct.makingAmount),
+        "takingAmount": str(struct.takingAmount),
+        "makerTraits": str(struct.makerTraits),
+        "extension": order.extension.encode(),
+    }
+
+
+def process_lines(mode: str, lines: List[str], first_line: int, chain_id: int, input_format: str = InputFormat.AUTO) -> Tuple[List[str], int]:
+    """
+    Processes a chunk of input lines.
+
+    Returns:
+        Tuple[List[str], int]: One JSON output line per non-empty input line and the number of lines with `error`.
+            Every output object has the 1-based input `line`.
+            In validate mode parsed orders are also checked with `validate_orders`, which doesn't rely on `assert`
+            and so still applies under `python -O`. Expiration is not checked.
+    """
+    from eth_abi.exceptions import DecodingError
+
+    parsed: List[Tuple[int, Optional[ParsedOrder], Optional[str]]] = []
+    for line_number, line in enumerate(lines, first_line):
+        if not line.strip():
+            continue
+        try:
+            parsed.append((line_number, parse_order_line(line, input_format), None))
+        except (AssertionError, ValueError, KeyError, TypeError, AttributeError, DecodingError) as e:
+            parsed.append((line_number, None, f"{type(e).__name__}: {e}"))
+
+    hashes: Dict[int, str] = {}
+    codes: Dict[int, int] = {}
+    if mode != Mode.ENCODE:
+        valid = [(line_number, item.order) for line_number, item, _ in parsed if item is not None]
+        hashes = dict(zip((line_number for line_number, _ in valid), LimitOrder.get_order_hashes([order for _, order in valid], chain_id)))
+        if mode == Mode.VALIDATE:
+            codes = dict(zip((line_number for line_number, _ in valid), validate_orders(order for _, order in valid)))
+
+    output: List[str] = []
+    errors = 0
+    for line_number, item, error in parsed:
+        result: Dict[str, Any] = {"line": line_number}
+        if item is not None and mode == Mode.VALIDATE:
+            code = codes[line_number] & ~ValidationReason.EXPIRED
+            if code:
+                error = "invalid order: " + ", ".join(describe_reasons(code))
+            elif item.order_hash is not None and item.order_hash.lower() != hashes[line_number]:
+                error = f"orderHash mismatch: expected {hashes[line_number]}"
+        if error is not None:
+            if mode == Mode.VALIDATE:
+                result["valid"] = False
+            result["error"] = error
+            errors += 1
+        elif mode == Mode.VALIDATE:
+            result.update(valid=True, orderHash=hashes[line_number])
+        elif mode == Mode.HASH:
+            result.update(orderHash=hashes[line_number])
+        elif mode == Mode.ENCODE:
+            result.update(calldata=item.order.to_calldata(), extension=item.order.extension.encode())
+        else:
+            result.update(orderHash=hashes[line_number], signature=item.signature, data=order_to_json(item.order))
+        output.append(json.dumps(result, separators=(",", ":")))
+    return output, errors
+
+
+@dataclass
+class StreamSummary:
+    lines: int = 0
+    orders: int = 0
+    errors: int = 0
+
+
+def stream_process(
+    mode: str, lines: Iterable[str], chain_id: int, input_format: str = InputFormat.AUTO, workers: int = 0, chunk_size: int = 1000, summary: Optional[StreamSummary] = None
+) -> Iterator[str]:
+    """
+    Lazily processes `lines` in chunks of `chunk_size`, in order. Memory is bounded by the chunks in flight,
+    with `workers` > 0 chunks are processed by a process pool, at most two per worker at once.
+    """
+    summary = summary if summary is not None else StreamSummary()
+    lines = iter(lines)
+    first_line = 1
+
+    def account(chunk: Tuple[List[str], int]) -> List[str]:
+        output, errors = chunk
+        summary.orders += len(output) - errors
+        summary.errors += errors
+        return output
+
+    if workers <= 0:
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                return
+            summary.lines += len(chunk)
+            yield from account(process_lines(mode, chunk, first_line, chain_id, input_format))
+            first_line += len(chunk)
+
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                break
+            summary.lines += len(chunk)
+            pending.append(executor.submit(process_lines, mode, chunk, first_line, chain_id, input_format))
+            first_line += len(chunk)
+            if len(pending) >= 2 * workers:
+                yield from account(pending.popleft().result())
+        while pending:
+            yield from account(pending.popleft().result())
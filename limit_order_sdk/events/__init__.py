@@ -0,0 +1 @@
+from limit_order_sdk.events.event_decoder import *
@@ -0,0 +1,155 @@
+import json
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, Mapping, NamedTuple, Optional, Tuple, Union
+
+from limit_order_sdk.libs.byte_utils import trim_0x
+
+# keccak256 of the event signatures, topic0 of their logs
+ORDER_FILLED_TOPIC = "0xfec331350fce78ba658e082a71da20ac9f8d798a99b3c79681c8440cbfe77e07"  # OrderFilled(bytes32,uint256)
+ORDER_CANCELLED_TOPIC = "0x5152abf959f6564662358c2e52b702259b78bac5ee7842a0f01937e670efcc7d"  # OrderCancelled(bytes32)
+BIT_INVALIDATOR_UPDATED_TOPIC = "0xcda0f7e73d07bdb14b141f2cf4745926629a1b63e7c6a3dd8a80232cb459a850"  # BitInvalidatorUpdated(address,uint256,uint256)
+EPOCH_INCREASED_TOPIC = "0x099133aefc2c2d1e56f8ef3622ec8e80979a0713fc9c4e1497740efcf8099396"  # EpochIncreased(address,uint256,uint256)
+
+
+class OrderFilledEvent(NamedTuple):
+    order_hash: str
+    remaining_amount: int
+    block_number: int
+    log_index: int
+
+
+class OrderCancelledEvent(NamedTuple):
+    order_hash: str
+    block_number: int
+    log_index: int
+
+
+class BitInvalidatorUpdatedEvent(NamedTuple):
+    maker: str
+    slot_index: int
+    slot_value: int
+    block_number: int
+    log_index: int
+
+
+class EpochIncreasedEvent(NamedTuple):
+    maker: str
+    series: int
+    new_epoch: int
+    block_number: int
+    log_index: int
+
+
+LimitOrderEvent = Union[OrderFilledEvent, OrderCancelledEvent, BitInvalidatorUpdatedEvent, EpochIncreasedEvent]
+
+
+def _hex(value: Union[str, bytes]) -> str:
+    # Lowercase hex without 0x prefix, logs from JSON-RPC carry strings and web3 logs carry bytes
+    # `bytes.hex` is called directly, `HexBytes.hex` adds a 0x prefix in some versions
+    return bytes.hex(value) if isinstance(value, (bytes, bytearray)) else trim_0x(value).lower()
+
+
+def _int(value: Union[str, int, None]) -> int:
+    if value is None:
+        return 0
+    return value if isinstance(value, int) else int(value, 16)
+
+
+def _word(data: str, index: int) -> int:
+    return int(data[64 * index : 64 * (index + 1)], 16)
+
+
+def _address_topic(topic: Union[str, bytes]) -> str:
+    return "0x" + _hex(topic)[-40:]
+
+
+def _order_filled(topics: list, data: str, block_number: int, log_index: int) -> OrderFilledEvent:
+    return OrderFilledEvent("0x" + data[:64], _word(data, 1), block_number, log_index)
+
+
+def _order_cancelled(topics: list, data: str, block_number: int, log_index: int) -> OrderCancelledEvent:
+    return OrderCancelledEvent("0x" + data[:64], block_number, log_index)
+
+
+def _bit_invalidator_updated(topics: list, data: str, block_number: int, log_index: int) -> BitInvalidatorUpdatedEvent:
+    return BitInvalidatorUpdatedEvent(_address_topic(topics[1]), _word(data, 0), _word(data, 1), block_number, log_index)
+
+
+def _epoch_increased(topics: list, data: str, block_number: int, log_index: int) -> EpochIncreasedEvent:
+    return EpochIncreasedEvent(_address_topic(topics[1]), _word(data, 0), _word(data, 1), block_number, log_index)
+
+
+# topic0 => (decoder, number of topics, number of data words)
+_DECODERS: Dict[str, Tuple[Callable[[list, str, int, int], LimitOrderEvent], int, int]] = {
+    trim_0x(ORDER_FILLED_TOPIC): (_order_filled, 1, 2),
+    trim_0x(ORDER_CANCELLED_TOPIC): (_order_cancelled, 1, 1),
+    trim_0x(BIT_INVALIDATOR_UPDATED_TOPIC): (_bit_invalidator_updated, 2, 2),
+    trim_0x(EPOCH_INCREASED_TOPIC): (_epoch_increased, 2, 2),
+}
+
+
+def decode_log(log: Mapping[str, Any]) -> Optional[LimitOrderEvent]:
+    """
+    Decodes a limit order protocol event from a log, either a JSON-RPC log dict with hex strings or a web3 log with bytes.
+
+    Args:
+        log (Mapping[str, Any]): Log with `topics` and `data`, `blockNumber` and `logIndex` are optional.
+
+    Returns:
+        Optional[LimitOrderEvent]: Decoded event or None if the log is not one of the supported events.
+
+    Raises:
+        ValueError: If a supported event has unexpected topics or data length.
+    """
+    topics = log.get("topics")
+    if not topics:
+        return None
+    entry = _DECODERS.get(_hex(topics[0]))
+    if entry is None:
+        return None
+
+    decoder, topics_count, words_count = entry
+    data = _hex(log.get("data") or "0x")
+    if len(topics) != topics_count or len(data) != 64 * words_count:
+        raise ValueError(f"Malformed {decoder.__name__.strip('_')} log: {len(topics)} topics, {len(data) // 2} bytes of data")
+    return decoder(topics, data, _int(log.get("blockNumber")), _int(log.get("logIndex")))
+
+
+def decode_logs(logs: Iterable[Mapping[str, Any]], address: Optional[str] = None) -> Iterator[LimitOrderEvent]:
+    """
+    Lazily decodes supported events from `logs`, skipping other logs and logs removed by reorgs.
+
+    Args:
+        logs (Iterable[Mapping[str, Any]]): Logs as returned by `eth_getLogs` or web3.
+        address (Optional[str]): If set, only logs emitted by this contract are decoded.
+    """
+    address = address.lower() if address is not None else None
+    for log in logs:
+        if log.get("removed"):
+            continue
+        if address is not None and str(log.get("address", "")).lower() != address:
+            continue
+        event = decode_log(log)
+        if event is not None:
+            yield event
+
+
+def read_jsonl_logs(source: Union[str, IO[str]]) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily reads logs from a JSONL dump, one log object per line.
+
+    Args:
+        source (Union[str, IO[str]]): Path of the dump or an open text file.
+    """
+    if isinstance(source, str):
+        with open(source, "r") as f:
+            yield from read_jsonl_logs(f)
+        return
+
+    for line in source:
+        if line.strip():
+            yield json.loads(line)
+
+
+def decode_jsonl_logs(source: Union[str, IO[str]], address: Optional[str] = None) -> Iterator[LimitOrderEvent]:
+    """Same as `decode_logs` over the logs of a JSONL dump."""
+    return decode_logs(read_jsonl_logs(source), address)
@@ -0,0 +1 @@
+from limit_order_sdk.expiry.expiry_scheduler import ExpiryScheduler
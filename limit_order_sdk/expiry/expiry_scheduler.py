@@ -0,0 +1,141 @@
+import heapq
+import logging
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from limit_order_sdk.limit_order import LimitOrder
+
+ExpireCallback = Callable[[Hashable, LimitOrder], None]
+
+logger = logging.getLogger(__name__)
+
+
+class ExpiryScheduler:
+    """
+    Tracks order expirations (`MakerTraits.expiration()`) in a min-heap and evicts expired orders.
+
+    An order store registers its orders under any hashable key (usually the order hash) and gets
+    `on_expire(key, order)` called for every order once it expires, either from an explicit `sweep()`
+    or from a background thread started with `start()`. Orders without expiration are never scheduled.
+
+    Registration and eviction are O(log n). Unregistered orders are removed from the heap lazily,
+    the heap is compacted once stale entries outnumber live ones.
+
+    Example:
+        scheduler = ExpiryScheduler(on_expire=lambda key, order: book.pop(key))
+        scheduler.register(order_hash, order)
+        scheduler.start(interval=1)
+    """
+
+    def __init__(self, on_expire: Optional[ExpireCallback] = None, clock: Callable[[], float] = time.time):
+        self.on_expire = on_expire
+        self.clock = clock
+        self._lock = threading.RLock()
+        self._heap: List[Tuple[int, int, Hashable]] = []
+        # key => (expiration, sequence, order); heap entries not matching this are stale
+        self._entries: Dict[Hashable, Tuple[int, int, LimitOrder]] = {}
+        self._sequence = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def register(self, key: Hashable, order: LimitOrder) -> bool:
+        """
+        Schedules eviction of `order` at its expiration, replacing an order previously registered under `key`.
+
+        Returns:
+            bool: True if the order was scheduled, False if it has no expiration.
+        """
+        expiration = order.maker_traits.expiration()
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._maybe_compact()
+            if expiration is None:
+                return False
+
+            self._sequence += 1
+            self._entries[key] = (expiration, self._sequence, order)
+            heapq.heappush(self._heap, (expiration, self._sequence, key))
+            return True
+
+    def unregister(self, key: Hashable) -> Optional[LimitOrder]:
+        """Stops tracking order registered under `key` and returns it, if any."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            self._maybe_compact()
+            return None if entry is None else entry[2]
+
+    def next_expiration(self) -> Optional[int]:
+        """Returns the earliest expiration among registered orders or None if there are none."""
+        with self._lock:
+            self._drop_stale_head()
+            return self._heap[0][0] if self._heap else None
+
+    def sweep(self, now: Optional[float] = None) -> List[Hashable]:
+        """
+        Evicts orders expired at `now` (the current clock time by default) and calls `on_expire` for each of them.
+        Like the protocol, an order is expired once its expiration is less than the current timestamp.
+        An exception raised by `on_expire` is logged and doesn't stop the eviction of the other orders.
+
+        Returns:
+            List[Hashable]: Keys of the evicted orders, earliest expiration first.
+        """
+        now = self.clock() if now is None else now
+        expired: List[Tuple[Hashable, LimitOrder]] = []
+        with self._lock:
+            while self._heap and self._heap[0][0] < now:
+                _, sequence, key = heapq.heappop(self._heap)
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] == sequence:
+                    del self._entries[key]
+                    expired.append((key, entry[2]))
+
+        # Callbacks run outside of the lock, so they are free to register or unregister orders
+        if self.on_expire is not None:
+            for key, order in expired:
+                try:
+                    self.on_expire(key, order)
+                except Exception:
+                    # Also keeps the background thread of `start()` alive
+                    logger.exception("on_expire failed for order %r", key)
+        return [key for key, _ in expired]
+
+    def start(self, interval: float = 1.0) -> None:
+        """Starts a daemon thread calling `sweep()` every `interval` seconds."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, args=(interval,), name="order-expiry-sweeper", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background thread started by `start()`."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.sweep()
+
+    def _drop_stale_head(self) -> None:
+        while self._heap:
+            _, sequence, key = self._heap[0]
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == sequence:
+                return
+            heapq.heappop(self._heap)
+
+    def _maybe_compact(self) -> None:
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(expiration, sequence, key) for key, (expiration, sequence, _) in self._entries.items()]
+            heapq.heapify(self._heap)
@@ -0,0 +1 @@
+from limit_order_sdk.fill_simulator.fill_simulator import FillSimulator, FillPlan, OrderFill
@@ -0,0 +1,154 @@
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import List, Optional, Sequence
+
+from limit_order_sdk.constants import ZX
+from limit_order_sdk.limit_order import LimitOrder, TakerTraits
+from limit_order_sdk.limit_order.amounts import calc_making_amount, calc_taking_amount
+from limit_order_sdk.limit_order.taker_traits import AmountMode
+from limit_order_sdk.metrics.instrumented import instrumented
+
+
+@dataclass
+class OrderFill:
+    """
+    Single fill of a plan.
+
+    Attributes:
+        index (int): Index of the order in the simulator order set.
+        order (LimitOrder): Filled order.
+        making_amount (int): Maker asset amount the taker receives.
+        taking_amount (int): Taker asset amount the taker pays.
+        amount (int): `amount` argument of the fill call, in units of the plan amount mode.
+        threshold (int): Amount threshold of the fill: minimal making amount in taker mode, maximal taking amount in maker mode.
+    """
+
+    index: int
+    order: LimitOrder
+    making_amount: int
+    taking_amount: int
+    amount: int
+    threshold: int
+    amount_mode: str = AmountMode.TAKER
+
+    def taker_traits(self) -> TakerTraits:
+        """Returns taker traits for the fill call, with amount mode and threshold set."""
+        return TakerTraits.default().set_amount_mode(self.amount_mode).set_amount_threshold(self.threshold)
+
+
+@dataclass
+class FillPlan:
+    """
+    Result of `FillSimulator.simulate`.
+
+    Attributes:
+        fills (List[OrderFill]): Fills in execution order, best rate first.
+        making_amount (int): Total maker asset amount the taker receives.
+        taking_amount (int): Total taker asset amount the taker pays.
+        unfilled_amount (int): Part of the requested amount the order set could not fill.
+    """
+
+    fills: List[OrderFill] = field(default_factory=list)
+    making_amount: int = 0
+    taking_amount: int = 0
+    unfilled_amount: int = 0
+
+
+class FillSimulator:
+    """
+    Splits a swap amount across orders of a single pair the way the limit order protocol would fill them.
+
+    Orders are sorted by rate once, best (most maker asset per taker asset) first, and every `simulate` call walks them
+    only until the amount is exhausted. Amounts follow the protocol rounding of `calc_making_amount`/`calc_taking_amount`,
+    orders without partial fills are only used whole and only while unfilled.
+
+    Orders with custom amount getters (`making_amount_data`/`taking_amount_data` in the extension) are skipped, their rates
+    are computed on-chain. Validity of orders (expiration, allowed sender, predicates) is not checked, filter them before,
+    e.g. with `OrderBatch` and `PredicateEvaluator`.
+
+    Example:
+        simulator = FillSimulator(orders, remaining_making_amounts)
+        plan = simulator.simulate(1000 * 10**6)
+        for fill in plan.fills:
+            LimitOrderContract.get_fill_order_calldata(fill.order.build(), signatures[fill.index], fill.taker_traits(), fill.amount)
+    """
+
+    def __init__(self, orders: Sequence[LimitOrder], remaining_making_amounts: Optional[Sequence[Optional[int]]] = None):
+        """
+        Args:
+            orders (Sequence[LimitOrder]): Orders selling the same maker asset for the same taker asset.
+            remaining_making_amounts (Optional[Sequence[Optional[int]]]): Remaining making amount of every order,
+                None for an unfilled order. All orders are unfilled if not set.
+        """
+        assert remaining_making_amounts is None or len(remaining_making_amounts) == len(orders), "orders/remaining_making_amounts length mismatch"
+        if orders:
+            assert all(order.maker_asset == orders[0].maker_asset and order.taker_asset == orders[0].taker_asset for order in orders), "All orders must be for the same pair"
+
+        self.orders = list(orders)
+        self.remaining: List[int] = [order.making_amount if remaining_making_amounts is None or remaining_making_amounts[i] is None else remaining_making_amounts[i] for i, order in enumerate(self.orders)]
+
+        # Exact rate comparison, ties keep the original order
+        self._sorted = sorted((i for i, order in enumerate(self.orders) if self._is_supported(order)), key=lambda i: Fraction(self.orders[i].taking_amount, self.orders[i].making_amount))
+        self._making = [self.orders[i].making_amount for i in self._sorted]
+        self._taking = [self.orders[i].taking_amount for i in self._sorted]
+        self._partial = [self.orders[i].maker_traits.is_partial_fill_allowed() for i in self._sorted]
+
+    @staticmethod
+    def _is_supported(order: LimitOrder) -> bool:
+        extension = order.extension
+        return order.making_amount > 0 and order.taking_amount > 0 and extension.making_amount_data == ZX and extension.taking_amount_data == ZX
+
+    def set_remaining(self, index: int, remaining_making_amount: int) -> None:
+        """Updates remaining making amount of order `index`, e.g. after a fill."""
+        self.remaining[index] = remaining_making_amount
+
+    @instrumented("fill_simulator.simulate")
+    def simulate(self, amount: int, amount_mode: str = AmountMode.TAKER) -> FillPlan:
+        """
+        Returns the plan filling `amount` with the best orders.
+
+        Args:
+            amount (int): Taker asset amount to spend in `AmountMode.TAKER`, maker asset amount to receive in `AmountMode.MAKER`.
+            amount_mode (str): `AmountMode.TAKER` or `AmountMode.MAKER`.
+        """
+        assert amount >= 0, "amount must be non-negative"
+        is_taker_mode = amount_mode == AmountMode.TAKER
+        plan = FillPlan()
+        left = amount
+        remaining = self.remaining
+
+        for position, index in enumerate(self._sorted):
+            if left == 0:
+                break
+
+            order_making, order_taking = self._making[position], self._taking[position]
+            order_remaining = remaining[index]
+            if order_remaining <= 0:
+                continue
+            if not self._partial[position] and order_remaining != order_making:
+                continue  # partially filled order without partial fills can't be filled anymore
+
+            if is_taker_mode:
+                # Same as the protocol for `amount` of taking: making is floored, then capped by the remaining amount
+                full_taking = calc_taking_amount(order_remaining, order_making, order_taking)
+                if left >= full_taking:
+                    making, taking = order_remaining, full_taking
+                else:
+                    making, taking = calc_making_amount(left, order_making, order_taking), left
+            else:
+                making = min(left, order_remaining)
+                taking = calc_taking_amount(making, order_making, order_taking)
+
+            if making == 0 or taking == 0:
+                continue
+            if not self._partial[position] and making != order_making:
+                continue
+
+            fill_amount, threshold, used = (taking, making, taking) if is_taker_mode else (making, taking, making)
+            plan.fills.append(OrderFill(index, self.orders[index], making, taking, fill_amount, threshold, amount_mode))
+            plan.making_amount += making
+            plan.taking_amount += taking
+            left -= used
+
+        plan.unfilled_amount = left
+        return plan
@@ -0,0 +1 @@
+from limit_order_sdk.ingest.ingest_pipeline import IngestPipeline, IngestedOrder, OrderValidator
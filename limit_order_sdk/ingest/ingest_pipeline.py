@@ -0,0 +1,219 @@
+import os
+import struct
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from limit_order_sdk.libs.byte_utils import add_0x
+from limit_order_sdk.limit_order import LimitOrder
+from limit_order_sdk.order_archive.record import decode_order_record
+
+# Orders travel between processes as batches of records in shared memory, only the segment name is pickled:
+#
+#     | count, uint64 | record offsets, (count + 1) * uint64 | records | results, count * (status, uint8 | order hash, 32 bytes) |
+#
+# Records use the compact layout of `encode_order_record`, numbers use the native byte order.
+# The main process writes the records, a worker decodes, validates and hashes them and writes the results.
+
+WORD = 8
+RESULT_SIZE = 33
+STATUS_VALID = 0
+STATUS_INVALID = 1
+
+# Returns None for a valid order or the reason it is rejected, must be picklable (a module-level function)
+OrderValidator = Callable[[LimitOrder], Optional[str]]
+
+
+class IngestedOrder(NamedTuple):
+    """
+    Result of a single input record.
+
+    Attributes:
+        record (bytes): The input record, e.g. for `OrderArchiveWriter.append_record`.
+        order_hash (Optional[str]): Order hash, None for an invalid record.
+        error (Optional[str]): Reason the record is invalid, None for a valid one.
+    """
+
+    record: bytes
+    order_hash: Optional[str]
+    error: Optional[str]
+
+
+def _write_batch(records: List[bytes]) -> SharedMemory:
+    count = len(records)
+    data_size = sum(len(record) for record in records)
+    data_start = WORD * (count + 2)
+    shm = SharedMemory(create=True, size=data_start + data_size + RESULT_SIZE * count)
+
+    header = shm.buf[:data_start].cast("Q")
+    header[0] = count
+    pos = data_start
+    for i, record in enumerate(records):
+        header[i + 1] = pos
+        shm.buf[pos : pos + len(record)] = record
+        pos += len(record)
+    header[count + 1] = pos
+    header.release()
+    return shm
+
+
+def _process_batch(name: str, chain_id: int, validator: Optional[OrderValidator]) -> Dict[int, str]:
+    # Worker side: decode → validate → hash, returns errors of invalid records by index
+    shm = SharedMemory(name=name)
+    buf = shm.buf
+    try:
+        (count,) = buf[:WORD].cast("Q")
+        header = buf[: WORD * (count + 2)].cast("Q")
+        offsets = header.tolist()[1:]
+        header.release()
+
+        errors: Dict[int, str] = {}
+        orders: List[LimitOrder] = []
+        indices: List[int] = []
+        for i in range(count):
+            try:
+                record, end = decode_order_record(buf, offsets[i])
+                if end != offsets[i + 1]:
+                    raise ValueError(f"Malformed record: {offsets[i + 1] - offsets[i]} bytes, {end - offsets[i]} decoded")
+                error = validator(record.order) if validator is not None else None
+            except (AssertionError, ValueError, struct.error) as e:
+                error = str(e) or type(e).__name__
+            if error is None:
+                orders.append(record.order)
+                indices.append(i)
+            else:
+                errors[i] = error
+
+        results_start = offsets[count]
+        for i in errors:
+            buf[results_start + i * RESULT_SIZE] = STATUS_INVALID
+        for i, order_hash in zip(indices, LimitOrder.get_order_hashes(orders, chain_id)):
+            pos = results_start + i * RESULT_SIZE
+            buf[pos] = STATUS_VALID
+            buf[pos + 1 : pos + RESULT_SIZE] = bytes.fromhex(order_hash[2:])
+        return errors
+    finally:
+        # The segment can't be closed while a view of it is alive
+        del buf
+        shm.close()
+
+
+def _read_batch(shm: SharedMemory, errors: Dict[int, str]) -> List[IngestedOrder]:
+    buf = shm.buf
+    (count,) = buf[:WORD].cast("Q")
+    header = buf[: WORD * (count + 2)].cast("Q")
+    offsets = header.tolist()[1:]
+    header.release()
+
+    results_start = offsets[count]
+    data = bytes(buf[offsets[0] : results_start + RESULT_SIZE * count])
+    del buf
+    base = offsets[0]
+    results_base = results_start - base
+
+    batch: List[IngestedOrder] = []
+    for i in range(count):
+        record = data[offsets[i] - base : offsets[i + 1] - base]
+        pos = results_base + i * RESULT_SIZE
+        if data[pos] == STATUS_VALID:
+            batch.append(IngestedOrder(record, add_0x(data[pos + 1 : pos + RESULT_SIZE].hex()), None))
+        else:
+            batch.append(IngestedOrder(record, None, errors.get(i, "invalid order")))
+    return batch
+
+
+class IngestPipeline:
+    """
+    Runs the decode → validate → hash stages of order ingest on a process pool and returns the results in input order,
+    so the index stage (e.g. `OrderArchiveWriter.append_record`) stays single-threaded in the calling process.
+
+    Input records are grouped into batches and every batch is passed to a worker in a shared memory segment,
+    `LimitOrder` objects are never pickled. At most `max_in_flight` batches are queued or processed at once:
+    input is not read further until the oldest batch is consumed.
+
+    Example:
+        with IngestPipeline(chain_id=1) as pipeline, OrderArchiveWriter("orders.bin", chain_id=1) as writer:
+            for result in pipeline.run(encode_order_record(order, signature) for order, signature in source):
+                if result.error is None:
+                    writer.append_record(result.record, result.order_hash)
+    """
+
+    def __init__(self, chain_id: int, workers: Optional[int] = None, batch_size: int = 2048, max_in_flight: Optional[int] = None, validator: Optional[OrderValidator] = None):
+        """
+        Args:
+            chain_id (int): Chain to compute order hashes for.
+            workers (Optional[int]): Number of worker processes, CPU count if not set. 0 runs the stages in the calling process.
+            batch_size (int): Records per batch.
+            max_in_flight (Optional[int]): Maximum number of batches in flight, twice the number of workers if not set.
+            validator (Optional[OrderValidator]): Extra validation of decoded orders. Records that fail to decode are always invalid.
+        """
+        assert batch_size > 0, "batch_size must be positive"
+        self.chain_id = chain_id
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight or 2 * max(self.workers, 1)
+        self.validator = validator
+        self._executor: Optional[Executor] = None
+
+    def _submit(self, shm: SharedMemory) -> Future:
+        if self.workers == 0:
+            future: Future = Future()
+            future.set_result(_process_batch(shm.name, self.chain_id, self.validator))
+            return future
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor.submit(_process_batch, shm.name, self.chain_id, self.validator)
+
+    def run(self, records: Iterable[bytes]) -> Iterator[IngestedOrder]:
+        """
+        Lazily processes `records`, encoded with `encode_order_record`, yielding one result per record in input order.
+        """
+        pending: Deque[Tuple[SharedMemory, Future]] = deque()
+        records = iter(records)
+        try:
+            while True:
+                batch = list(islice(records, self.batch_size))
+                if not batch:
+                    break
+                shm = _write_batch(batch)
+                try:
+                    future = self._submit(shm)
+                except BaseException:
+                    # With workers=0 the batch is processed by _submit, not yet pending
+                    shm.close()
+                    shm.unlink()
+                    raise
+                pending.append((shm, future))
+                # Backpressure: wait for the oldest batch before reading more input
+                while len(pending) >= self.max_in_flight:
+                    yield from self._collect(*pending.popleft())
+            while pending:
+                yield from self._collect(*pending.popleft())
+        finally:
+            # Only reached when the consumer stops early or a batch fails
+            for shm, future in pending:
+                if not future.cancel():
+                    future.exception()  # wait until the worker is done with the segment
+                shm.close()
+                shm.unlink()
+
+    @staticmethod
+    def _collect(shm: SharedMemory, future: Future) -> List[IngestedOrder]:
+        try:
+            return _read_batch(shm, future.result())
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "IngestPipeline":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
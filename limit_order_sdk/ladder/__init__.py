@@ -0,0 +1 @@
+from limit_order_sdk.ladder.ladder_manager import LadderLevel, LadderManager, LadderRefresh, LadderStats
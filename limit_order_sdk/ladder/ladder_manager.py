@@ -0,0 +1,175 @@
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+from limit_order_sdk.limit_order_contract.cancel_calls import CancelCall, build_cancel_calls
+from limit_order_sdk.metrics.instrumented import instrumented
+from limit_order_sdk.rfq_order.rfq_quoter import RfqPair, RfqQuote, RfqQuoter
+
+
+@dataclass(frozen=True)
+class LadderLevel:
+    """
+    Single level of a quote ladder. Levels with the same amounts are the same level, whatever their position in the ladder.
+
+    Attributes:
+        making_amount (int): Amount of the maker asset offered at the level.
+        taking_amount (int): Amount of the taker asset asked for it.
+    """
+
+    making_amount: int
+    taking_amount: int
+
+
+@dataclass
+class LadderRefresh:
+    """
+    Work done by a single `LadderManager.refresh`.
+
+    Attributes:
+        kept (List[RfqQuote]): Live quotes reused for the target ladder, not built, signed or submitted again.
+        created (List[RfqQuote]): New quotes of the levels missing from the live ladder.
+        cancelled (List[RfqQuote]): Live quotes not in the target ladder, or expiring within the refresh margin.
+        expired (List[RfqQuote]): Live quotes already expired, dropped without being cancelled.
+        cancel_calls (List[CancelCall]): Calls cancelling `cancelled`, see `build_cancel_calls`, after the pending calls of earlier refreshes.
+    """
+
+    kept: List[RfqQuote] = field(default_factory=list)
+    created: List[RfqQuote] = field(default_factory=list)
+    cancelled: List[RfqQuote] = field(default_factory=list)
+    expired: List[RfqQuote] = field(default_factory=list)
+    cancel_calls: List[CancelCall] = field(default_factory=list)
+
+    @property
+    def saved(self) -> int:
+        """Number of levels which did not have to be built, signed and submitted."""
+        return len(self.kept)
+
+
+@dataclass
+class LadderStats:
+    """Totals over every refresh of a `LadderManager`."""
+
+    refreshes: int = 0
+    levels: int = 0
+    kept: int = 0
+    created: int = 0
+    cancelled: int = 0
+    expired: int = 0
+
+    @property
+    def saved_ratio(self) -> float:
+        """Share of requested levels served by already live quotes."""
+        return self.kept / self.levels if self.levels else 0.0
+
+
+class LadderManager:
+    """
+    Keeps the live quote ladder of one pair and refreshes it incrementally on every price tick.
+
+    A refresh matches the target levels against the live quotes: quotes of unchanged levels are kept as they are,
+    only the missing levels are quoted, signed and submitted, and the quotes of levels no longer wanted are cancelled.
+    Live quotes expiring within `refresh_margin` seconds are replaced as if their level changed,
+    expired ones are replaced as well but not cancelled, the contract already rejects them.
+
+    Example:
+        ladder = LadderManager(quoter, RfqPair(weth, usdc, ttl=300), submit=lambda quote: api.submit_order(quote.order, quote.signature))
+        refresh = ladder.refresh([LadderLevel(10**18, 1420 * 10**6), LadderLevel(2 * 10**18, 2830 * 10**6)])
+        for call in refresh.cancel_calls:
+            send_transaction(call.calldata)
+    """
+
+    def __init__(
+        self,
+        quoter: RfqQuoter,
+        pair: RfqPair,
+        submit: Optional[Callable[[RfqQuote], None]] = None,
+        cancel: Optional[Callable[[List[CancelCall]], None]] = None,
+        refresh_margin: int = 0,
+    ):
+        """
+        Args:
+            quoter (RfqQuoter): Builds and signs the quotes.
+            pair (RfqPair): Pair of the ladder.
+            submit (Optional[Callable[[RfqQuote], None]]): Called with every created quote, e.g. to submit it to the orderbook.
+            cancel (Optional[Callable[[List[CancelCall]], None]]): Called with the cancel calls of a refresh, when there are any.
+                Calls it raised on are kept in `pending_cancel_calls` and passed again by the next refresh.
+            refresh_margin (int): Live quotes expiring within this many seconds are replaced.
+        """
+        assert 0 <= refresh_margin < pair.ttl, "refresh_margin must be shorter than the quote ttl"
+        self.quoter = quoter
+        self.pair = pair
+        self.submit = submit
+        self.cancel = cancel
+        self.refresh_margin = refresh_margin
+        self.live: List[RfqQuote] = []
+        self.pending_cancel_calls: List[CancelCall] = []
+        self.stats = LadderStats()
+
+    @instrumented("ladder_manager.refresh")
+    def refresh(self, levels: Sequence[LadderLevel], now: Optional[int] = None) -> LadderRefresh:
+        """
+        Brings the live ladder to `levels` with the fewest new quotes.
+
+        Args:
+            levels (Sequence[LadderLevel]): Target ladder, the same level may appear several times.
+            now (Optional[int]): Unix timestamp of the refresh, current time if not set.
+
+        Returns:
+            LadderRefresh: Kept, created, cancelled and expired quotes. `live` holds the kept and created ones afterwards.
+            If cancelling or quoting raises, `live` only holds the kept quotes, the cancel calls stay in `pending_cancel_calls`.
+            If submitting raises, `live` holds the kept quotes and the created ones submitted before the failure.
+        """
+        now = int(time.time()) if now is None else now
+        result = LadderRefresh()
+
+        # Live quotes by level, so every target level takes at most one of them
+        available: Dict[LadderLevel, List[RfqQuote]] = {}
+        for quote in self.live:
+            expiration = quote.order.maker_traits.expiration()
+            if expiration is not None and expiration <= now:
+                result.expired.append(quote)
+            elif expiration is not None and expiration - now <= self.refresh_margin:
+                result.cancelled.append(quote)
+            else:
+                available.setdefault(LadderLevel(quote.order.making_amount, quote.order.taking_amount), []).append(quote)
+
+        missing: List[LadderLevel] = []
+        for level in levels:
+            quotes = available.get(level)
+            if quotes:
+                result.kept.append(quotes.pop())
+            else:
+                missing.append(level)
+        for quotes in available.values():
+            result.cancelled.extend(quotes)
+
+        # Dropped quotes leave the live ladder before calling out, so a failed refresh never cancels them twice
+        self.live = list(result.kept)
+        if result.cancelled:
+            orders = [quote.order for quote in result.cancelled]
+            result.cancel_calls = build_cancel_calls(orders, self.quoter.context, [quote.order_hash for quote in result.cancelled])
+        if self.cancel is not None and (self.pending_cancel_calls or result.cancel_calls):
+            # Cancelled quotes are still fillable until the calls go through, keep them until `cancel` returns
+            result.cancel_calls = self.pending_cancel_calls = self.pending_cancel_calls + result.cancel_calls
+            self.cancel(result.cancel_calls)
+            self.pending_cancel_calls = []
+
+        if missing:
+            result.created = self.quoter.quotes(self.pair, [level.making_amount for level in missing], [level.taking_amount for level in missing], now)
+            if self.submit is None:
+                self.live.extend(result.created)
+            else:
+                # A quote is live once it is submitted, the rest of a failed refresh is quoted again by the next one
+                for quote in result.created:
+                    self.submit(quote)
+                    self.live.append(quote)
+
+        stats = self.stats
+        stats.refreshes += 1
+        stats.levels += len(levels)
+        stats.kept += len(result.kept)
+        stats.created += len(result.created)
+        stats.cancelled += len(result.cancelled)
+        stats.expired += len(result.expired)
+        return result
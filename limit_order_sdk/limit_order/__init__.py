@@ -1,7 +1,12 @@
-from limit_order_sdk.limit_order.interaction import Interaction
-from limit_order_sdk.limit_order.extension import Extension
-from limit_order_sdk.limit_order.maker_traits import MakerTraits
+from limit_order_sdk.limit_order.interaction import Interaction, FrozenInteraction
+from limit_order_sdk.limit_order.extension import Extension, FrozenExtension
+from limit_order_sdk.limit_order.extension_cache import ExtensionCache, default_extension_cache
+from limit_order_sdk.limit_order.maker_traits import MakerTraits, FrozenMakerTraits
 from limit_order_sdk.limit_order.custom_types import LimitOrderV4Struct, OrderInfoData
+from limit_order_sdk.limit_order.salt_generator import SaltGenerator, default_salt_generator
 from limit_order_sdk.limit_order.limit_order import LimitOrder
+from limit_order_sdk.limit_order.frozen_limit_order import FrozenLimitOrder
+from limit_order_sdk.limit_order.order_template import OrderTemplate
 from limit_order_sdk.limit_order.extension_builder import ExtensionBuilder
 from limit_order_sdk.limit_order.taker_traits import TakerTraits
+from limit_order_sdk.limit_order.order_signer import OrderSigner
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Optional
 from limit_order_sdk.limit_order import Extension
 from limit_order_sdk.address import Address
@@ -15,7 +15,7 @@ class OrderInfoData:
     receiver: Optional[Address] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class LimitOrderV4Struct:
     salt: int
     maker: str
@@ -28,7 +28,8 @@ class LimitOrderV4Struct:
 
     def to_dict(self) -> dict:
         """Convert the dataclass to a dictionary"""
-        return asdict(self)
+        # All fields are scalars, a shallow copy is the same as `asdict` without its recursion
+        return dict(self.__dict__)
 
     def to_int_tuple(self) -> tuple:
         return (
@@ -1,13 +1,36 @@
-from web3 import Web3
-from eth_account.messages import encode_typed_data
-
+from limit_order_sdk.libs.byte_utils import add_0x
 from limit_order_sdk.limit_order.eip712.eip712_types import EIP712DomainType, EIP712TypedData
 from limit_order_sdk.limit_order import LimitOrderV4Struct
 from limit_order_sdk.constants import get_limit_order_contract
 from limit_order_sdk.limit_order.eip712.domain import EIP712Domain, LimitOrderV4TypeDataName, LimitOrderV4TypeDataVersion, Order
 
+# keccak256("EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)")
+EIP712_DOMAIN_TYPE_HASH = bytes.fromhex("8b73c3c69bb8fe3d512ecc4cf759cc79239f7b179b0ffacaa9a75d522b39400f")
+# keccak256("Order(uint256 salt,address maker,address receiver,address makerAsset,address takerAsset,uint256 makingAmount,uint256 takingAmount,uint256 makerTraits)")
+ORDER_TYPE_HASH = bytes.fromhex("3af21ec5a20011b88d3b7b4ed7c806cef05a5980cf34974bcd53566a131f7e4c")
+
+
+def encode_order_struct(order: LimitOrderV4Struct) -> bytes:
+    """Returns the order fields as 8 big-endian 32-byte words, the same bytes as `LimitOrder.to_calldata()`."""
+    return b"".join(word.to_bytes(32, "big") for word in order.to_int_tuple())
+
+
+def hash_order_struct(encoded_order: bytes) -> bytes:
+    """
+    Returns the EIP-712 `hashStruct` of an order encoded with `encode_order_struct`, without building typed data.
+
+    Args:
+        encoded_order (bytes): 256 bytes of the encoded order struct.
+    """
+    from eth_utils import keccak
+
+    return keccak(ORDER_TYPE_HASH + encoded_order)
+
 
 def get_order_hash(data: EIP712TypedData) -> str:
+    from eth_utils import keccak
+    from eth_account.messages import encode_typed_data
+
     # Encode the structured data
     encoded_data = encode_typed_data(
         full_message={
@@ -18,8 +41,9 @@ def get_order_hash(data: EIP712TypedData) -> str:
         }
     )
 
-    order_hash = Web3.keccak(encoded_data.body)
-    return order_hash.hex()
+    # EIP-712 digest: keccak256(0x19 ‖ 0x01 ‖ domainSeparator ‖ hashStruct(order)), same as `hashOrder` of the contract
+    order_hash = keccak(b"\x19" + encoded_data.version + encoded_data.header + encoded_data.body)
+    return add_0x(order_hash.hex())
 
 
 def build_order_typed_data(chain_id: int, verifying_contract: str, name: str, version: str, order: LimitOrderV4Struct) -> EIP712TypedData:
@@ -30,11 +54,15 @@ def build_order_typed_data(chain_id: int, verifying_contract: str, name: str, ve
     return obj
 
 
+def hash_domain(name: str, version: str, chain_id: int, verifying_contract: str) -> bytes:
+    """Returns 32 bytes of the EIP-712 domain separator."""
+    from eth_utils import keccak
+
+    return keccak(EIP712_DOMAIN_TYPE_HASH + keccak(text=name) + keccak(text=version) + chain_id.to_bytes(32, "big") + int(verifying_contract, 16).to_bytes(32, "big"))
+
+
 def get_domain_separator(name: str, version: str, chainId: int, verifyingContract: str) -> str:
-    domain_data = {"name": name, "version": version, "chainId": chainId, "verifyingContract": verifyingContract}
-    eip712_domain = {"primaryType": "EIP712Domain", "types": {"EIP712Domain": EIP712Domain}, "domain": domain_data, "message": domain_data}
-    encoded_data = encode_typed_data(eip712_domain)
-    return Web3.keccak(encoded_data.body).hex()
+    return add_0x(hash_domain(name, version, chainId, verifyingContract).hex())
 
 
 def get_limit_order_v4_domain(chain_id: int) -> EIP712DomainType:
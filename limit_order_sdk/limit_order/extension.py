@@ -1,9 +1,10 @@
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import List, ClassVar, Any
-from web3 import Web3
 import logging
 from limit_order_sdk.libs.byte_utils import BytesIter, trim_0x, is_hex_string, UINT_32_MAX
 from limit_order_sdk.constants import ZX
+from limit_order_sdk.metrics.instrumented import instrumented
 
 logger = logging.getLogger("gasless-research-logger")
 
@@ -53,15 +54,38 @@ class Extension:
     def default(cls):
         return cls()
 
+    @instrumented("extension.keccak256")
     def keccak256(self) -> int:
-        return int(Web3.keccak(text=self.encode()).hex(), base=16)
+        encoded = self.encode()
+        cached = self.__dict__.get("_keccak256")
+        if cached is not None and cached[0] == encoded:
+            return cached[1]
+
+        from eth_utils import keccak
+
+        hash_ = int.from_bytes(keccak(text=encoded), byteorder="big")
+        self._keccak256 = (encoded, hash_)
+        return hash_
 
     def is_empty(self) -> bool:
         all_interactions = self.get_all()
         all_interactions_concat = "".join([trim_0x(i) for i in all_interactions]) + trim_0x(self.custom_data)
         return len(all_interactions_concat) == 0
 
+    @instrumented("extension.encode")
     def encode(self) -> str:
+        # Encoding and hash are cached on the instance together with the field values they were computed from,
+        # so they stay correct if fields are reassigned
+        values = _values(self)
+        cached = self.__dict__.get("_encoded")
+        if cached is not None and cached[0] == values:
+            return cached[1]
+
+        encoded = self._encode()
+        self._encoded = (values, encoded)
+        return encoded
+
+    def _encode(self) -> str:
         all_interactions = self.get_all()
         all_interactions_concat = "".join([trim_0x(attr) for attr in all_interactions]) + trim_0x(self.custom_data)
 
@@ -85,3 +109,45 @@ class Extension:
 
     def get_all(self) -> List[str]:
         return [getattr(self, f) for f in self.fields]
+
+    def freeze(self) -> "FrozenExtension":
+        """Returns an immutable copy of the extension."""
+        return FrozenExtension(*_values(self))
+
+
+class FrozenExtension(Extension):
+    """
+    Immutable and hashable Extension, safe to share between orders and threads, e.g. the instances of `ExtensionCache`.
+    Extensions are equal when they encode to the same bytes.
+    """
+
+    def __post_init__(self):
+        super().__post_init__()
+        object.__setattr__(self, "_frozen", True)
+
+    def __setattr__(self, name, value):
+        # Private attributes are the encoding and hash caches
+        if self.__dict__.get("_frozen") and not name.startswith("_"):
+            raise AttributeError("FrozenExtension is immutable")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError("FrozenExtension is immutable")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Extension):
+            return NotImplemented
+        return self.encode() == other.encode()
+
+    def __hash__(self) -> int:
+        return hash(self.encode())
+
+    def freeze(self) -> "FrozenExtension":
+        return self
+
+    def thaw(self) -> Extension:
+        """Returns a mutable copy of the extension."""
+        return Extension(*_values(self))
+
+
+_values = attrgetter(*Extension.fields, "custom_data")
@@ -0,0 +1,87 @@
+import threading
+from collections import OrderedDict
+
+from limit_order_sdk.limit_order.extension import Extension, FrozenExtension
+
+
+class ExtensionCache:
+    """
+    Bounded LRU cache interning extensions by their encoded bytes.
+
+    Orders from the same integrator usually carry byte-identical extensions. Decoding them through the cache
+    returns one shared `FrozenExtension` per distinct extension, with its encoding and hash computed once.
+
+    Example:
+        cache = ExtensionCache(maxsize=10_000)
+        extension = cache.decode(data)
+        print(cache.hit_rate)
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Args:
+            maxsize (int): Maximum number of interned extensions, least recently used ones are evicted first.
+        """
+        assert maxsize > 0, "maxsize must be positive"
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, FrozenExtension]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache, 0 if there were none."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _get(self, key: str):
+        with self._lock:
+            extension = self._entries.get(key)
+            if extension is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return extension
+
+    def _put(self, key: str, extension: FrozenExtension) -> FrozenExtension:
+        with self._lock:
+            # Another thread may have interned the same bytes meanwhile, keep the first instance
+            extension = self._entries.setdefault(key, extension)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return extension
+
+    def decode(self, data: str) -> FrozenExtension:
+        """Same as `Extension.decode`, returning the interned instance for previously seen `data`."""
+        extension = self._get(data)
+        if extension is None:
+            extension = FrozenExtension.decode(data)
+            extension.keccak256()  # warm the encoding and hash caches of the shared instance
+            extension = self._put(data, extension)
+        return extension
+
+    def intern(self, extension: Extension) -> FrozenExtension:
+        """Returns the interned instance with the same encoding as `extension`, interning a frozen copy of `extension` if there is none."""
+        key = extension.encode()
+        interned = self._get(key)
+        if interned is None:
+            interned = extension.freeze()
+            interned.keccak256()
+            interned = self._put(key, interned)
+        return interned
+
+    def clear(self) -> None:
+        """Drops all interned extensions and resets statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+default_extension_cache = ExtensionCache()
@@ -0,0 +1,77 @@
+from typing import Optional
+
+from limit_order_sdk.address import Address
+from limit_order_sdk.limit_order import Extension, MakerTraits, OrderInfoData
+from limit_order_sdk.limit_order.limit_order import LimitOrder
+
+
+class FrozenLimitOrder(LimitOrder):
+    """
+    Immutable and hashable LimitOrder with `FrozenMakerTraits` and a `FrozenExtension`. Orders are equal and hash the same when their signed fields are equal,
+    so they can be put in sets and used as dict keys, and shared between threads.
+
+    Order hashes are cached per chain on the order, `with_*` methods return new orders sharing the frozen extension.
+
+    Example:
+        order = LimitOrder(order_info, maker_traits, extension).freeze()
+        order.get_order_hash(chain_id)  # computed once per chain
+        cheaper = order.with_taking_amount(order.taking_amount - 1)
+    """
+
+    def __init__(self, order_info: OrderInfoData, maker_traits: Optional[MakerTraits] = None, extension: Extension = Extension.default()):
+        super().__init__(order_info, maker_traits, extension)
+        self._freeze()
+
+    @classmethod
+    def _from_trusted(cls, *args, **kwargs) -> "FrozenLimitOrder":
+        order = super()._from_trusted(*args, **kwargs)
+        order._freeze()
+        return order
+
+    @classmethod
+    def from_order(cls, order: LimitOrder) -> "FrozenLimitOrder":
+        """Returns a frozen copy of `order`, without validating it again."""
+        if isinstance(order, FrozenLimitOrder):
+            return order
+        return cls._from_trusted(order.maker_asset, order.taker_asset, order.making_amount, order.taking_amount, order.salt, order.maker, order.receiver, order.maker_traits, order.extension)
+
+    def _freeze(self) -> None:
+        object.__setattr__(self, "maker_traits", self.maker_traits.freeze())
+        object.__setattr__(self, "extension", self.extension.freeze())
+        object.__setattr__(self, "_frozen", True)
+
+    def __setattr__(self, name, value):
+        if self.__dict__.get("_frozen"):
+            raise AttributeError("FrozenLimitOrder is immutable")
+        object.__setattr__(self, name, value)
+
+    def __hash__(self) -> int:
+        return hash((self.salt, self.maker, self.receiver, self.maker_asset, self.taker_asset, self.making_amount, self.taking_amount, self.maker_traits))
+
+    def freeze(self) -> "FrozenLimitOrder":
+        return self
+
+    def thaw(self) -> LimitOrder:
+        """Returns a mutable copy of the order."""
+        return LimitOrder._from_trusted(self.maker_asset, self.taker_asset, self.making_amount, self.taking_amount, self.salt, self.maker, self.receiver, self.maker_traits.thaw(), self.extension.thaw())
+
+    def _with(self, **changes) -> "FrozenLimitOrder":
+        fields = dict(maker_asset=self.maker_asset, taker_asset=self.taker_asset, making_amount=self.making_amount, taking_amount=self.taking_amount, maker=self.maker, salt=self.salt, receiver=self.receiver)
+        maker_traits = changes.pop("maker_traits", self.maker_traits)
+        fields.update(changes)
+        return FrozenLimitOrder(OrderInfoData(**fields), maker_traits, self.extension)
+
+    def with_making_amount(self, making_amount: int) -> "FrozenLimitOrder":
+        return self._with(making_amount=making_amount)
+
+    def with_taking_amount(self, taking_amount: int) -> "FrozenLimitOrder":
+        return self._with(taking_amount=taking_amount)
+
+    def with_salt(self, salt: int) -> "FrozenLimitOrder":
+        return self._with(salt=salt)
+
+    def with_receiver(self, receiver: Address) -> "FrozenLimitOrder":
+        return self._with(receiver=receiver)
+
+    def with_maker_traits(self, maker_traits: MakerTraits) -> "FrozenLimitOrder":
+        return self._with(maker_traits=maker_traits)
@@ -26,5 +26,48 @@ class Interaction:
     def encode(self) -> str:
         return str(self.target) + trim_0x(self.data)
 
+    def freeze(self) -> "FrozenInteraction":
+        """Returns an immutable copy of the interaction."""
+        return FrozenInteraction(self.target, self.data)
+
     def __repr__(self):
         return f"Interaction(target={self.target}, data={self.data})"
+
+
+class FrozenInteraction(Interaction):
+    """
+    Immutable and hashable Interaction, `with_*` methods return new interactions.
+    Interactions are equal when they encode to the same bytes.
+    """
+
+    def __init__(self, target: Address, data: str):
+        assert is_hex_bytes(data), "Interaction data must be valid hex bytes"
+        object.__setattr__(self, "target", target)
+        object.__setattr__(self, "data", data)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenInteraction is immutable")
+
+    @staticmethod
+    def decode(bytes: str) -> "FrozenInteraction":
+        return Interaction.decode(bytes).freeze()
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FrozenInteraction):
+            return NotImplemented
+        return self.target == other.target and self.data.lower() == other.data.lower()
+
+    def __hash__(self) -> int:
+        return hash((self.target, self.data.lower()))
+
+    def freeze(self) -> "FrozenInteraction":
+        return self
+
+    def with_target(self, target: Address) -> "FrozenInteraction":
+        return FrozenInteraction(target, self.data)
+
+    def with_data(self, data: str) -> "FrozenInteraction":
+        return FrozenInteraction(self.target, data)
+
+    def __repr__(self):
+        return f"FrozenInteraction(target={self.target}, data={self.data})"
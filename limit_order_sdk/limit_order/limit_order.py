@@ -1,54 +1,66 @@
-from eth_abi import decode, encode
-import eth_utils
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 from limit_order_sdk.libs.byte_utils import UINT_160_MAX, UINT_256_MAX, is_hex_string, add_0x
-from limit_order_sdk.utils.rand_int import rand_int
-from limit_order_sdk.address import Address
+from limit_order_sdk.address import Address, ZERO_ADDRESS
 from limit_order_sdk.limit_order import Extension, LimitOrderV4Struct, OrderInfoData, MakerTraits
-from limit_order_sdk.limit_order.eip712 import build_order_typed_data, get_limit_order_v4_domain, get_order_hash
+from limit_order_sdk.limit_order.salt_generator import default_salt_generator
+from limit_order_sdk.metrics.instrumented import instrumented
+from limit_order_sdk.limit_order.eip712 import build_order_typed_data, encode_order_struct, hash_order_struct
+from limit_order_sdk.chain_context import ChainContext, ChainLike, get_chain_context
+
+if TYPE_CHECKING:
+    from limit_order_sdk.limit_order.frozen_limit_order import FrozenLimitOrder
 
 
 class LimitOrder:
     web3_types = ["uint256", "address", "address", "address", "address", "uint256", "uint256", "uint256"]
 
-    def __init__(self, order_info: OrderInfoData, maker_traits=MakerTraits(0), extension: Extension = Extension.default()):
+    def __init__(self, order_info: OrderInfoData, maker_traits: Optional[MakerTraits] = None, extension: Extension = Extension.default()):
+        if maker_traits is None:
+            maker_traits = MakerTraits.default()
+        if not extension.is_empty():
+            # Setters of `FrozenMakerTraits` return new traits instead of updating in place
+            maker_traits = maker_traits.with_extension()
+
         self.maker_asset = order_info.maker_asset
         self.taker_asset = order_info.taker_asset
         self.making_amount = order_info.making_amount
         self.taking_amount = order_info.taking_amount
         self.salt = self.verify_salt(order_info.salt or self.build_salt(extension), extension)
         self.maker = order_info.maker
-        self.receiver = order_info.receiver if order_info.receiver and not order_info.receiver.equal(order_info.maker) else Address("0x0000000000000000000000000000000000000000")
+        self.receiver = order_info.receiver if order_info.receiver and not order_info.receiver.equal(order_info.maker) else ZERO_ADDRESS
         self.maker_traits = maker_traits
         self.extension = extension
 
         assert self.making_amount <= UINT_256_MAX, "making_amount too big"
         assert self.taking_amount <= UINT_256_MAX, "taking_amount too big"
 
-        if not extension.is_empty():
-            self.maker_traits.with_extension()
-
     def __eq__(self, other):
         if not isinstance(other, LimitOrder):
             return False
         return (
-            str(self.maker_asset) == str(other.maker_asset)
-            and str(self.taker_asset) == str(other.taker_asset)
+            self.maker_asset == other.maker_asset
+            and self.taker_asset == other.taker_asset
             and self.making_amount == other.making_amount
             and self.taking_amount == other.taking_amount
             and self.salt == other.salt
-            and str(self.maker) == str(other.maker)
-            and str(self.receiver) == str(other.receiver)
+            and self.maker == other.maker
+            and self.receiver == other.receiver
             and self.maker_traits.as_int() == other.maker_traits.as_int()
         )
 
     @staticmethod
-    def build_salt(extension: Extension, base_salt=rand_int(1 << 96 - 1)) -> int:
+    def build_salt(extension: Extension, base_salt: Optional[int] = None) -> int:
         # Build correct salt for order
         #
         # If order has extension - it is crucial to build correct salt
         # otherwise order won't be ever filled
         #
+        # Random 96-bit base salt is generated for every call if not passed,
+        # use `SaltGenerator.salts` to build salts for many orders at once
+        #
         # @see https://github.com/1inch/limit-order-protocol/blob/7bc5129ae19832338169ca21e4cf6331e8ff44f6/contracts/OrderLib.sol#L153
+        if base_salt is None:
+            base_salt = default_salt_generator.base_salt()
         if extension.is_empty():
             return base_salt
         return (base_salt << 160) | (extension.keccak256() & UINT_160_MAX)
@@ -66,16 +78,27 @@ class LimitOrder:
 
     @staticmethod
     def from_calldata(bytes_: str):
+        from eth_abi import decode
+        import eth_utils
+
         assert is_hex_string(bytes_), "Bytes should be valid hex string with 0x prefix"
         decoded_bytes = eth_utils.decode_hex(bytes_)
         order = decode(LimitOrder.web3_types, decoded_bytes, strict=False)
-        order_info = OrderInfoData(salt=int(order[0]), maker=Address(order[1]), receiver=Address(order[2]), maker_asset=Address(order[3]), taker_asset=Address(order[4]), making_amount=int(order[5]), taking_amount=int(order[6]))
+        order_info = OrderInfoData(
+            salt=int(order[0]), maker=Address.interned(order[1]), receiver=Address.interned(order[2]), maker_asset=Address.interned(order[3]), taker_asset=Address.interned(order[4]), making_amount=int(order[5]), taking_amount=int(order[6])
+        )
         return LimitOrder(order_info, MakerTraits(order[7]))
 
     @staticmethod
     def from_data_and_extension(data: LimitOrderV4Struct, extension: Extension):
         order_info = OrderInfoData(
-            salt=int(data.salt), maker=Address(data.maker), receiver=Address(data.receiver), maker_asset=Address(data.makerAsset), taker_asset=Address(data.takerAsset), making_amount=int(data.makingAmount), taking_amount=int(data.takingAmount)
+            salt=int(data.salt),
+            maker=Address.interned(data.maker),
+            receiver=Address.interned(data.receiver),
+            maker_asset=Address.interned(data.makerAsset),
+            taker_asset=Address.interned(data.takerAsset),
+            making_amount=int(data.makingAmount),
+            taking_amount=int(data.takingAmount),
         )
         return LimitOrder(
             order_info,
@@ -83,30 +106,93 @@ class LimitOrder:
             extension,
         )
 
+    @classmethod
+    def _from_trusted(cls, maker_asset: Address, taker_asset: Address, making_amount: int, taking_amount: int, salt: int, maker: Address, receiver: Address, maker_traits: MakerTraits, extension: Extension) -> "LimitOrder":
+        # Skips salt and amount validation, for callers which already did it once for many orders (see `OrderTemplate`).
+        # `receiver` is expected to be normalized and `maker_traits` to have the extension flag set when needed.
+        order = cls.__new__(cls)
+        order.maker_asset = maker_asset
+        order.taker_asset = taker_asset
+        order.making_amount = making_amount
+        order.taking_amount = taking_amount
+        order.salt = salt
+        order.maker = maker
+        order.receiver = receiver
+        order.maker_traits = maker_traits
+        order.extension = extension
+        return order
+
+    def _cache(self) -> Dict[str, Any]:
+        # Built data is cached on the order together with the field values it was built from, like `Extension.encode`,
+        # so it stays correct if fields are reassigned or `maker_traits` is changed in place
+        key = (self.salt, self.maker, self.receiver, self.maker_asset, self.taker_asset, self.making_amount, self.taking_amount, self.maker_traits.as_int())
+        cached = self.__dict__.get("_cached")
+        if cached is None or cached[0] != key:
+            cached = self.__dict__["_cached"] = (key, {"hashes": {}})
+        return cached[1]
+
+    def _build(self, cache: Dict[str, Any]) -> LimitOrderV4Struct:
+        struct = cache.get("struct")
+        if struct is None:
+            struct = cache["struct"] = LimitOrderV4Struct(
+                makerAsset=str(self.maker_asset),
+                takerAsset=str(self.taker_asset),
+                makingAmount=int(self.making_amount),
+                takingAmount=int(self.taking_amount),
+                makerTraits=self.maker_traits.as_int() or 0,
+                salt=int(self.salt),
+                maker=str(self.maker),
+                receiver=str(self.receiver),
+            )
+        return struct
+
+    def _encoded(self, cache: Dict[str, Any]) -> bytes:
+        encoded = cache.get("encoded")
+        if encoded is None:
+            encoded = cache["encoded"] = encode_order_struct(self._build(cache))
+        return encoded
+
+    def _order_hash(self, context: ChainContext) -> str:
+        cache = self._cache()
+        hashes: Dict[int, str] = cache["hashes"]
+        order_hash = hashes.get(context.chain_id)
+        if order_hash is None:
+            order_hash = hashes[context.chain_id] = add_0x(context.digest(hash_order_struct(self._encoded(cache))).hex())
+        return order_hash
+
     def to_calldata(self) -> str:
-        order: LimitOrderV4Struct = self.build()
-        values = [order.salt, order.maker, order.receiver, order.makerAsset, order.takerAsset, order.makingAmount, order.takingAmount, order.makerTraits]
-        assert len(self.web3_types) == len(values), "types/values length mismatch when to_calldata()"
-        return add_0x(encode(self.web3_types, values).hex())
+        """Returns the ABI encoded order struct, cached on the order."""
+        cache = self._cache()
+        calldata = cache.get("calldata")
+        if calldata is None:
+            calldata = cache["calldata"] = add_0x(self._encoded(cache).hex())
+        return calldata
 
     def build(self) -> LimitOrderV4Struct:
-        return LimitOrderV4Struct(
-            makerAsset=str(self.maker_asset),
-            takerAsset=str(self.taker_asset),
-            makingAmount=int(self.making_amount),
-            takingAmount=int(self.taking_amount),
-            makerTraits=self.maker_traits.as_int() or 0,
-            salt=int(self.salt),
-            maker=str(self.maker),
-            receiver=str(self.receiver),
-        )
+        """Returns the order struct, cached on the order. The struct is frozen, use `dataclasses.replace` to build a changed one."""
+        return self._build(self._cache())
 
-    def get_typed_data(self, chain_id: int):
-        domain = get_limit_order_v4_domain(chain_id)
-        return build_order_typed_data(domain.chainId, domain.verifyingContract, domain.name, domain.version, self.build())
+    def get_typed_data(self, chain_id: ChainLike):
+        domain = get_chain_context(chain_id).domain
+        return build_order_typed_data(domain["chainId"], domain["verifyingContract"], domain["name"], domain["version"], self.build())
 
-    def get_order_hash(self, chain_id: int) -> str:
-        return get_order_hash(self.get_typed_data(chain_id))
+    @instrumented("limit_order.get_order_hash")
+    def get_order_hash(self, chain_id: ChainLike) -> str:
+        """Returns the EIP-712 order hash, computed once per chain while the order fields stay the same."""
+        return self._order_hash(get_chain_context(chain_id))
+
+    @staticmethod
+    @instrumented("limit_order.get_order_hashes")
+    def get_order_hashes(orders: Sequence["LimitOrder"], chain_id: ChainLike) -> List[str]:
+        # Same hashes as `get_order_hash` of every order, the chain context is resolved once
+        context = get_chain_context(chain_id)
+        return [order._order_hash(context) for order in orders]
 
     def is_private(self) -> bool:
         return self.maker_traits.is_private()
+
+    def freeze(self) -> "FrozenLimitOrder":
+        """Returns an immutable, hashable copy of the order."""
+        from limit_order_sdk.limit_order.frozen_limit_order import FrozenLimitOrder
+
+        return FrozenLimitOrder.from_order(self)
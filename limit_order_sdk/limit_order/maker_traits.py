@@ -239,6 +239,83 @@ class MakerTraits:
     def is_bit_invalidator_mode(self) -> bool:
         return not (self.is_partial_fill_allowed() and self.is_multiple_fills_allowed())
 
+    def freeze(self) -> "FrozenMakerTraits":
+        """Returns an immutable copy of the traits."""
+        return FrozenMakerTraits(self.as_int())
+
     def __str__(self):
         """Returns a string representation of the MakerTraits."""
         return f"MakerTraits(value={self.value})"
+
+
+class FrozenMakerTraits(MakerTraits):
+    """
+    Immutable and hashable MakerTraits: setters return new traits and leave this instance unchanged,
+    so it can be shared between orders and threads and used as a dict key.
+
+    Example:
+        traits = MakerTraits.default().freeze()
+        expiring = traits.with_expiration(expiration)  # `traits` is unchanged
+    """
+
+    def __init__(self, value=0):
+        object.__setattr__(self, "value", BN(value))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenMakerTraits is immutable")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FrozenMakerTraits):
+            return NotImplemented
+        return self.as_int() == other.as_int()
+
+    def __hash__(self) -> int:
+        return hash(self.as_int())
+
+    def freeze(self) -> "FrozenMakerTraits":
+        return self
+
+    def thaw(self) -> MakerTraits:
+        """Returns a mutable copy of the traits."""
+        return MakerTraits(self.as_int())
+
+    def __str__(self):
+        return f"FrozenMakerTraits(value={self.value})"
+
+
+def _frozen_setter(name: str):
+    setter = getattr(MakerTraits, name)
+
+    def frozen_setter(self: FrozenMakerTraits, *args, **kwargs) -> FrozenMakerTraits:
+        traits = self.thaw()
+        setter(traits, *args, **kwargs)
+        return FrozenMakerTraits(traits.as_int())
+
+    frozen_setter.__name__ = name
+    frozen_setter.__doc__ = f"Same as `MakerTraits.{name}`, returns new traits."
+    return frozen_setter
+
+
+for _setter_name in (
+    "with_allowed_sender",
+    "with_any_sender",
+    "with_expiration",
+    "with_nonce",
+    "with_epoch",
+    "with_extension",
+    "enable_pre_interaction",
+    "disable_pre_interaction",
+    "enable_post_interaction",
+    "disable_post_interaction",
+    "enable_epoch_manager_check",
+    "set_series",
+    "allow_partial_fills",
+    "disable_partial_fills",
+    "allow_multiple_fills",
+    "disable_multiple_fills",
+    "enable_permit2",
+    "disable_permit2",
+    "enable_native_unwrap",
+    "disable_native_unwrap",
+):
+    setattr(FrozenMakerTraits, _setter_name, _frozen_setter(_setter_name))
@@ -0,0 +1,51 @@
+from typing import List, Sequence, Union
+
+from limit_order_sdk.address import Address
+from limit_order_sdk.chain_context import ChainLike, get_chain_context
+from limit_order_sdk.libs.byte_utils import add_0x, trim_0x
+from limit_order_sdk.limit_order.limit_order import LimitOrder
+from limit_order_sdk.metrics.instrumented import instrumented
+
+
+class OrderSigner:
+    """
+    Signs orders of one maker key without typed data: the 32-byte EIP-712 digest, which is the order hash,
+    is signed directly with the `eth_keys` key object. Signatures are byte for byte the `signature` of
+    `Account.sign_typed_data` over `LimitOrder.get_typed_data`, both sign with deterministic (RFC 6979) nonces.
+
+    Signing dominates the cost, `eth_keys` uses the much faster `coincurve` backend when it is installed.
+
+    Example:
+        signer = OrderSigner(private_key)
+        signature = signer.sign(order, chain_id)
+        api.submit_order(order, signature)
+    """
+
+    def __init__(self, private_key: Union[bytes, str]):
+        """
+        Args:
+            private_key (Union[bytes, str]): Key of the maker, 32 bytes or hex string.
+        """
+        from eth_keys import keys
+
+        self._key = keys.PrivateKey(bytes.fromhex(trim_0x(private_key)) if isinstance(private_key, str) else bytes(private_key))
+        self.address = Address(self._key.public_key.to_address())
+
+    def sign_digest(self, digest: bytes) -> str:
+        """Returns the 65-byte signature r ‖ s ‖ v of a 32-byte digest, hex with v in {27, 28}."""
+        signature = self._key.sign_msg_hash(digest)
+        return add_0x(signature.r.to_bytes(32, "big").hex() + signature.s.to_bytes(32, "big").hex() + (signature.v + 27).to_bytes(1, "big").hex())
+
+    def sign_order_hash(self, order_hash: str) -> str:
+        """Signs an order hash returned by `LimitOrder.get_order_hash`."""
+        return self.sign_digest(bytes.fromhex(trim_0x(order_hash)))
+
+    @instrumented("order_signer.sign")
+    def sign(self, order: LimitOrder, chain_id: ChainLike) -> str:
+        """Returns the maker signature of `order` on a chain."""
+        return self.sign_order_hash(order.get_order_hash(chain_id))
+
+    @instrumented("order_signer.sign_orders")
+    def sign_orders(self, orders: Sequence[LimitOrder], chain_id: ChainLike) -> List[str]:
+        """Same as `sign` for every order, the chain context is resolved once."""
+        return [self.sign_order_hash(order_hash) for order_hash in LimitOrder.get_order_hashes(orders, get_chain_context(chain_id))]
@@ -0,0 +1,169 @@
+from typing import List, Optional, Sequence
+
+from limit_order_sdk.address import Address, ZERO_ADDRESS
+from limit_order_sdk.libs.byte_utils import UINT_40_MAX, UINT_160_MAX, UINT_256_MAX, add_0x
+from limit_order_sdk.limit_order import Extension, MakerTraits
+from limit_order_sdk.limit_order.eip712 import EIP712Domain, EIP712TypedData, Order, hash_order_struct
+from limit_order_sdk.chain_context import ChainLike, get_chain_context
+from limit_order_sdk.limit_order.limit_order import LimitOrder
+from limit_order_sdk.limit_order.salt_generator import SaltGenerator, default_salt_generator
+from limit_order_sdk.metrics.instrumented import instrumented
+
+
+class OrderTemplate:
+    """
+    Factory for many orders sharing maker, assets, receiver, extension and base maker traits, e.g. ladders and grids.
+
+    Everything invariant across the orders is computed once per template: address normalization, the extension
+    hash, the encoded maker/receiver/asset words and the base traits. Stamped orders only differ in amounts,
+    nonce, expiration and salt.
+
+    Example:
+        template = OrderTemplate(maker, weth, usdc, maker_traits=MakerTraits.default().allow_multiple_fills())
+        orders = template.stamp(making_amounts, taking_amounts, expirations=[expiration] * len(making_amounts))
+        hashes = template.get_order_hashes(orders, chain_id)
+    """
+
+    def __init__(
+        self,
+        maker: Address,
+        maker_asset: Address,
+        taker_asset: Address,
+        receiver: Optional[Address] = None,
+        extension: Optional[Extension] = None,
+        maker_traits: Optional[MakerTraits] = None,
+        salt_generator: SaltGenerator = default_salt_generator,
+    ):
+        """
+        Args:
+            maker (Address): Maker of every order.
+            maker_asset (Address): Asset sold by every order.
+            taker_asset (Address): Asset bought by every order.
+            receiver (Optional[Address]): Receiver of taker assets, the maker if not set.
+            extension (Optional[Extension]): Extension shared by every order.
+            maker_traits (Optional[MakerTraits]): Base traits, nonce and expiration are overridden per order. Not modified.
+            salt_generator (SaltGenerator): Source of random base salts.
+        """
+        self.maker = maker
+        self.maker_asset = maker_asset
+        self.taker_asset = taker_asset
+        self.receiver = receiver if receiver and not receiver.equal(maker) else ZERO_ADDRESS
+        self.extension = extension or Extension.default()
+        self.salt_generator = salt_generator
+
+        base_traits = maker_traits.as_int() if maker_traits is not None else 0
+        if self.extension.is_empty():
+            self._extension_hash = None
+        else:
+            self._extension_hash = self.extension.keccak256() & UINT_160_MAX
+            base_traits |= 1 << MakerTraits.HAS_EXTENSION_FLAG
+
+        self.base_traits = base_traits
+        self._nonce_offset = MakerTraits.NONCE_OR_EPOCH_MASK.offset
+        self._expiration_offset = MakerTraits.EXPIRATION_MASK.offset
+
+        # maker, receiver, makerAsset and takerAsset are adjacent words of the encoded order struct
+        self._address_words = b"".join(int(str(address), 16).to_bytes(32, "big") for address in (self.maker, self.receiver, self.maker_asset, self.taker_asset))
+
+    def salts(self, n: int) -> List[int]:
+        """Returns `n` distinct salts valid for the template extension."""
+        base_salts = self.salt_generator.base_salts(n)
+        if self._extension_hash is None:
+            return base_salts
+        return [(base_salt << 160) | self._extension_hash for base_salt in base_salts]
+
+    @instrumented("order_template.stamp")
+    def stamp(
+        self,
+        making_amounts: Sequence[int],
+        taking_amounts: Sequence[int],
+        nonces: Optional[Sequence[int]] = None,
+        expirations: Optional[Sequence[int]] = None,
+        salts: Optional[Sequence[int]] = None,
+    ) -> List[LimitOrder]:
+        """
+        Builds one order per element of the amount vectors.
+
+        Args:
+            making_amounts (Sequence[int]): Making amount of every order.
+            taking_amounts (Sequence[int]): Taking amount of every order.
+            nonces (Optional[Sequence[int]]): Nonce (or epoch) of every order, the base traits value if not set.
+            expirations (Optional[Sequence[int]]): Expiration of every order, the base traits value if not set.
+            salts (Optional[Sequence[int]]): Salts of the orders, random ones are generated if not set.
+                Salts must be valid for the template extension.
+
+        Returns:
+            List[LimitOrder]: Orders in the order of the input vectors.
+        """
+        n = len(making_amounts)
+        assert len(taking_amounts) == n, "making_amounts/taking_amounts length mismatch"
+        assert nonces is None or len(nonces) == n, "nonces length mismatch"
+        assert expirations is None or len(expirations) == n, "expirations length mismatch"
+        assert salts is None or len(salts) == n, "salts length mismatch"
+
+        assert all(0 <= amount <= UINT_256_MAX for amount in making_amounts), "making_amount too big"
+        assert all(0 <= amount <= UINT_256_MAX for amount in taking_amounts), "taking_amount too big"
+
+        traits = self._traits(n, nonces, expirations)
+        if salts is None:
+            salts = self.salts(n)
+        else:
+            self._verify_salts(salts)
+
+        maker, receiver, maker_asset, taker_asset, extension = self.maker, self.receiver, self.maker_asset, self.taker_asset, self.extension
+        return [
+            LimitOrder._from_trusted(maker_asset, taker_asset, making_amount, taking_amount, salt, maker, receiver, MakerTraits(value), extension)
+            for making_amount, taking_amount, salt, value in zip(making_amounts, taking_amounts, salts, traits)
+        ]
+
+    def _traits(self, n: int, nonces: Optional[Sequence[int]], expirations: Optional[Sequence[int]]) -> List[int]:
+        # Fields given per order are cleared in the base traits and or-ed in afterwards
+        base_traits = self.base_traits
+        if nonces is not None:
+            assert all(0 <= nonce <= UINT_40_MAX for nonce in nonces), "nonce too big"
+            base_traits &= ~(UINT_40_MAX << self._nonce_offset)
+        if expirations is not None:
+            assert all(0 <= expiration <= UINT_40_MAX for expiration in expirations), "expiration too big"
+            base_traits &= ~(UINT_40_MAX << self._expiration_offset)
+
+        traits = [base_traits] * n
+        if nonces is not None:
+            nonce_offset = self._nonce_offset
+            traits = [value | (nonce << nonce_offset) for value, nonce in zip(traits, nonces)]
+        if expirations is not None:
+            expiration_offset = self._expiration_offset
+            traits = [value | (expiration << expiration_offset) for value, expiration in zip(traits, expirations)]
+        return traits
+
+    def _verify_salts(self, salts: Sequence[int]) -> None:
+        assert all(0 <= salt <= UINT_256_MAX for salt in salts), "salt too big"
+        if self._extension_hash is not None:
+            extension_hash = self._extension_hash
+            assert all(salt & UINT_160_MAX == extension_hash for salt in salts), "invalid salt: lowest 160 bits should be extension hash"
+
+    def get_typed_data(self, orders: Sequence[LimitOrder], chain_id: ChainLike) -> List[EIP712TypedData]:
+        """Returns EIP-712 typed data of `orders`, same as `LimitOrder.get_typed_data`."""
+        domain_dict = get_chain_context(chain_id).domain
+        types = {"EIP712Domain": EIP712Domain, "Order": Order}
+        return [EIP712TypedData(primaryType="Order", types=types, domain=dict(domain_dict), message=order.build().to_dict()) for order in orders]
+
+    @instrumented("order_template.get_order_hashes")
+    def get_order_hashes(self, orders: Sequence[LimitOrder], chain_id: ChainLike) -> List[str]:
+        """
+        Returns hashes of `orders`, same as `LimitOrder.get_order_hashes`, without building typed data for every order.
+
+        Orders with the maker, receiver and assets of the template are hashed from the template's encoded addresses,
+        any other order falls back to `LimitOrder.get_order_hash`.
+        """
+        context = get_chain_context(chain_id)
+        digest = context.digest
+        address_words = self._address_words
+        addresses = (self.maker, self.receiver, self.maker_asset, self.taker_asset)
+        hashes: List[str] = []
+        for order in orders:
+            if (order.maker, order.receiver, order.maker_asset, order.taker_asset) != addresses:
+                hashes.append(order._order_hash(context))
+                continue
+            encoded = order.salt.to_bytes(32, "big") + address_words + order.making_amount.to_bytes(32, "big") + order.taking_amount.to_bytes(32, "big") + order.maker_traits.as_int().to_bytes(32, "big")
+            hashes.append(add_0x(digest(hash_order_struct(encoded)).hex()))
+        return hashes
@@ -0,0 +1,100 @@
+import os
+import secrets
+import threading
+import weakref
+from typing import List, Optional
+
+from limit_order_sdk.libs.byte_utils import UINT_160_MAX
+from limit_order_sdk.limit_order.extension import Extension
+
+BASE_SALT_BYTES = 12  # 96 bits
+
+
+class SaltGenerator:
+    """
+    Generates order salts from entropy drawn in large chunks, instead of one `secrets` call per salt.
+
+    Base salts are random 96-bit values. For orders with an extension the salt is the base salt followed by
+    the lowest 160 bits of the extension hash, see `LimitOrder.build_salt`.
+
+    Example:
+        generator = SaltGenerator()
+        salts = generator.salts(1000, extension)  # extension hash is computed once for all 1000 salts
+    """
+
+    def __init__(self, chunk_size: int = 64 * 1024):
+        """
+        Args:
+            chunk_size (int): Number of random bytes drawn from the OS at once.
+        """
+        self.chunk_size = chunk_size
+        self._buffer = b""
+        self._position = 0
+        self._lock = threading.Lock()
+        _generators.add(self)
+
+    def _reset(self) -> None:
+        # A forked child inherits the buffer of its parent, drop it so both don't hand out the same salts.
+        # The lock may have been held by another thread of the parent at fork time, so it is replaced too.
+        self._lock = threading.Lock()
+        self._buffer = b""
+        self._position = 0
+
+    def _take(self, n: int) -> bytes:
+        with self._lock:
+            if self._position + n > len(self._buffer):
+                # Leftover bytes are kept, so no entropy is drawn twice or thrown away
+                self._buffer = self._buffer[self._position :] + secrets.token_bytes(max(self.chunk_size, n))
+                self._position = 0
+            data = self._buffer[self._position : self._position + n]
+            self._position += n
+            return data
+
+    def base_salt(self) -> int:
+        """Returns a random 96-bit base salt."""
+        return int.from_bytes(self._take(BASE_SALT_BYTES), byteorder="big")
+
+    def base_salts(self, n: int) -> List[int]:
+        """Returns `n` distinct random 96-bit base salts."""
+        data = self._take(n * BASE_SALT_BYTES)
+        salts = [int.from_bytes(data[i : i + BASE_SALT_BYTES], byteorder="big") for i in range(0, len(data), BASE_SALT_BYTES)]
+
+        # A collision among 96-bit values is practically impossible, but keep the guarantee cheap and explicit
+        if len(set(salts)) != n:
+            seen = set()
+            for i, salt in enumerate(salts):
+                while salt in seen:
+                    salt = self.base_salt()
+                seen.add(salt)
+                salts[i] = salt
+        return salts
+
+    def salts(self, n: int, extension: Optional[Extension] = None) -> List[int]:
+        """
+        Returns `n` distinct order salts valid for `extension`.
+
+        Args:
+            n (int): Number of salts.
+            extension (Optional[Extension]): Extension of the orders, its hash is computed once for all salts.
+        """
+        base_salts = self.base_salts(n)
+        if extension is None or extension.is_empty():
+            return base_salts
+
+        extension_hash = extension.keccak256() & UINT_160_MAX
+        return [(base_salt << 160) | extension_hash for base_salt in base_salts]
+
+
+_generators: "weakref.WeakSet[SaltGenerator]" = weakref.WeakSet()
+
+
+def _reset_after_fork() -> None:
+    # Runs in the child right after the fork, while it has a single thread
+    for generator in list(_generators):
+        generator._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+default_salt_generator = SaltGenerator()
@@ -1 +1,2 @@
 from limit_order_sdk.limit_order_contract.limit_order_contract import LimitOrderContract
+from limit_order_sdk.limit_order_contract.cancel_calls import CancelCall, CancelFunction, build_cancel_calls
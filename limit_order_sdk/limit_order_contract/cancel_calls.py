@@ -0,0 +1,134 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from limit_order_sdk.chain_context import ChainLike
+from limit_order_sdk.limit_order import LimitOrder
+from limit_order_sdk.limit_order_contract.limit_order_contract import LimitOrderContract
+from limit_order_sdk.metrics.instrumented import instrumented
+
+# Rough gas costs, only used to compare the ways to cancel a group of orders
+TX_GAS = 21000
+STORAGE_WRITE_GAS = 22100  # first write of a storage slot in a transaction
+DIRTY_STORAGE_WRITE_GAS = 100  # next writes of the same slot
+CALL_GAS = 2500  # calldata and event of a single-order call
+CANCEL_ENTRY_GAS = 3000  # calldata, loop and event of every `cancelOrders` entry
+
+
+class CancelFunction:
+    CANCEL_ORDER = "cancelOrder"
+    CANCEL_ORDERS = "cancelOrders"
+    BITS_INVALIDATE_FOR_ORDER = "bitsInvalidateForOrder"
+    INCREASE_EPOCH = "increaseEpoch"
+
+
+@dataclass
+class CancelCall:
+    """
+    Single transaction of a cancel plan, to be sent by the orders maker to the limit order contract.
+
+    Attributes:
+        function (str): Contract function, one of `CancelFunction`.
+        calldata (str): Encoded call.
+        order_hashes (List[str]): Hashes of the orders invalidated by the call.
+        gas (int): Rough gas estimate the plan was built with.
+    """
+
+    function: str
+    calldata: str
+    order_hashes: List[str] = field(default_factory=list)
+    gas: int = 0
+
+
+def _batch_gas(orders: Sequence[LimitOrder]) -> int:
+    # Cost of `orders` as entries of `cancelOrders`, bit invalidator orders of one slot share a storage write
+    gas = 0
+    slots = set()
+    for order in orders:
+        traits = order.maker_traits
+        gas += CANCEL_ENTRY_GAS
+        if traits.is_bit_invalidator_mode():
+            slot = traits.nonce_or_epoch() >> 8
+            gas += DIRTY_STORAGE_WRITE_GAS if slot in slots else STORAGE_WRITE_GAS
+            slots.add(slot)
+        else:
+            gas += STORAGE_WRITE_GAS
+    return gas
+
+
+def _standalone_gas() -> int:
+    # `bitsInvalidateForOrder` and `increaseEpoch` both write a single slot
+    return TX_GAS + CALL_GAS + STORAGE_WRITE_GAS
+
+
+@instrumented("cancel_calls.build_cancel_calls")
+def build_cancel_calls(orders: Sequence[LimitOrder], chain_id: ChainLike, order_hashes: Optional[Sequence[str]] = None, allow_epoch_bump: bool = False) -> List[CancelCall]:
+    """
+    Builds the cheapest set of calls cancelling all `orders` of a single maker.
+
+    Orders are grouped the ways the contract can invalidate them at once:
+    - bit invalidator orders sharing a 256-nonce slot, by one `bitsInvalidateForOrder` with the other nonces in `additionalMask`,
+    - epoch managed orders of one series and epoch, by one `increaseEpoch`, only with `allow_epoch_bump`,
+    - everything else by hash, in a single `cancelOrders` (`cancelOrder` for one order).
+    A group gets its own call only when it is estimated to be cheaper than cancelling its orders in `cancelOrders`.
+
+    Args:
+        orders (Sequence[LimitOrder]): Orders to cancel, all of the same maker.
+        chain_id (ChainLike): Chain id or context of the chain the orders are signed for.
+        order_hashes (Optional[Sequence[str]]): Hashes of `orders`, computed with `LimitOrder.get_order_hashes` if not set.
+        allow_epoch_bump (bool): Allows `increaseEpoch`. It invalidates every order of the maker with that series and epoch,
+            not only the given ones, and makes orders signed for the next epoch valid, so set it only when cancelling a whole series.
+
+    Returns:
+        List[CancelCall]: Calls to send, every order is invalidated by exactly one of them.
+    """
+    if not orders:
+        return []
+    assert all(order.maker == orders[0].maker for order in orders), "All orders must be of the same maker"
+    if order_hashes is None:
+        order_hashes = LimitOrder.get_order_hashes(orders, chain_id)
+    assert len(order_hashes) == len(orders), "orders/order_hashes length mismatch"
+
+    groups: Dict[Tuple[str, int, int], List[int]] = {}
+    series_epochs: Dict[int, set] = {}
+    for i, order in enumerate(orders):
+        traits = order.maker_traits
+        if allow_epoch_bump and traits.is_epoch_manager_enabled():
+            groups.setdefault((CancelFunction.INCREASE_EPOCH, traits.series(), traits.nonce_or_epoch()), []).append(i)
+            series_epochs.setdefault(traits.series(), set()).add(traits.nonce_or_epoch())
+        elif traits.is_bit_invalidator_mode():
+            groups.setdefault((CancelFunction.BITS_INVALIDATE_FOR_ORDER, traits.nonce_or_epoch() >> 8, 0), []).append(i)
+        else:
+            groups.setdefault((CancelFunction.CANCEL_ORDERS, 0, 0), []).append(i)
+
+    calls: List[CancelCall] = []
+    by_hash: List[int] = []
+    for (function, key, _), indices in groups.items():
+        batch_gas = _batch_gas([orders[i] for i in indices])
+        if len(groups) == 1:
+            batch_gas += TX_GAS  # the group would be the whole `cancelOrders` transaction
+        # Bumping a series with orders of several epochs would revive orders signed for the next one
+        is_bumpable = function == CancelFunction.INCREASE_EPOCH and len(series_epochs[key]) == 1
+        if function == CancelFunction.CANCEL_ORDERS or len(indices) == 1 or (function == CancelFunction.INCREASE_EPOCH and not is_bumpable) or _standalone_gas() >= batch_gas:
+            by_hash.extend(indices)
+            continue
+
+        hashes = [order_hashes[i] for i in indices]
+        if function == CancelFunction.INCREASE_EPOCH:
+            calldata = LimitOrderContract.get_increase_epoch_calldata(key)
+        else:
+            traits = orders[indices[0]].maker_traits
+            mask = 0
+            for i in indices[1:]:
+                mask |= 1 << (orders[i].maker_traits.nonce_or_epoch() & 0xFF)
+            calldata = LimitOrderContract.get_bits_invalidate_for_order_calldata(traits, mask)
+        calls.append(CancelCall(function, calldata, hashes, _standalone_gas()))
+
+    if len(by_hash) == 1:
+        i = by_hash[0]
+        calldata = LimitOrderContract.get_cancel_order_calldata(orders[i].maker_traits, order_hashes[i])
+        calls.insert(0, CancelCall(CancelFunction.CANCEL_ORDER, calldata, [order_hashes[i]], TX_GAS + _batch_gas([orders[i]])))
+    elif by_hash:
+        by_hash.sort()
+        calldata = LimitOrderContract.get_cancel_orders_calldata([orders[i].maker_traits for i in by_hash], [order_hashes[i] for i in by_hash])
+        calls.insert(0, CancelCall(CancelFunction.CANCEL_ORDERS, calldata, [order_hashes[i] for i in by_hash], TX_GAS + _batch_gas([orders[i] for i in by_hash])))
+    return calls
@@ -1,13 +1,29 @@
-from web3.contract import Contract
+from functools import lru_cache
+from typing import Any, Sequence
 import os
 
 from limit_order_sdk.constants import ZX
 from limit_order_sdk.utils import get_contract_web3, signature_to_r_vs
-from limit_order_sdk.limit_order import TakerTraits, LimitOrderV4Struct
+from limit_order_sdk.limit_order import MakerTraits, TakerTraits, LimitOrderV4Struct
+from limit_order_sdk.metrics.instrumented import instrumented
 
 
 path = os.path.join(os.path.dirname(__file__), "AggregationRouterV6.abi.json")
-lop_contract: Contract = get_contract_web3(path)
+
+
+@lru_cache(maxsize=None)
+def get_lop_contract():
+    """
+    Returns the web3 contract for the router ABI, parsing it on first use.
+    """
+    return get_contract_web3(path)
+
+
+def __getattr__(name: str) -> Any:
+    # `lop_contract` used to be built at import time, keep it reachable without paying for web3 upfront
+    if name == "lop_contract":
+        return get_lop_contract()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class LimitOrderContract:
@@ -16,6 +32,7 @@ class LimitOrderContract:
     """
 
     @staticmethod
+    @instrumented("limit_order_contract.get_fill_order_calldata")
     def get_fill_order_calldata(order: LimitOrderV4Struct, signature: str, taker_traits: TakerTraits, amount: int) -> str:
         """
         Fill order WITHOUT an extension and taker interaction.
@@ -32,9 +49,10 @@ class LimitOrderContract:
 
         assert args == ZX, "takerTraits contains args data, use LimitOrderContract.get_fill_order_args_calldata method"
 
-        return lop_contract.encodeABI(fn_name="fillOrder", args=[order.to_int_tuple(), r, vs, amount, trait])
+        return get_lop_contract().encodeABI(fn_name="fillOrder", args=[order.to_int_tuple(), r, vs, amount, trait])
 
     @staticmethod
+    @instrumented("limit_order_contract.get_fill_contract_order_calldata")
     def get_fill_contract_order_calldata(order: LimitOrderV4Struct, signature: str, taker_traits: TakerTraits, amount: int) -> str:
         """
         Fill contract order (order maker is a smart contract) WITHOUT an extension and taker interaction.
@@ -50,9 +68,10 @@ class LimitOrderContract:
 
         assert args == ZX, "takerTraits contains args data, use LimitOrderContract.get_fill_contract_order_args_calldata method"
 
-        return lop_contract.encodeABI(fn_name="fillContractOrder", args=[order.to_int_tuple(), signature, amount, trait])
+        return get_lop_contract().encodeABI(fn_name="fillContractOrder", args=[order.to_int_tuple(), signature, amount, trait])
 
     @staticmethod
+    @instrumented("limit_order_contract.get_fill_order_args_calldata")
     def get_fill_order_args_calldata(order: LimitOrderV4Struct, signature: str, taker_traits: TakerTraits, amount: int) -> str:
         """
         Fill order WITH an extension or taker interaction.
@@ -67,9 +86,10 @@ class LimitOrderContract:
         encoded_taker_traits = taker_traits.encode()
         trait, args = encoded_taker_traits['trait'], encoded_taker_traits['args']
 
-        return lop_contract.encodeABI(fn_name="fillOrderArgs", args=[order.to_int_tuple(), r, vs, amount, trait, args])
+        return get_lop_contract().encodeABI(fn_name="fillOrderArgs", args=[order.to_int_tuple(), r, vs, amount, trait, args])
 
     @staticmethod
+    @instrumented("limit_order_contract.get_fill_contract_order_args_calldata")
     def get_fill_contract_order_args_calldata(order: LimitOrderV4Struct, signature: str, taker_traits: TakerTraits, amount: int) -> str:
         """
         Fill contract order (order maker is a smart contract) WITH an extension or taker interaction.
@@ -83,4 +103,65 @@ class LimitOrderContract:
         encoded_taker_traits = taker_traits.encode()
         trait, args = encoded_taker_traits['trait'], encoded_taker_traits['args']
 
-        return lop_contract.encodeABI(fn_name="fillContractOrderArgs", args=[order.to_int_tuple(), signature, amount, trait, args])
+        return get_lop_contract().encodeABI(fn_name="fillContractOrderArgs", args=[order.to_int_tuple(), signature, amount, trait, args])
+
+    @staticmethod
+    @instrumented("limit_order_contract.get_cancel_order_calldata")
+    def get_cancel_order_calldata(maker_traits: MakerTraits, order_hash: str) -> str:
+        """
+        Cancel single order, the transaction must be sent by the order maker.
+
+        :param maker_traits: MakerTraits, traits of the order.
+        :param order_hash: str, hash of the order.
+        :return: str, calldata for the cancelOrder function.
+        """
+        return get_lop_contract().encodeABI(fn_name="cancelOrder", args=[maker_traits.as_int(), order_hash])
+
+    @staticmethod
+    @instrumented("limit_order_contract.get_cancel_orders_calldata")
+    def get_cancel_orders_calldata(maker_traits: Sequence[MakerTraits], order_hashes: Sequence[str]) -> str:
+        """
+        Cancel many orders in one call, the transaction must be sent by the orders maker.
+
+        :param maker_traits: Sequence[MakerTraits], traits of the orders.
+        :param order_hashes: Sequence[str], hashes of the orders, in the same order.
+        :return: str, calldata for the cancelOrders function.
+        """
+        assert len(maker_traits) == len(order_hashes), "maker_traits/order_hashes length mismatch"
+        return get_lop_contract().encodeABI(fn_name="cancelOrders", args=[[traits.as_int() for traits in maker_traits], list(order_hashes)])
+
+    @staticmethod
+    @instrumented("limit_order_contract.get_bits_invalidate_for_order_calldata")
+    def get_bits_invalidate_for_order_calldata(maker_traits: MakerTraits, additional_mask: int = 0) -> str:
+        """
+        Invalidate bit invalidator orders: the bit of `maker_traits` nonce and `additional_mask` bits of the same 256-nonce slot.
+
+        :param maker_traits: MakerTraits, traits with the nonce selecting the slot.
+        :param additional_mask: int, other bits of the slot to invalidate.
+        :return: str, calldata for the bitsInvalidateForOrder function.
+        """
+        return get_lop_contract().encodeABI(fn_name="bitsInvalidateForOrder", args=[maker_traits.as_int(), additional_mask])
+
+    @staticmethod
+    @instrumented("limit_order_contract.get_increase_epoch_calldata")
+    def get_increase_epoch_calldata(series: int) -> str:
+        """
+        Increase maker epoch of `series` by one, invalidating all orders of the series with the current epoch.
+
+        :param series: int, epoch series.
+        :return: str, calldata for the increaseEpoch function.
+        """
+        return get_lop_contract().encodeABI(fn_name="increaseEpoch", args=[series])
+
+    @staticmethod
+    @instrumented("limit_order_contract.get_advance_epoch_calldata")
+    def get_advance_epoch_calldata(series: int, amount: int) -> str:
+        """
+        Increase maker epoch of `series` by `amount` (from 1 to 255).
+
+        :param series: int, epoch series.
+        :param amount: int, epoch increment.
+        :return: str, calldata for the advanceEpoch function.
+        """
+        assert 0 < amount <= 255, "amount must be from 1 to 255"
+        return get_lop_contract().encodeABI(fn_name="advanceEpoch", args=[series, amount])
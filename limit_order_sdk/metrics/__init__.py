@@ -0,0 +1,2 @@
+from limit_order_sdk.metrics.sinks import MetricsSink, CallbackSink, InMemoryRecorder, PrometheusSink
+from limit_order_sdk.metrics.instrumented import instrumented, set_metrics_sink, get_metrics_sink
@@ -0,0 +1,53 @@
+import functools
+import time
+from typing import Callable, Optional, TypeVar
+
+from limit_order_sdk.metrics.sinks import MetricsSink
+
+F = TypeVar("F", bound=Callable)
+
+# Module-level on purpose: while no sink is set, an instrumented call costs one global lookup and a comparison
+_sink: Optional[MetricsSink] = None
+
+
+def set_metrics_sink(sink: Optional[MetricsSink]) -> None:
+    """
+    Routes measurements of instrumented SDK calls to `sink`. Pass None to disable instrumentation.
+    """
+    global _sink
+    _sink = sink
+
+
+def get_metrics_sink() -> Optional[MetricsSink]:
+    """Returns the current sink or None if instrumentation is disabled."""
+    return _sink
+
+
+def instrumented(name: str) -> Callable[[F], F]:
+    """
+    Decorator reporting every call of the wrapped function to the current metrics sink as `name`.
+
+    Args:
+        name (str): Operation name passed to `MetricsSink.observe`.
+    """
+
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            sink = _sink
+            if sink is None:
+                return fn(*args, **kwargs)
+
+            start = time.perf_counter()
+            error = False
+            try:
+                return fn(*args, **kwargs)
+            except BaseException:
+                error = True
+                raise
+            finally:
+                sink.observe(name, time.perf_counter() - start, error)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
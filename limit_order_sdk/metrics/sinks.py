@@ -0,0 +1,91 @@
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Any, Callable, Dict, List
+
+
+class MetricsSink(ABC):
+    """
+    Receives measurements from instrumented SDK calls.
+
+    Every instrumented call results in exactly one `observe` call, so a sink can derive both
+    call counters and timing histograms from it.
+    """
+
+    @abstractmethod
+    def observe(self, name: str, duration: float, error: bool) -> None:
+        """
+        Args:
+            name (str): Name of the instrumented operation, e.g. `limit_order.get_order_hash`.
+            duration (float): Wall time of the call in seconds.
+            error (bool): True if the call raised an exception.
+        """
+
+
+class CallbackSink(MetricsSink):
+    """
+    Forwards every measurement to `callback(name, duration, error)`.
+    """
+
+    def __init__(self, callback: Callable[[str, float, bool], Any]):
+        self.callback = callback
+
+    def observe(self, name: str, duration: float, error: bool) -> None:
+        self.callback(name, duration, error)
+
+
+class InMemoryRecorder(MetricsSink):
+    """
+    Keeps all measurements in memory. Meant for tests and ad-hoc profiling.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = defaultdict(int)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+
+    def observe(self, name: str, duration: float, error: bool) -> None:
+        with self._lock:
+            self.counts[name] += 1
+            self.durations[name].append(duration)
+            if error:
+                self.errors[name] += 1
+
+    def total_time(self, name: str) -> float:
+        """Returns the summed duration of all `name` calls in seconds."""
+        return sum(self.durations.get(name, []))
+
+    def clear(self) -> None:
+        with self._lock:
+            self.counts.clear()
+            self.errors.clear()
+            self.durations.clear()
+
+
+class PrometheusSink(MetricsSink):
+    """
+    Exports measurements to a `prometheus_client` registry:
+    - `{namespace}_calls_total{operation}` counter
+    - `{namespace}_errors_total{operation}` counter
+    - `{namespace}_duration_seconds{operation}` histogram
+
+    `prometheus_client` is not a dependency of the SDK and has to be installed separately.
+    """
+
+    def __init__(self, registry: Any = None, namespace: str = "limit_order_sdk"):
+        try:
+            from prometheus_client import REGISTRY, Counter, Histogram
+        except ImportError as e:
+            raise ImportError("PrometheusSink requires `prometheus_client`, install it with `pip install prometheus-client`") from e
+
+        registry = registry if registry is not None else REGISTRY
+        self.calls = Counter(f"{namespace}_calls_total", "Instrumented SDK calls", ["operation"], registry=registry)
+        self.errors = Counter(f"{namespace}_errors_total", "Instrumented SDK calls that raised", ["operation"], registry=registry)
+        self.duration = Histogram(f"{namespace}_duration_seconds", "Duration of instrumented SDK calls", ["operation"], registry=registry)
+
+    def observe(self, name: str, duration: float, error: bool) -> None:
+        self.calls.labels(name).inc()
+        self.duration.labels(name).observe(duration)
+        if error:
+            self.errors.labels(name).inc()
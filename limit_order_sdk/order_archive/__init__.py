@@ -0,0 +1,2 @@
+from limit_order_sdk.order_archive.record import *
+from limit_order_sdk.order_archive.archive import OrderArchiveWriter, OrderArchiveReader
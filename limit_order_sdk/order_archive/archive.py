@@ -0,0 +1,204 @@
+import mmap
+import struct
+import sys
+from array import array
+from typing import Iterator, List, Optional, Tuple
+
+from limit_order_sdk.chain_context import ChainLike, get_chain_context
+from limit_order_sdk.libs.byte_utils import trim_0x
+from limit_order_sdk.limit_order import LimitOrder
+from limit_order_sdk.order_archive.record import OrderRecord, decode_order_record, encode_order_record
+
+# Archive is a pair of files:
+#
+# `<path>`      - data file: header followed by order records one after another
+#                 | magic, 8 bytes | version, uint32 | record | record | ...
+#
+# `<path>.idx`  - index file, written when the writer is closed:
+#                 | magic, 8 bytes | version, uint32 | chain id, uint64 | count, uint64 |
+#                 | record offsets, count * uint64 |
+#                 | (order hash, 32 bytes, record index, uint64) * count, sorted by order hash |
+#
+# Both files are memory-mapped by the reader, so opening is O(1) regardless of archive size,
+# access by index is O(1) and access by order hash is a binary search over the mapped index.
+
+DATA_MAGIC = b"LOSDKORD"
+INDEX_MAGIC = b"LOSDKIDX"
+VERSION = 1
+
+DATA_HEADER = struct.Struct(">8sI")
+INDEX_HEADER = struct.Struct(">8sIQQ")
+OFFSET = struct.Struct(">Q")
+HASH_ENTRY = struct.Struct(">32sQ")
+
+
+def index_path(path: str) -> str:
+    return path + ".idx"
+
+
+class OrderArchiveWriter:
+    """
+    Appends orders to a new archive at `path`. The index is written on `close()`,
+    an archive without index can not be opened by `OrderArchiveReader`.
+
+    Example:
+        with OrderArchiveWriter("orders.bin", chain_id=1) as writer:
+            writer.append(order, signature)
+    """
+
+    def __init__(self, path: str, chain_id: ChainLike):
+        self.path = path
+        self.chain = get_chain_context(chain_id)
+        self.chain_id = self.chain.chain_id
+        self._file = open(path, "wb")
+        self._file.write(DATA_HEADER.pack(DATA_MAGIC, VERSION))
+        self._offsets = array("Q")
+        self._hashes: List[bytes] = []
+        self._position = DATA_HEADER.size
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def append(self, order: LimitOrder, signature: str, order_hash: Optional[str] = None) -> int:
+        """
+        Appends order to the archive.
+
+        Args:
+            order (LimitOrder): The order to store.
+            signature (str): Order signature.
+            order_hash (Optional[str]): Precomputed order hash for the archive chain, computed when omitted.
+
+        Returns:
+            int: Index of the stored order.
+        """
+        return self.append_record(encode_order_record(order, signature), order_hash or order.get_order_hash(self.chain))
+
+    def append_record(self, record: bytes, order_hash: str) -> int:
+        """
+        Appends a record encoded with `encode_order_record`, e.g. by `IngestPipeline`, without decoding it.
+
+        Args:
+            record (bytes): The encoded record.
+            order_hash (str): Order hash for the archive chain.
+
+        Returns:
+            int: Index of the stored order.
+        """
+        self._file.write(record)
+        self._offsets.append(self._position)
+        self._hashes.append(bytes.fromhex(trim_0x(order_hash)))
+        self._position += len(record)
+        return len(self._offsets) - 1
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._file.close()
+
+        entries = sorted(zip(self._hashes, range(len(self._hashes))))
+        with open(index_path(self.path), "wb") as f:
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, VERSION, self.chain_id, len(self._offsets)))
+            offsets = array("Q", self._offsets)
+            if sys.byteorder == "little":
+                offsets.byteswap()  # array uses native byte order, the index is big-endian
+            f.write(offsets.tobytes())
+            f.write(b"".join(HASH_ENTRY.pack(order_hash, index) for order_hash, index in entries))
+
+    def __enter__(self) -> "OrderArchiveWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class OrderArchiveReader:
+    """
+    Random access reader of an archive created by `OrderArchiveWriter`.
+    Records are decoded only when accessed.
+
+    Example:
+        with OrderArchiveReader("orders.bin") as archive:
+            record = archive[42]
+            record = archive.get_by_hash(order_hash)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._data_file = open(path, "rb")
+        self._index_file = open(index_path(path), "rb")
+        self._data = mmap.mmap(self._data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version = DATA_HEADER.unpack_from(self._data, 0)
+        if magic != DATA_MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not an order archive of version {VERSION}")
+
+        magic, version, self.chain_id, self._count = INDEX_HEADER.unpack_from(self._index, 0)
+        if magic != INDEX_MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{index_path(path)} is not an order archive index of version {VERSION}")
+
+        self._offsets_start = INDEX_HEADER.size
+        self._hashes_start = self._offsets_start + self._count * OFFSET.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> OrderRecord:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("order archive index out of range")
+        record, _ = decode_order_record(self._data, self.offset(index))
+        return record
+
+    def __iter__(self) -> Iterator[OrderRecord]:
+        # Records are stored back to back, so a sequential scan does not need the offsets table
+        pos = DATA_HEADER.size
+        for _ in range(self._count):
+            record, pos = decode_order_record(self._data, pos)
+            yield record
+
+    def offset(self, index: int) -> int:
+        """Returns the data file offset of the record at `index`."""
+        (offset,) = OFFSET.unpack_from(self._index, self._offsets_start + index * OFFSET.size)
+        return offset
+
+    def find(self, order_hash: str) -> Optional[int]:
+        """
+        Returns the index of the first order with `order_hash` or None if the archive does not contain it.
+        """
+        target = bytes.fromhex(trim_0x(order_hash))
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._hash_entry(mid)[0] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo < self._count:
+            entry_hash, index = self._hash_entry(lo)
+            if entry_hash == target:
+                return index
+        return None
+
+    def get_by_hash(self, order_hash: str) -> Optional[OrderRecord]:
+        index = self.find(order_hash)
+        return None if index is None else self[index]
+
+    def _hash_entry(self, position: int) -> Tuple[bytes, int]:
+        return HASH_ENTRY.unpack_from(self._index, self._hashes_start + position * HASH_ENTRY.size)
+
+    def close(self) -> None:
+        self._data.close()
+        self._index.close()
+        self._data_file.close()
+        self._index_file.close()
+
+    def __enter__(self) -> "OrderArchiveReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
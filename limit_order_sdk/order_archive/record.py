@@ -0,0 +1,103 @@
+import struct
+from dataclasses import dataclass
+from typing import Tuple, Union
+
+from limit_order_sdk.libs.byte_utils import add_0x, trim_0x
+from limit_order_sdk.limit_order import LimitOrder, LimitOrderV4Struct, default_extension_cache
+
+# Compact binary order record:
+#
+#     | order head, 256 bytes | extension length, uint32 | extension | signature length, uint16 | signature |
+#
+# The head holds the 8 order struct fields as big-endian 32 bytes words, exactly like the ABI encoding
+# returned by `LimitOrder.to_calldata`, so it can be used as calldata as is.
+
+ORDER_HEAD_SIZE = 256
+WORD_SIZE = 32
+EXTENSION_LENGTH = struct.Struct(">I")
+SIGNATURE_LENGTH = struct.Struct(">H")
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+@dataclass
+class OrderRecord:
+    order: LimitOrder
+    signature: str
+
+
+def encode_order_head(order: LimitOrderV4Struct) -> bytes:
+    """Encodes order struct as 8 big-endian 32 bytes words."""
+    return b"".join(word.to_bytes(WORD_SIZE, byteorder="big") for word in order.to_int_tuple())
+
+
+def decode_order_head(buf: BytesLike, offset: int = 0) -> LimitOrderV4Struct:
+    """Decodes order struct from 256 bytes starting at `offset`."""
+    head = bytes(buf[offset : offset + ORDER_HEAD_SIZE])
+    if len(head) != ORDER_HEAD_SIZE:
+        raise ValueError(f"Order head must be {ORDER_HEAD_SIZE} bytes, got {len(head)}")
+
+    def word(i: int) -> int:
+        return int.from_bytes(head[i * WORD_SIZE : (i + 1) * WORD_SIZE], byteorder="big")
+
+    def address(i: int) -> str:
+        return "0x" + head[i * WORD_SIZE + 12 : (i + 1) * WORD_SIZE].hex()
+
+    return LimitOrderV4Struct(
+        salt=word(0),
+        maker=address(1),
+        receiver=address(2),
+        makerAsset=address(3),
+        takerAsset=address(4),
+        makingAmount=word(5),
+        takingAmount=word(6),
+        makerTraits=word(7),
+    )
+
+
+def encode_order_record(order: LimitOrder, signature: str) -> bytes:
+    """
+    Encodes order, its extension and signature into a single binary record.
+
+    Args:
+        order (LimitOrder): The order to encode.
+        signature (str): 0x prefixed hex signature, may be empty (`0x`).
+
+    Returns:
+        bytes: The encoded record.
+    """
+    extension = bytes.fromhex(trim_0x(order.extension.encode()))
+    sig = bytes.fromhex(trim_0x(signature))
+    return b"".join([encode_order_head(order.build()), EXTENSION_LENGTH.pack(len(extension)), extension, SIGNATURE_LENGTH.pack(len(sig)), sig])
+
+
+def record_size(buf: BytesLike, offset: int = 0) -> int:
+    """Returns the size of the record starting at `offset` without decoding it."""
+    pos = offset + ORDER_HEAD_SIZE
+    (extension_length,) = EXTENSION_LENGTH.unpack_from(buf, pos)
+    pos += EXTENSION_LENGTH.size + extension_length
+    (signature_length,) = SIGNATURE_LENGTH.unpack_from(buf, pos)
+    return pos + SIGNATURE_LENGTH.size + signature_length - offset
+
+
+def decode_order_record(buf: BytesLike, offset: int = 0) -> Tuple[OrderRecord, int]:
+    """
+    Decodes a record starting at `offset`.
+
+    Returns:
+        Tuple[OrderRecord, int]: The decoded record and the offset right after it.
+    """
+    data = decode_order_head(buf, offset)
+    pos = offset + ORDER_HEAD_SIZE
+
+    (extension_length,) = EXTENSION_LENGTH.unpack_from(buf, pos)
+    pos += EXTENSION_LENGTH.size
+    extension = add_0x(bytes(buf[pos : pos + extension_length]).hex())
+    pos += extension_length
+
+    (signature_length,) = SIGNATURE_LENGTH.unpack_from(buf, pos)
+    pos += SIGNATURE_LENGTH.size
+    signature = add_0x(bytes(buf[pos : pos + signature_length]).hex())
+    pos += signature_length
+
+    return OrderRecord(order=LimitOrder.from_data_and_extension(data, default_extension_cache.decode(extension)), signature=signature), pos
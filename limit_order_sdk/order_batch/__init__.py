@@ -0,0 +1,2 @@
+from limit_order_sdk.order_batch.order_batch import OrderBatch, IndexMask
+from limit_order_sdk.order_batch.batch_validator import ValidationReason, describe_reasons, validate_orders
@@ -0,0 +1,134 @@
+import re
+import time
+from array import array
+from typing import Iterable, List, Optional
+
+from limit_order_sdk.libs.byte_utils import UINT_40_MAX, UINT_160_MAX, UINT_256_MAX
+from limit_order_sdk.limit_order import Extension, LimitOrder, MakerTraits
+from limit_order_sdk.metrics.instrumented import instrumented
+
+HEX_BYTES_REGEX = re.compile(r"0x(?:[0-9a-fA-F]{2})*")
+
+
+class ValidationReason:
+    """
+    Reasons an order is rejected, as bits of the per-order code returned by `validate_orders`. 0 is a valid order.
+
+    - `MAKING_AMOUNT_RANGE`, `TAKING_AMOUNT_RANGE`, `SALT_RANGE`, `MAKER_TRAITS_RANGE` - value is not an uint256
+    - `INVALID_EXTENSION`            - an extension field is not a hex string of whole bytes
+    - `SALT_EXTENSION_MISMATCH`      - lowest 160 bits of the salt are not the extension hash
+    - `EPOCH_IN_BIT_INVALIDATOR`     - epoch manager check without both partial and multiple fills allowed
+    - `EXPIRED`                      - expiration is set and less than the validation time
+    - `MISSING_EXTENSION_FLAG`       - extension is not empty and `HAS_EXTENSION_FLAG` is not set, the protocol ignores it
+    - `EXTENSION_FLAG_WITHOUT_DATA`  - `HAS_EXTENSION_FLAG` is set for an empty extension
+    - `MISSING_PRE_INTERACTION_FLAG`, `MISSING_POST_INTERACTION_FLAG` - extension has the interaction, the flag is not set so it is never called
+    - `PRE_INTERACTION_WITHOUT_DATA`, `POST_INTERACTION_WITHOUT_DATA` - the flag is set without the interaction, the protocol calls the maker instead
+    """
+
+    MAKING_AMOUNT_RANGE = 1 << 0
+    TAKING_AMOUNT_RANGE = 1 << 1
+    SALT_RANGE = 1 << 2
+    MAKER_TRAITS_RANGE = 1 << 3
+    INVALID_EXTENSION = 1 << 4
+    SALT_EXTENSION_MISMATCH = 1 << 5
+    EPOCH_IN_BIT_INVALIDATOR = 1 << 6
+    EXPIRED = 1 << 7
+    MISSING_EXTENSION_FLAG = 1 << 8
+    EXTENSION_FLAG_WITHOUT_DATA = 1 << 9
+    MISSING_PRE_INTERACTION_FLAG = 1 << 10
+    PRE_INTERACTION_WITHOUT_DATA = 1 << 11
+    MISSING_POST_INTERACTION_FLAG = 1 << 12
+    POST_INTERACTION_WITHOUT_DATA = 1 << 13
+
+
+REASON_NAMES = [name for name, value in vars(ValidationReason).items() if isinstance(value, int)]
+
+_HAS_EXTENSION = 1 << MakerTraits.HAS_EXTENSION_FLAG
+_PRE_INTERACTION = 1 << MakerTraits.PRE_INTERACTION_CALL_FLAG
+_POST_INTERACTION = 1 << MakerTraits.POST_INTERACTION_CALL_FLAG
+_NEED_CHECK_EPOCH = 1 << MakerTraits.NEED_CHECK_EPOCH_MANAGER_FLAG
+_NO_PARTIAL_FILLS = 1 << MakerTraits.NO_PARTIAL_FILLS_FLAG
+_ALLOW_MULTIPLE_FILLS = 1 << MakerTraits.ALLOW_MULTIPLE_FILLS_FLAG
+
+
+def describe_reasons(code: int) -> List[str]:
+    """Returns names of the `ValidationReason` bits set in `code`."""
+    return [name for name in REASON_NAMES if code & getattr(ValidationReason, name)]
+
+
+def _is_uint256(value) -> bool:
+    return isinstance(value, int) and 0 <= value <= UINT_256_MAX
+
+
+def _extension_reasons(extension: Extension, salt: int, salt_valid: bool) -> int:
+    values = extension.get_all() + [extension.custom_data]
+    if not all(isinstance(value, str) and HEX_BYTES_REGEX.fullmatch(value) for value in values):
+        return ValidationReason.INVALID_EXTENSION
+    if salt_valid and not extension.is_empty() and (salt & UINT_160_MAX) != (extension.keccak256() & UINT_160_MAX):
+        return ValidationReason.SALT_EXTENSION_MISMATCH
+    return 0
+
+
+@instrumented("order_batch.validate_orders")
+def validate_orders(orders: Iterable[LimitOrder], now: Optional[int] = None) -> "array[int]":
+    """
+    Checks every order against the rules of the protocol and returns one `ValidationReason` code per order,
+    0 for a valid order. Never raises on invalid orders and doesn't rely on `assert`, so it works under `python -O`
+    and on orders whose fields were changed after construction.
+
+    Args:
+        orders (Iterable[LimitOrder]): Orders to check.
+        now (Optional[int]): Unix timestamp orders are checked for expiration at, current time if not set.
+
+    Returns:
+        array[int]: Unsigned 32-bit codes in the order of `orders`, see `describe_reasons`.
+    """
+    now = int(time.time()) if now is None else now
+    expiration_offset = MakerTraits.EXPIRATION_MASK.offset
+    codes = array("I")
+    for order in orders:
+        code = 0
+        if not _is_uint256(order.making_amount):
+            code |= ValidationReason.MAKING_AMOUNT_RANGE
+        if not _is_uint256(order.taking_amount):
+            code |= ValidationReason.TAKING_AMOUNT_RANGE
+        salt_valid = _is_uint256(order.salt)
+        if not salt_valid:
+            code |= ValidationReason.SALT_RANGE
+
+        traits = order.maker_traits.as_int()
+        if not _is_uint256(traits):
+            codes.append(code | ValidationReason.MAKER_TRAITS_RANGE)
+            continue
+
+        extension = order.extension
+        extension_code = _extension_reasons(extension, order.salt, salt_valid)
+        code |= extension_code
+
+        if traits & _NEED_CHECK_EPOCH and (traits & _NO_PARTIAL_FILLS or not traits & _ALLOW_MULTIPLE_FILLS):
+            code |= ValidationReason.EPOCH_IN_BIT_INVALIDATOR
+        expiration = (traits >> expiration_offset) & UINT_40_MAX
+        if expiration and expiration < now:
+            code |= ValidationReason.EXPIRED
+
+        if extension_code != ValidationReason.INVALID_EXTENSION:
+            has_data = not extension.is_empty()
+            if has_data and not traits & _HAS_EXTENSION:
+                code |= ValidationReason.MISSING_EXTENSION_FLAG
+            elif not has_data and traits & _HAS_EXTENSION:
+                code |= ValidationReason.EXTENSION_FLAG_WITHOUT_DATA
+
+            has_pre_interaction = len(extension.pre_interaction) > 2
+            if has_pre_interaction and not traits & _PRE_INTERACTION:
+                code |= ValidationReason.MISSING_PRE_INTERACTION_FLAG
+            elif not has_pre_interaction and traits & _PRE_INTERACTION:
+                code |= ValidationReason.PRE_INTERACTION_WITHOUT_DATA
+
+            has_post_interaction = len(extension.post_interaction) > 2
+            if has_post_interaction and not traits & _POST_INTERACTION:
+                code |= ValidationReason.MISSING_POST_INTERACTION_FLAG
+            elif not has_post_interaction and traits & _POST_INTERACTION:
+                code |= ValidationReason.POST_INTERACTION_WITHOUT_DATA
+
+        codes.append(code)
+    return codes
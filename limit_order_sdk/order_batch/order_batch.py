@@ -0,0 +1,188 @@
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Sequence
+
+from limit_order_sdk.address import Address
+from limit_order_sdk.libs.byte_utils import UINT_40_MAX, UINT_80_MAX
+from limit_order_sdk.limit_order import LimitOrder, MakerTraits
+
+# Index mask is a plain int used as a bitset: bit `i` is set when order `i` of the batch matches.
+# Masks are combined with `&`, `|` and `OrderBatch.invert`, which run in C over the whole batch at once.
+IndexMask = int
+
+# Number of precomputed cumulative expiration masks, see `OrderBatch.expired_at`
+EXPIRATION_CHECKPOINTS = 64
+
+ZERO_CHAR, ONE_CHAR = ord("0"), ord("1")
+
+
+class OrderBatch:
+    """
+    Column-wise container for a set of orders with vectorized predicates over maker traits and assets.
+
+    Every predicate returns an `IndexMask`, use `indices` or `select` to get matching orders:
+
+        batch = OrderBatch(orders)
+        mask = batch.for_pair(weth, usdc) & batch.allows_partial_fills() & batch.invert(batch.expired_at(now))
+        orders = batch.select(mask)
+    """
+
+    def __init__(self, orders: Iterable[LimitOrder]):
+        self.orders: List[LimitOrder] = list(orders)
+        self.making_amounts: List[int] = [order.making_amount for order in self.orders]
+        self.taking_amounts: List[int] = [order.taking_amount for order in self.orders]
+        self.salts: List[int] = [order.salt for order in self.orders]
+        self.traits: List[int] = [order.maker_traits.as_int() for order in self.orders]
+
+        # Assets are interned to small ids, so pair lookups group orders by id instead of comparing strings
+        self.assets: List[str] = []
+        self._asset_ids: Dict[str, int] = {}
+        self.maker_assets = array("I", [self._asset_id(order.maker_asset) for order in self.orders])
+        self.taker_assets = array("I", [self._asset_id(order.taker_asset) for order in self.orders])
+
+        # One byte per order for every 8 flag bits, so a flag mask is a single `bytes.translate`
+        self._flags_high = bytes(t >> 248 for t in self.traits)
+        self._flags_low = bytes((t >> 240) & 0xFF for t in self.traits)
+        self._private = bytes(1 if t & UINT_80_MAX else 0 for t in self.traits)
+        self.expirations = array("Q", [(t >> MakerTraits.EXPIRATION_MASK.offset) & UINT_40_MAX for t in self.traits])
+
+        self._maker_asset_masks: Dict[int, IndexMask] = {}
+        self._taker_asset_masks: Dict[int, IndexMask] = {}
+        self._expiration_order: List[int] = []
+        self._sorted_expirations: List[int] = []
+        self._expiration_step = 1
+        self._expiration_checkpoints: List[IndexMask] = []
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def _asset_id(self, asset: Address) -> int:
+        key = str(asset)
+        asset_id = self._asset_ids.get(key)
+        if asset_id is None:
+            asset_id = self._asset_ids[key] = len(self.assets)
+            self.assets.append(key)
+        return asset_id
+
+    def all(self) -> IndexMask:
+        """Returns mask matching every order of the batch."""
+        return (1 << len(self.orders)) - 1
+
+    def invert(self, mask: IndexMask) -> IndexMask:
+        """Returns mask matching orders not matched by `mask`."""
+        return ~mask & self.all()
+
+    @staticmethod
+    def count(mask: IndexMask) -> int:
+        """Returns the number of orders matched by `mask`."""
+        return mask.bit_count()
+
+    @staticmethod
+    def indices(mask: IndexMask) -> List[int]:
+        """Returns indices of orders matched by `mask` in ascending order."""
+        bits = bin(mask)[:1:-1]  # lowest bit first, without `0b` prefix
+        result: List[int] = []
+        i = bits.find("1")
+        while i != -1:
+            result.append(i)
+            i = bits.find("1", i + 1)
+        return result
+
+    def select(self, mask: IndexMask) -> List[LimitOrder]:
+        """Returns orders matched by `mask`."""
+        return [self.orders[i] for i in self.indices(mask)]
+
+    def _mask_from_column(self, column: bytes, table: bytes) -> IndexMask:
+        # `table` maps every column byte to ASCII "0"/"1", the reversed result is the mask in base 2
+        if not column:
+            return 0
+        return int(column.translate(table)[::-1], 2)
+
+    def _mask_from_indices(self, indices: Sequence[int]) -> IndexMask:
+        if not indices:
+            return 0
+        n = len(self.orders)
+        bits = bytearray(b"0") * n
+        for i in indices:
+            bits[n - 1 - i] = ONE_CHAR
+        return int(bits, 2)
+
+    def flag(self, bit: int) -> IndexMask:
+        """
+        Returns mask of orders having the maker traits flag `bit` set, e.g. `MakerTraits.USE_PERMIT2_FLAG`.
+        """
+        assert 240 <= bit <= 255, "Only flags in the high 16 bits of maker traits are supported"
+        column, shift = (self._flags_high, bit - 248) if bit >= 248 else (self._flags_low, bit - 240)
+        table = bytes(ONE_CHAR if (value >> shift) & 1 else ZERO_CHAR for value in range(256))
+        return self._mask_from_column(column, table)
+
+    def is_private(self) -> IndexMask:
+        """Returns mask of orders with a specific allowed sender."""
+        return self._mask_from_column(self._private, bytes([ZERO_CHAR, ONE_CHAR]) + bytes(254))
+
+    def allows_partial_fills(self) -> IndexMask:
+        return self.invert(self.flag(MakerTraits.NO_PARTIAL_FILLS_FLAG))
+
+    def allows_multiple_fills(self) -> IndexMask:
+        return self.flag(MakerTraits.ALLOW_MULTIPLE_FILLS_FLAG)
+
+    def is_bit_invalidator_mode(self) -> IndexMask:
+        return self.invert(self.allows_partial_fills() & self.allows_multiple_fills())
+
+    def has_extension(self) -> IndexMask:
+        return self.flag(MakerTraits.HAS_EXTENSION_FLAG)
+
+    def has_pre_interaction(self) -> IndexMask:
+        return self.flag(MakerTraits.PRE_INTERACTION_CALL_FLAG)
+
+    def has_post_interaction(self) -> IndexMask:
+        return self.flag(MakerTraits.POST_INTERACTION_CALL_FLAG)
+
+    def is_epoch_manager_enabled(self) -> IndexMask:
+        return self.flag(MakerTraits.NEED_CHECK_EPOCH_MANAGER_FLAG)
+
+    def is_permit2(self) -> IndexMask:
+        return self.flag(MakerTraits.USE_PERMIT2_FLAG)
+
+    def is_native_unwrap_enabled(self) -> IndexMask:
+        return self.flag(MakerTraits.UNWRAP_WETH_FLAG)
+
+    def for_pair(self, maker_asset: Address, taker_asset: Address) -> IndexMask:
+        """Returns mask of orders selling `maker_asset` for `taker_asset`."""
+        maker_id = self._asset_ids.get(str(maker_asset))
+        taker_id = self._asset_ids.get(str(taker_asset))
+        if maker_id is None or taker_id is None:
+            return 0
+        return self._asset_mask(maker_id, self.maker_assets, self._maker_asset_masks) & self._asset_mask(taker_id, self.taker_assets, self._taker_asset_masks)
+
+    def _asset_mask(self, asset_id: int, column: "array[int]", cache: Dict[int, IndexMask]) -> IndexMask:
+        mask = cache.get(asset_id)
+        if mask is None:
+            mask = cache[asset_id] = self._mask_from_indices([i for i, value in enumerate(column) if value == asset_id])
+        return mask
+
+    def expired_at(self, timestamp: int) -> IndexMask:
+        """
+        Returns mask of orders expired at `timestamp`, same as the protocol: expiration is set and less than `timestamp`.
+
+        Orders are sorted by expiration once, and cumulative masks are kept for `EXPIRATION_CHECKPOINTS` positions
+        of that order, so every call only has to add the orders between the nearest checkpoint and `timestamp`.
+        """
+        if not self._expiration_checkpoints:
+            self._build_expiration_index()
+
+        expired_count = bisect_left(self._sorted_expirations, timestamp)
+        step = self._expiration_step
+        checkpoint = expired_count // step
+        return self._expiration_checkpoints[checkpoint] | self._mask_from_indices(self._expiration_order[checkpoint * step : expired_count])
+
+    def _build_expiration_index(self) -> None:
+        self._expiration_order = sorted((i for i, expiration in enumerate(self.expirations) if expiration), key=self.expirations.__getitem__)
+        self._sorted_expirations = [self.expirations[i] for i in self._expiration_order]
+        self._expiration_step = max(1, -(-len(self._expiration_order) // EXPIRATION_CHECKPOINTS))
+
+        mask = 0
+        self._expiration_checkpoints = [mask]
+        for start in range(0, len(self._expiration_order), self._expiration_step):
+            mask |= self._mask_from_indices(self._expiration_order[start : start + self._expiration_step])
+            self._expiration_checkpoints.append(mask)
@@ -0,0 +1 @@
+from limit_order_sdk.order_state.order_state_tracker import OrderStateTracker
@@ -0,0 +1,157 @@
+from typing import Dict, Iterable, List, Sequence, Set, Tuple, Union
+
+from limit_order_sdk.address import Address
+from limit_order_sdk.events.event_decoder import BitInvalidatorUpdatedEvent, EpochIncreasedEvent, LimitOrderEvent, OrderCancelledEvent, OrderFilledEvent
+from limit_order_sdk.limit_order import LimitOrder, MakerTraits
+
+MakerLike = Union[Address, str]
+
+
+def _maker_key(maker: MakerLike) -> str:
+    return str(maker).lower()
+
+
+class OrderStateTracker:
+    """
+    In-memory mirror of the limit order contract invalidation state, updated from own fills and cancellations
+    or from contract events, so fillability checks don't need a `remainingInvalidatorForOrder`/`bitInvalidatorForOrder` call per order.
+
+    State is modelled the same way as in the contract:
+    - orders allowing partial and multiple fills keep a remaining making amount per order hash,
+    - other orders (`MakerTraits.is_bit_invalidator_mode()`) are invalidated by a bit of their maker, selected by the order nonce,
+    - orders with epoch manager check are valid while their nonce equals the maker epoch of their series.
+
+    All queries are O(1). Order hashes are passed in by the caller as hex strings, they are not computed here.
+    The tracker is not thread-safe.
+
+    Example:
+        tracker = OrderStateTracker()
+        tracker.apply_order_filled(order_hash, remaining_amount)  # from an OrderFilled event
+        if tracker.remaining_amount(order, order_hash) > 0:
+            ...
+    """
+
+    def __init__(self):
+        # order hash => remaining making amount, orders never filled are absent
+        self.remaining: Dict[str, int] = {}
+        self.cancelled: Set[str] = set()
+        # (maker, slot index) => slot value
+        self.bit_invalidators: Dict[Tuple[str, int], int] = {}
+        # (maker, series) => epoch, same keys as `PredicateResolver(epochs=...)`
+        self.epochs: Dict[Tuple[str, int], int] = {}
+
+    # Queries
+
+    def remaining_amount(self, order: LimitOrder, order_hash: str) -> int:
+        """Returns the making amount `order` can still be filled for, 0 if it is filled, cancelled or invalidated."""
+        traits = order.maker_traits
+        if traits.is_epoch_manager_enabled() and self.epoch(order.maker, traits.series()) != traits.nonce_or_epoch():
+            return 0
+        if traits.is_bit_invalidator_mode():
+            # Any fill sets the nonce bit, but only emits `OrderFilled`, so a recorded fill invalidates the order too
+            if self.is_bit_invalidated(order.maker, traits.nonce_or_epoch()) or order_hash.lower() in self.remaining:
+                return 0
+            return order.making_amount
+        return self.remaining.get(order_hash.lower(), order.making_amount)
+
+    def is_fillable(self, order: LimitOrder, order_hash: str) -> bool:
+        return self.remaining_amount(order, order_hash) > 0
+
+    def is_cancelled(self, order: LimitOrder, order_hash: str) -> bool:
+        """Returns True if `order` was cancelled by hash, by its nonce bit or by an epoch increase."""
+        traits = order.maker_traits
+        if traits.is_epoch_manager_enabled() and self.epoch(order.maker, traits.series()) != traits.nonce_or_epoch():
+            return True
+        if traits.is_bit_invalidator_mode():
+            # A filled single-fill order and a cancelled one set the same bit
+            return order_hash.lower() in self.cancelled or self.is_bit_invalidated(order.maker, traits.nonce_or_epoch())
+        return order_hash.lower() in self.cancelled
+
+    def remaining_amounts(self, orders: Sequence[LimitOrder], order_hashes: Sequence[str]) -> List[int]:
+        """Returns `remaining_amount` of every order, e.g. for `FillSimulator`."""
+        return [self.remaining_amount(order, order_hash) for order, order_hash in zip(orders, order_hashes)]
+
+    def is_bit_invalidated(self, maker: MakerLike, nonce: int) -> bool:
+        return (self.bit_invalidators.get((_maker_key(maker), nonce >> 8), 0) >> (nonce & 0xFF)) & 1 == 1
+
+    def bit_invalidator(self, maker: MakerLike, slot: int) -> int:
+        """Same as `bitInvalidatorForOrder(maker, slot)` of the contract."""
+        return self.bit_invalidators.get((_maker_key(maker), slot), 0)
+
+    def epoch(self, maker: MakerLike, series: int) -> int:
+        """Same as `epoch(maker, series)` of the contract."""
+        return self.epochs.get((_maker_key(maker), series), 0)
+
+    # Own transactions
+
+    def apply_fill(self, order: LimitOrder, order_hash: str, making_amount: int) -> None:
+        """Applies a fill of `order` for `making_amount`, e.g. from a fill plan."""
+        traits = order.maker_traits
+        if traits.is_bit_invalidator_mode():
+            self._invalidate_bits(order.maker, traits.nonce_or_epoch(), 0)
+            return
+        key = order_hash.lower()
+        remaining = self.remaining.get(key, order.making_amount)
+        assert making_amount <= remaining, "making_amount exceeds remaining amount"
+        self.remaining[key] = remaining - making_amount
+
+    def apply_cancel(self, maker: MakerLike, maker_traits: MakerTraits, order_hash: str) -> None:
+        """Applies `cancelOrder(makerTraits, orderHash)` sent by `maker`."""
+        key = order_hash.lower()
+        self.cancelled.add(key)
+        if maker_traits.is_bit_invalidator_mode():
+            self._invalidate_bits(maker, maker_traits.nonce_or_epoch(), 0)
+        else:
+            self.remaining[key] = 0
+
+    def apply_bits_invalidate(self, maker: MakerLike, maker_traits: MakerTraits, additional_mask: int) -> None:
+        """Applies `bitsInvalidateForOrder(makerTraits, additionalMask)` sent by `maker`."""
+        self._invalidate_bits(maker, maker_traits.nonce_or_epoch(), additional_mask)
+
+    def apply_advance_epoch(self, maker: MakerLike, series: int, amount: int = 1) -> None:
+        """Applies `advanceEpoch(series, amount)` sent by `maker`, `increaseEpoch(series)` is the same with amount 1."""
+        key = (_maker_key(maker), series)
+        self.epochs[key] = self.epochs.get(key, 0) + amount
+
+    def _invalidate_bits(self, maker: MakerLike, nonce: int, additional_mask: int) -> None:
+        # Same as `BitInvalidatorLib.massInvalidate`
+        key = (_maker_key(maker), nonce >> 8)
+        self.bit_invalidators[key] = self.bit_invalidators.get(key, 0) | (1 << (nonce & 0xFF)) | additional_mask
+
+    # Contract events
+
+    def apply_order_filled(self, order_hash: str, remaining_amount: int) -> None:
+        """Applies `OrderFilled(orderHash, remainingAmount)`."""
+        self.remaining[order_hash.lower()] = remaining_amount
+
+    def apply_order_cancelled(self, order_hash: str) -> None:
+        """Applies `OrderCancelled(orderHash)`."""
+        key = order_hash.lower()
+        self.cancelled.add(key)
+        self.remaining[key] = 0
+
+    def apply_bit_invalidator_updated(self, maker: MakerLike, slot_index: int, slot_value: int) -> None:
+        """Applies `BitInvalidatorUpdated(maker, slotIndex, slotValue)`."""
+        self.bit_invalidators[(_maker_key(maker), slot_index)] = slot_value
+
+    def apply_epoch_increased(self, maker: MakerLike, series: int, new_epoch: int) -> None:
+        """Applies `EpochIncreased(maker, series, newEpoch)`."""
+        self.epochs[(_maker_key(maker), series)] = new_epoch
+
+    def apply_event(self, event: LimitOrderEvent) -> None:
+        """Applies an event decoded by `decode_log`."""
+        if isinstance(event, OrderFilledEvent):
+            self.apply_order_filled(event.order_hash, event.remaining_amount)
+        elif isinstance(event, OrderCancelledEvent):
+            self.apply_order_cancelled(event.order_hash)
+        elif isinstance(event, BitInvalidatorUpdatedEvent):
+            self.apply_bit_invalidator_updated(event.maker, event.slot_index, event.slot_value)
+        elif isinstance(event, EpochIncreasedEvent):
+            self.apply_epoch_increased(event.maker, event.series, event.new_epoch)
+        else:
+            raise TypeError(f"Unknown event {event!r}")
+
+    def apply_events(self, events: Iterable[LimitOrderEvent]) -> None:
+        """Applies events in the given order, e.g. `tracker.apply_events(decode_jsonl_logs("logs.jsonl"))`."""
+        for event in events:
+            self.apply_event(event)
@@ -0,0 +1,2 @@
+from limit_order_sdk.predicate.predicate import *
+from limit_order_sdk.predicate.predicate_evaluator import PredicateResolver, PredicateEvaluator, StaticCallFailed
@@ -0,0 +1,263 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple, Union
+
+from limit_order_sdk.constants import ZX
+from limit_order_sdk.libs.byte_utils import UINT_32_MAX, add_0x, is_hex_bytes, trim_0x
+
+# Selectors of the limit order protocol predicate helpers, see `PredicateHelper.sol` and `SeriesEpochManager.sol`
+AND_SELECTOR = bytes.fromhex("bfa75143")  # and(uint256,bytes)
+OR_SELECTOR = bytes.fromhex("74261145")  # or(uint256,bytes)
+NOT_SELECTOR = bytes.fromhex("bf797959")  # not(bytes)
+EQ_SELECTOR = bytes.fromhex("6fe7b0ba")  # eq(uint256,bytes)
+LT_SELECTOR = bytes.fromhex("ca4ece22")  # lt(uint256,bytes)
+GT_SELECTOR = bytes.fromhex("4f38e2b8")  # gt(uint256,bytes)
+ARBITRARY_STATIC_CALL_SELECTOR = bytes.fromhex("bf15fcd8")  # arbitraryStaticCall(address,bytes)
+EPOCH_EQUALS_SELECTOR = bytes.fromhex("ce3d710a")  # epochEquals(address,uint256,uint256)
+# timestampBelow(uint256) of the series nonce manager helper, called through `arbitraryStaticCall`
+TIMESTAMP_BELOW_SELECTOR = bytes.fromhex("63592c2b")
+
+# `and`/`or` pack end offsets of their operands into a single uint256, 32 bits each
+MAX_OPERANDS = 8
+
+
+def _word(value: int) -> bytes:
+    return value.to_bytes(32, "big")
+
+
+def _encode_bytes(data: bytes) -> bytes:
+    return _word(len(data)) + data + bytes(-len(data) % 32)
+
+
+def _encode_with_bytes(selector: bytes, head: bytes, data: bytes) -> bytes:
+    # `f(<static word>, bytes)`: the dynamic argument starts right after the two head words
+    return selector + head + _word(0x40) + _encode_bytes(data)
+
+
+@dataclass(frozen=True)
+class And:
+    """`and(offsets, data)`: true if every operand returns 1."""
+
+    operands: Tuple["Predicate", ...]
+
+    def encode_bytes(self) -> bytes:
+        return _encode_with_bytes(AND_SELECTOR, _word(_pack_offsets(self.operands)), b"".join(op.encode_bytes() for op in self.operands))
+
+    def encode(self) -> str:
+        return add_0x(self.encode_bytes().hex())
+
+
+@dataclass(frozen=True)
+class Or:
+    """`or(offsets, data)`: true if any operand returns 1."""
+
+    operands: Tuple["Predicate", ...]
+
+    def encode_bytes(self) -> bytes:
+        return _encode_with_bytes(OR_SELECTOR, _word(_pack_offsets(self.operands)), b"".join(op.encode_bytes() for op in self.operands))
+
+    def encode(self) -> str:
+        return add_0x(self.encode_bytes().hex())
+
+
+@dataclass(frozen=True)
+class Not:
+    """`not(data)`: true if the operand returns 0."""
+
+    operand: "Predicate"
+
+    def encode_bytes(self) -> bytes:
+        return NOT_SELECTOR + _word(0x20) + _encode_bytes(self.operand.encode_bytes())
+
+    def encode(self) -> str:
+        return add_0x(self.encode_bytes().hex())
+
+
+@dataclass(frozen=True)
+class Eq:
+    """`eq(value, data)`: true if the operand returns `value`."""
+
+    value: int
+    operand: "Predicate"
+
+    def encode_bytes(self) -> bytes:
+        return _encode_with_bytes(EQ_SELECTOR, _word(self.value), self.operand.encode_bytes())
+
+    def encode(self) -> str:
+        return add_0x(self.encode_bytes().hex())
+
+
+@dataclass(frozen=True)
+class Lt:
+    """`lt(value, data)`: true if the operand returns less than `value`."""
+
+    value: int
+    operand: "Predicate"
+
+    def encode_bytes(self) -> bytes:
+        return _encode_with_bytes(LT_SELECTOR, _word(self.value), self.operand.encode_bytes())
+
+    def encode(self) -> str:
+        return add_0x(self.encode_bytes().hex())
+
+
+@dataclass(frozen=True)
+class Gt:
+    """`gt(value, data)`: true if the operand returns more than `value`."""
+
+    value: int
+    operand: "Predicate"
+
+    def encode_bytes(self) -> bytes:
+        return _encode_with_bytes(GT_SELECTOR, _word(self.value), self.operand.encode_bytes())
+
+    def encode(self) -> str:
+        return add_0x(self.encode_bytes().hex())
+
+
+@dataclass(frozen=True)
+class ArbitraryStaticCall:
+    """`arbitraryStaticCall(target, data)`: returns uint256 result of a static call to `target`, reverts if it fails."""
+
+    target: str
+    data: str
+
+    def encode_bytes(self) -> bytes:
+        return _encode_with_bytes(ARBITRARY_STATIC_CALL_SELECTOR, _word(int(self.target, 16)), bytes.fromhex(trim_0x(self.data)))
+
+    def encode(self) -> str:
+        return add_0x(self.encode_bytes().hex())
+
+
+@dataclass(frozen=True)
+class TimestampBelow:
+    """`arbitraryStaticCall(target, timestampBelow(timestamp))`: true if block timestamp is less than `timestamp`."""
+
+    target: str
+    timestamp: int
+
+    def encode_bytes(self) -> bytes:
+        return ArbitraryStaticCall(self.target, add_0x((TIMESTAMP_BELOW_SELECTOR + _word(self.timestamp)).hex())).encode_bytes()
+
+    def encode(self) -> str:
+        return add_0x(self.encode_bytes().hex())
+
+
+@dataclass(frozen=True)
+class EpochEquals:
+    """`epochEquals(maker, series, epoch)`: true if the maker epoch of `series` equals `epoch`."""
+
+    maker: str
+    series: int
+    epoch: int
+
+    def encode_bytes(self) -> bytes:
+        return EPOCH_EQUALS_SELECTOR + _word(int(self.maker, 16)) + _word(self.series) + _word(self.epoch)
+
+    def encode(self) -> str:
+        return add_0x(self.encode_bytes().hex())
+
+
+@dataclass(frozen=True)
+class Call:
+    """Any other view call to the limit order contract, kept as raw calldata."""
+
+    data: str
+
+    def encode_bytes(self) -> bytes:
+        return bytes.fromhex(trim_0x(self.data))
+
+    def encode(self) -> str:
+        return add_0x(self.encode_bytes().hex())
+
+
+Predicate = Union[And, Or, Not, Eq, Lt, Gt, ArbitraryStaticCall, TimestampBelow, EpochEquals, Call]
+
+
+def _pack_offsets(operands: Tuple[Predicate, ...]) -> int:
+    assert 0 < len(operands) <= MAX_OPERANDS, f"and/or support from 1 to {MAX_OPERANDS} operands"
+    offsets = 0
+    end = 0
+    for i, operand in enumerate(operands):
+        end += len(operand.encode_bytes())
+        assert end <= UINT_32_MAX, "predicate too long"
+        offsets |= end << (32 * i)
+    return offsets
+
+
+def _read_word(data: bytes, position: int) -> int:
+    if position + 32 > len(data):
+        raise ValueError(f"Predicate is too short, cannot read word at {position}")
+    return int.from_bytes(data[position : position + 32], "big")
+
+
+def _read_bytes(args: bytes, head_position: int) -> bytes:
+    # Dynamic argument: head word holds offset of the length-prefixed data, relative to the arguments start
+    offset = _read_word(args, head_position)
+    length = _read_word(args, offset)
+    if offset + 32 + length > len(args):
+        raise ValueError("Predicate is too short, bytes argument is out of bounds")
+    return args[offset + 32 : offset + 32 + length]
+
+
+def _split_operands(offsets: int, data: bytes) -> Tuple[Predicate, ...]:
+    # Same walk as `PredicateHelper.and`/`or`: operands end at non-zero 32-bit offsets, lowest first
+    operands = []
+    previous = 0
+    while offsets & UINT_32_MAX:
+        current = offsets & UINT_32_MAX
+        if not previous <= current <= len(data):
+            raise ValueError(f"Invalid operand offset {current}")
+        operands.append(_decode(data[previous:current]))
+        previous = current
+        offsets >>= 32
+    return tuple(operands)
+
+
+def _decode(data: bytes) -> Predicate:
+    selector, args = data[:4], data[4:]
+
+    if selector == AND_SELECTOR:
+        return And(_split_operands(_read_word(args, 0), _read_bytes(args, 32)))
+    if selector == OR_SELECTOR:
+        return Or(_split_operands(_read_word(args, 0), _read_bytes(args, 32)))
+    if selector == NOT_SELECTOR:
+        return Not(_decode(_read_bytes(args, 0)))
+    if selector == EQ_SELECTOR:
+        return Eq(_read_word(args, 0), _decode(_read_bytes(args, 32)))
+    if selector == LT_SELECTOR:
+        return Lt(_read_word(args, 0), _decode(_read_bytes(args, 32)))
+    if selector == GT_SELECTOR:
+        return Gt(_read_word(args, 0), _decode(_read_bytes(args, 32)))
+    if selector == EPOCH_EQUALS_SELECTOR:
+        return EpochEquals(add_0x(_read_word(args, 0).to_bytes(32, "big")[12:].hex()), _read_word(args, 32), _read_word(args, 64))
+    if selector == ARBITRARY_STATIC_CALL_SELECTOR:
+        target = add_0x(_read_word(args, 0).to_bytes(32, "big")[12:].hex())
+        call_data = _read_bytes(args, 32)
+        if call_data[:4] == TIMESTAMP_BELOW_SELECTOR and len(call_data) == 36:
+            return TimestampBelow(target, int.from_bytes(call_data[4:], "big"))
+        return ArbitraryStaticCall(target, add_0x(call_data.hex()))
+
+    return Call(add_0x(data.hex()))
+
+
+@lru_cache(maxsize=4096)
+def decode_predicate(predicate: str) -> Predicate:
+    """
+    Decodes predicate calldata (e.g. `Extension.predicate`) into an expression tree.
+
+    Unknown calls are kept as `Call` leaves. Decoded trees are immutable and cached, orders sharing
+    a predicate share its tree.
+
+    Args:
+        predicate (str): Predicate calldata as hex string.
+
+    Returns:
+        Predicate: Root node of the expression tree.
+
+    Raises:
+        ValueError: If the predicate is empty or malformed.
+    """
+    if predicate == ZX or not is_hex_bytes(predicate):
+        raise ValueError(f"Invalid predicate {predicate}")
+    return _decode(bytes.fromhex(trim_0x(predicate)))
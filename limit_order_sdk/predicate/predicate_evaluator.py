@@ -0,0 +1,149 @@
+import time
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from limit_order_sdk.constants import ZX
+from limit_order_sdk.limit_order import Extension
+from limit_order_sdk.predicate.predicate import And, ArbitraryStaticCall, Call, EpochEquals, Eq, Gt, Lt, Not, Or, Predicate, TimestampBelow, decode_predicate
+
+# (success, result) of a static call, None when the result can not be resolved locally
+CallResult = Optional[Tuple[bool, int]]
+
+# Static call handler: (target, calldata) => uint256 result or None if unknown, target is None for the limit order contract
+StaticCallHandler = Callable[[Optional[str], str], Optional[int]]
+
+
+class StaticCallFailed(Exception):
+    """Raised by a static call handler when the call reverts."""
+
+
+class PredicateResolver:
+    """
+    Source of on-chain state for `PredicateEvaluator`. Every getter returns None when the value is unknown,
+    subclass it to read state from a node or a local cache.
+    """
+
+    def __init__(self, timestamp: Optional[int] = None, epochs: Optional[Dict[Tuple[str, int], int]] = None, static_call: Optional[StaticCallHandler] = None):
+        """
+        Args:
+            timestamp (Optional[int]): Block timestamp to evaluate at, the current time if not set.
+            epochs (Optional[Dict[Tuple[str, int], int]]): Known epochs by (maker, series), maker in lowercase.
+            static_call (Optional[StaticCallHandler]): Handler of static calls not resolvable locally.
+        """
+        self.timestamp = timestamp
+        self.epochs = epochs or {}
+        self.static_call_handler = static_call
+
+    def get_timestamp(self) -> Optional[int]:
+        return int(time.time()) if self.timestamp is None else self.timestamp
+
+    def get_epoch(self, maker: str, series: int) -> Optional[int]:
+        return self.epochs.get((maker.lower(), series))
+
+    def static_call(self, target: Optional[str], data: str) -> Optional[int]:
+        """
+        Returns uint256 result of a static call to `target` (None for the limit order contract) or None if unknown.
+
+        Raises:
+            StaticCallFailed: If the call reverts.
+        """
+        if self.static_call_handler is None:
+            return None
+        return self.static_call_handler(target, data)
+
+
+class PredicateEvaluator:
+    """
+    Evaluates predicates locally the same way `checkPredicate` of the limit order contract does.
+
+    Results are three-valued: True/False when the outcome is known and None when it depends on state
+    the resolver does not know. A known false result means the order can not be filled, so orders can be
+    pre-filtered without an `eth_call` for each of them:
+
+        evaluator = PredicateEvaluator(PredicateResolver(timestamp=now))
+        fillable = [order for order in orders if evaluator.check_extension(order.extension) is not False]
+    """
+
+    def __init__(self, resolver: Optional[PredicateResolver] = None):
+        self.resolver = resolver or PredicateResolver()
+
+    def check(self, predicate: Union[str, Predicate]) -> Optional[bool]:
+        """
+        Returns the result of `checkPredicate(predicate)` or None if it can not be resolved locally.
+
+        Args:
+            predicate (Union[str, Predicate]): Predicate calldata as hex string or decoded expression tree.
+        """
+        if isinstance(predicate, str):
+            predicate = decode_predicate(predicate)
+        result = self.call(predicate)
+        if result is None:
+            return None
+        success, value = result
+        return success and value == 1
+
+    def check_extension(self, extension: Extension) -> Optional[bool]:
+        """Same as `check` for the extension predicate, True if the extension has no predicate."""
+        if extension.predicate == ZX:
+            return True
+        return self.check(extension.predicate)
+
+    def call(self, node: Predicate) -> CallResult:
+        """Returns (success, result) of a static call to `node`, None if it can not be resolved locally."""
+        if isinstance(node, And):
+            return self._and(node)
+        if isinstance(node, Or):
+            return self._or(node)
+        if isinstance(node, (Not, Eq, Lt, Gt)):
+            return self._compare(node)
+        if isinstance(node, TimestampBelow):
+            timestamp = self.resolver.get_timestamp()
+            return None if timestamp is None else (True, int(timestamp < node.timestamp))
+        if isinstance(node, EpochEquals):
+            epoch = self.resolver.get_epoch(node.maker, node.series)
+            return None if epoch is None else (True, int(epoch == node.epoch))
+        if isinstance(node, ArbitraryStaticCall):
+            return self._static_call(node.target, node.data)
+        if isinstance(node, Call):
+            return self._static_call(None, node.data)
+        raise TypeError(f"Unknown predicate node {node!r}")
+
+    def _static_call(self, target: Optional[str], data: str) -> CallResult:
+        try:
+            value = self.resolver.static_call(target, data)
+        except StaticCallFailed:
+            return False, 0
+        return None if value is None else (True, value)
+
+    def _and(self, node: And) -> CallResult:
+        # A single false operand decides the result, since operands are side effect free their order does not matter
+        unknown = False
+        for operand in node.operands:
+            result = self.call(operand)
+            if result is None:
+                unknown = True
+            elif not (result[0] and result[1] == 1):
+                return True, 0
+        return None if unknown else (True, 1)
+
+    def _or(self, node: Or) -> CallResult:
+        unknown = False
+        for operand in node.operands:
+            result = self.call(operand)
+            if result is None:
+                unknown = True
+            elif result[0] and result[1] == 1:
+                return True, 1
+        return None if unknown else (True, 0)
+
+    def _compare(self, node: Union[Not, Eq, Lt, Gt]) -> CallResult:
+        result = self.call(node.operand)
+        if result is None:
+            return None
+        success, value = result
+        if isinstance(node, Not):
+            return True, int(success and value == 0)
+        if isinstance(node, Eq):
+            return True, int(success and value == node.value)
+        if isinstance(node, Lt):
+            return True, int(success and value < node.value)
+        return True, int(success and value > node.value)
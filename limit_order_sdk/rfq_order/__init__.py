@@ -1 +1,2 @@
 from limit_order_sdk.rfq_order.rfq_order import RfqOrder
+from limit_order_sdk.rfq_order.rfq_quoter import NonceAllocator, RfqPair, RfqQuote, RfqQuoter
@@ -0,0 +1,164 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+
+from limit_order_sdk.address import Address, ZERO_ADDRESS
+from limit_order_sdk.chain_context import ChainLike, get_chain_context
+from limit_order_sdk.libs.byte_utils import UINT_40_MAX, UINT_256_MAX
+from limit_order_sdk.limit_order import Extension, MakerTraits
+from limit_order_sdk.limit_order.order_signer import OrderSigner
+from limit_order_sdk.limit_order.salt_generator import SaltGenerator, default_salt_generator
+from limit_order_sdk.metrics.instrumented import instrumented
+from limit_order_sdk.rfq_order.rfq_order import RfqOrder
+
+
+class NonceAllocator:
+    """
+    Thread-safe source of unique RFQ nonces for one maker.
+
+    RFQ orders are in bit invalidator mode: the nonce is the bit of the maker's invalidator which is set when the order is filled,
+    so a reused nonce makes the second order unfillable. Consecutive nonces share invalidator slots of 256 bits,
+    which keeps fills and `build_cancel_calls` cheap.
+
+    Nonces are not persisted, start a restarted process from the `next_nonce` saved by the previous one.
+    """
+
+    def __init__(self, start: int = 0, end: int = UINT_40_MAX + 1):
+        """
+        Args:
+            start (int): First nonce to allocate.
+            end (int): Nonces are allocated below `end`, at most UINT_40_MAX + 1.
+        """
+        assert 0 <= start <= end <= UINT_40_MAX + 1, "nonce range must be within uint40"
+        self._next = start
+        self.end = end
+        self._lock = threading.Lock()
+
+    @property
+    def next_nonce(self) -> int:
+        return self._next
+
+    def allocate(self, n: int = 1) -> range:
+        """Returns `n` consecutive nonces, never returned before by this allocator."""
+        with self._lock:
+            start = self._next
+            assert start + n <= self.end, "nonces exhausted"
+            self._next = start + n
+        return range(start, start + n)
+
+
+@dataclass(frozen=True)
+class RfqPair:
+    """
+    Quoting configuration of one pair.
+
+    Attributes:
+        maker_asset (Address): Asset sold by the quotes.
+        taker_asset (Address): Asset bought by the quotes.
+        ttl (int): Seconds a quote stays fillable.
+        allowed_sender (Optional[Address]): Only taker allowed to fill the quotes, any if not set.
+        use_permit2 (bool): Transfer maker assets with permit2.
+    """
+
+    maker_asset: Address
+    taker_asset: Address
+    ttl: int = 60
+    allowed_sender: Optional[Address] = None
+    use_permit2: bool = False
+
+
+class RfqQuote(NamedTuple):
+    """
+    Signed RFQ order, ready to be submitted or sent to a taker.
+
+    Attributes:
+        order (RfqOrder): The order, its hash is cached for the quoter chain.
+        order_hash (str): EIP-712 order hash, the signed digest.
+        signature (str): 65-byte maker signature, hex.
+    """
+
+    order: RfqOrder
+    order_hash: str
+    signature: str
+
+
+class RfqQuoter:
+    """
+    Issues signed RFQ orders of one maker at a high rate.
+
+    The EIP-712 domain separator, the maker traits of every pair and the normalized addresses are computed once,
+    every quote only takes a nonce from the `NonceAllocator`, an expiration and a salt, hashes the order struct
+    and signs the digest with `OrderSigner`, without building typed data.
+
+    Example:
+        quoter = RfqQuoter(private_key, chain_id=1, nonce_allocator=NonceAllocator(start=saved_nonce))
+        pair = RfqPair(weth, usdc, ttl=30)
+        quote = quoter.quote(pair, making_amount, taking_amount)
+        api.submit_order(quote.order, quote.signature)
+    """
+
+    def __init__(
+        self,
+        private_key: Union[bytes, str],
+        chain_id: ChainLike,
+        nonce_allocator: Optional[NonceAllocator] = None,
+        salt_generator: SaltGenerator = default_salt_generator,
+    ):
+        """
+        Args:
+            private_key (Union[bytes, str]): Key of the maker, 32 bytes or hex string.
+            chain_id (ChainLike): Chain of the quotes.
+            nonce_allocator (Optional[NonceAllocator]): Source of nonces, shared by every quoter of the maker. A new one starting at 0 if not set.
+            salt_generator (SaltGenerator): Source of random salts.
+        """
+        self.signer = OrderSigner(private_key)
+        self.maker = self.signer.address
+        self.context = get_chain_context(chain_id)
+        self.nonce_allocator = nonce_allocator or NonceAllocator()
+        self.salt_generator = salt_generator
+        self._base_traits: Dict[RfqPair, int] = {}
+
+    def _pair_traits(self, pair: RfqPair) -> int:
+        traits = self._base_traits.get(pair)
+        if traits is None:
+            maker_traits = MakerTraits(0).disable_multiple_fills().allow_partial_fills()
+            if pair.allowed_sender:
+                maker_traits.with_allowed_sender(pair.allowed_sender)
+            if pair.use_permit2:
+                maker_traits.enable_permit2()
+            traits = self._base_traits[pair] = maker_traits.as_int()
+        return traits
+
+    def quote(self, pair: RfqPair, making_amount: int, taking_amount: int, now: Optional[int] = None) -> RfqQuote:
+        """Returns a signed quote of `pair`, expiring `pair.ttl` seconds after `now` (current time if not set)."""
+        return self.quotes(pair, [making_amount], [taking_amount], now)[0]
+
+    @instrumented("rfq_quoter.quotes")
+    def quotes(self, pair: RfqPair, making_amounts: Sequence[int], taking_amounts: Sequence[int], now: Optional[int] = None) -> List[RfqQuote]:
+        """
+        Returns one signed quote of `pair` per element of the amount vectors, with consecutive nonces.
+
+        Args:
+            pair (RfqPair): Pair of the quotes.
+            making_amounts (Sequence[int]): Making amount of every quote.
+            taking_amounts (Sequence[int]): Taking amount of every quote.
+            now (Optional[int]): Unix timestamp the quotes are issued at, current time if not set.
+        """
+        n = len(making_amounts)
+        assert len(taking_amounts) == n, "making_amounts/taking_amounts length mismatch"
+        assert all(0 <= amount <= UINT_256_MAX for amount in making_amounts), "making_amount too big"
+        assert all(0 <= amount <= UINT_256_MAX for amount in taking_amounts), "taking_amount too big"
+
+        expiration = (int(time.time()) if now is None else now) + pair.ttl
+        assert 0 < expiration <= UINT_40_MAX, "expiration must be within uint40"
+        traits = self._pair_traits(pair) | (expiration << MakerTraits.EXPIRATION_MASK.offset)
+        nonce_offset = MakerTraits.NONCE_OR_EPOCH_MASK.offset
+
+        maker, context, sign_order_hash, extension = self.maker, self.context, self.signer.sign_order_hash, Extension.default()
+        quotes: List[RfqQuote] = []
+        for making_amount, taking_amount, salt, nonce in zip(making_amounts, taking_amounts, self.salt_generator.base_salts(n), self.nonce_allocator.allocate(n)):
+            order = RfqOrder._from_trusted(pair.maker_asset, pair.taker_asset, making_amount, taking_amount, salt, maker, ZERO_ADDRESS, MakerTraits(traits | (nonce << nonce_offset)), extension)
+            order_hash = order._order_hash(context)
+            quotes.append(RfqQuote(order, order_hash, sign_order_hash(order_hash)))
+        return quotes
@@ -1,8 +1,9 @@
-from web3 import Web3
 import json
 
 
 def get_contract_web3(contract_abi_path: str):
+    from web3 import Web3
+
     web3 = Web3()
     with open(contract_abi_path, "r") as abi_file:
         contract_abi = json.load(abi_file)
@@ -13,11 +13,7 @@ def rand_int(max: Union[int, float]) -> int:
         int: A random integer within the specified range.
     """
     max = int(max) + 1
-    bytes_count = 0
-    rest = max
-    while rest:
-        rest = rest >> 8
-        bytes_count += 1
+    bytes_count = (max.bit_length() + 7) // 8
 
     # Generate a random byte sequence of the determined length.
     bytes_seq = secrets.token_bytes(bytes_count)
@@ -0,0 +1,57 @@
+import random
+from typing import Optional, Union
+
+from eth_account import Account
+
+from limit_order_sdk import Address, Extension, ExtensionBuilder, Interaction, LimitOrder, MakerTraits, OrderInfoData, RfqOrder
+
+WETH = Address("0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2")
+USDC = Address("0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48")
+MAKER = Address("0x00000000219ab540356cbb839cbe05303d7705fa")
+NOW = 1_700_000_000
+PRIVATE_KEY = "0x" + "42" * 32
+
+
+def build_order(
+    maker_traits: Optional[MakerTraits] = None,
+    extension: Optional[Extension] = None,
+    salt: int = 1,
+    making_amount: int = 10**18,
+    taking_amount: int = 1420 * 10**6,
+    maker: Address = MAKER,
+    maker_asset: Address = WETH,
+    taker_asset: Address = USDC,
+) -> LimitOrder:
+    """Returns a WETH → USDC order of MAKER, `salt` is the base salt when `extension` is set."""
+    if extension is not None:
+        salt = LimitOrder.build_salt(extension, salt)
+    info = OrderInfoData(maker_asset=maker_asset, taker_asset=taker_asset, making_amount=making_amount, taking_amount=taking_amount, maker=maker, salt=salt)
+    return LimitOrder(info, maker_traits) if extension is None else LimitOrder(info, maker_traits, extension)
+
+
+def build_numbered_order(i: int, with_extension: bool = False) -> LimitOrder:
+    """Returns the `i`-th of a sequence of distinct orders, each of its own maker, with a custom data extension if `with_extension`."""
+    extension = ExtensionBuilder().with_custom_data("0xdeadbeef").build() if with_extension else ExtensionBuilder().build()
+    return build_order(MakerTraits.default(), extension, salt=i + 1, making_amount=10**18 + i, maker=Address.from_int(i + 1))
+
+
+def build_random_order(rnd: random.Random, maker: Address, with_extension: bool) -> LimitOrder:
+    """Returns an order of `maker` with random assets, amounts, salt and traits, and a random post interaction if `with_extension`."""
+    extension = ExtensionBuilder().with_post_interaction(Interaction(Address.from_int(rnd.getrandbits(160)), "0x" + rnd.randbytes(20).hex())).build() if with_extension else ExtensionBuilder().build()
+    info = OrderInfoData(
+        maker_asset=Address.from_int(rnd.getrandbits(160)),
+        taker_asset=Address.from_int(rnd.getrandbits(160)),
+        making_amount=rnd.getrandbits(128),
+        taking_amount=rnd.getrandbits(128),
+        maker=maker,
+        salt=LimitOrder.build_salt(extension, rnd.getrandbits(96)),
+    )
+    traits = MakerTraits.default().allow_multiple_fills().with_expiration(rnd.getrandbits(40)).with_nonce(rnd.getrandbits(40))
+    return LimitOrder(info, traits.enable_post_interaction() if with_extension else traits, extension)
+
+
+def sign_typed_data(key: Union[bytes, str], order: Union[LimitOrder, RfqOrder], chain_id: int) -> str:
+    """Returns the signature of `order` by `Account.sign_typed_data`, the reference for `OrderSigner` and `RfqQuoter`."""
+    typed_data = order.get_typed_data(chain_id)
+    full_message = {"primaryType": typed_data.primaryType, "types": typed_data.types, "domain": typed_data.domain, "message": typed_data.message}
+    return "0x" + bytes(Account.sign_typed_data(key, full_message=full_message).signature).hex()
@@ -0,0 +1,37 @@
+import pickle
+
+import pytest
+
+from limit_order_sdk import Address, ZERO_ADDRESS, is_address
+
+WETH = "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"
+WETH_CHECKSUM = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+
+
+def test_canonical_form():
+    address = Address(WETH_CHECKSUM)
+    assert str(address) == WETH
+    assert address.to_bytes() == bytes.fromhex(WETH[2:])
+    assert address == Address(WETH) == Address.from_bytes(address.to_bytes()) == Address.from_int(int(WETH, 16))
+    assert hash(address) == hash(Address(WETH.upper().replace("0X", "0x")))
+    assert len({Address(WETH), Address(WETH_CHECKSUM)}) == 1
+    assert pickle.loads(pickle.dumps(address)) == address
+
+
+def test_validation():
+    assert is_address(WETH)
+    assert is_address(WETH_CHECKSUM)
+    assert is_address(WETH[2:])
+    assert not is_address(WETH[:-1])
+    assert not is_address("0x" + "zz" * 20)
+    assert not is_address("0x" + "aa " * 13 + "a")
+    with pytest.raises(AssertionError, match="Invalid address"):
+        Address(WETH + "00")
+
+
+def test_interned():
+    address = Address.interned(WETH)
+    assert Address.interned(WETH_CHECKSUM) is address
+    assert Address.interned(bytes.fromhex(WETH[2:])) is address
+    assert Address.interned(Address(WETH)) is address
+    assert Address.interned("0x" + "00" * 20) is ZERO_ADDRESS
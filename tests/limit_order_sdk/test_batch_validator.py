@@ -0,0 +1,53 @@
+from limit_order_sdk import ExtensionBuilder, Interaction, MakerTraits, ValidationReason, describe_reasons, validate_orders
+from tests.limit_order_sdk.helpers import MAKER, NOW, build_order
+
+
+def post_interaction_extension():
+    return ExtensionBuilder().with_post_interaction(Interaction(MAKER, "0xdeadbeef")).build()
+
+
+def test_valid_orders_have_zero_codes():
+    orders = [
+        build_order(MakerTraits.default()),
+        build_order(MakerTraits.default().allow_multiple_fills().with_epoch(1, 2).with_expiration(NOW + 60)),
+        build_order(MakerTraits.default().enable_post_interaction(), post_interaction_extension()),
+    ]
+
+    codes = validate_orders(orders, now=NOW)
+
+    assert codes.typecode == "I"
+    assert list(codes) == [0, 0, 0]
+
+
+def test_reasons_of_orders_changed_after_construction():
+    overflow = build_order(MakerTraits.default())
+    overflow.making_amount = 1 << 256
+    overflow.salt = -1
+
+    epoch = build_order(MakerTraits(1 << MakerTraits.NEED_CHECK_EPOCH_MANAGER_FLAG).with_expiration(NOW - 1))
+
+    wrong_salt = build_order(MakerTraits.default().enable_post_interaction(), post_interaction_extension())
+    wrong_salt.salt += 1
+
+    missing_flags = build_order(MakerTraits.default(), post_interaction_extension())
+    missing_flags.maker_traits = MakerTraits.default()
+
+    flags_without_data = build_order(MakerTraits.default().with_extension().enable_pre_interaction())
+
+    bad_hex = build_order(MakerTraits.default(), post_interaction_extension())
+    bad_hex.extension.custom_data = "0xabc"
+
+    codes = validate_orders([overflow, epoch, wrong_salt, missing_flags, flags_without_data, bad_hex], now=NOW)
+
+    assert describe_reasons(codes[0]) == ["MAKING_AMOUNT_RANGE", "SALT_RANGE"]
+    assert describe_reasons(codes[1]) == ["EPOCH_IN_BIT_INVALIDATOR", "EXPIRED"]
+    assert codes[2] == ValidationReason.SALT_EXTENSION_MISMATCH
+    assert codes[3] == ValidationReason.MISSING_EXTENSION_FLAG | ValidationReason.MISSING_POST_INTERACTION_FLAG
+    assert codes[4] == ValidationReason.EXTENSION_FLAG_WITHOUT_DATA | ValidationReason.PRE_INTERACTION_WITHOUT_DATA
+    assert codes[5] == ValidationReason.INVALID_EXTENSION
+
+
+def test_expiry_boundary():
+    orders = [build_order(MakerTraits.default().with_expiration(expiration)) for expiration in (NOW - 1, NOW, NOW + 1)]
+
+    assert [code == ValidationReason.EXPIRED for code in validate_orders(orders, now=NOW)] == [True, False, False]
@@ -0,0 +1,19 @@
+from benchmarks.cases import CASES
+from benchmarks.run import BenchResult, compare, format_report, run_suite
+
+
+def test_all_cases_run():
+    results = run_suite(list(CASES), sizes=[1], repeat=1)
+    assert [r.case for r in results] == list(CASES)
+    assert all(r.per_op_s > 0 for r in results)
+
+
+def test_compare_flags_regressions():
+    results = [BenchResult(case="fast", size=1, rounds=1, per_op_s=1.0), BenchResult(case="slow", size=1, rounds=1, per_op_s=2.0), BenchResult(case="new", size=1, rounds=1, per_op_s=1.0)]
+    baseline = {"fast[1]": 1.1, "slow[1]": 1.0}
+
+    comparisons = compare(results, baseline, threshold=0.25)
+
+    assert [c.is_regression for c in comparisons] == [False, True, False]
+    assert comparisons[2].ratio is None
+    assert "1 regression(s)" in format_report(comparisons, threshold=0.25)
@@ -0,0 +1,76 @@
+from limit_order_sdk import CancelFunction, LimitOrder, LimitOrderContract, MakerTraits, OrderStateTracker, build_cancel_calls
+from limit_order_sdk.limit_order_contract.limit_order_contract import get_lop_contract
+from tests.limit_order_sdk.helpers import MAKER, build_order
+
+CHAIN_ID = 1
+
+
+def test_cancel_calldata_matches_abi():
+    contract = get_lop_contract()
+    traits = MakerTraits.default().with_nonce(7)
+    order_hash = "0x" + "ab" * 32
+
+    assert LimitOrderContract.get_cancel_order_calldata(traits, order_hash) == contract.encodeABI(fn_name="cancelOrder", args=[traits.as_int(), order_hash])
+    assert LimitOrderContract.get_cancel_orders_calldata([traits, traits], [order_hash, order_hash]) == contract.encodeABI(fn_name="cancelOrders", args=[[traits.as_int()] * 2, [order_hash] * 2])
+    assert LimitOrderContract.get_bits_invalidate_for_order_calldata(traits, 0b1010) == contract.encodeABI(fn_name="bitsInvalidateForOrder", args=[traits.as_int(), 0b1010])
+    assert LimitOrderContract.get_increase_epoch_calldata(3) == contract.encodeABI(fn_name="increaseEpoch", args=[3])
+    assert LimitOrderContract.get_advance_epoch_calldata(3, 2) == contract.encodeABI(fn_name="advanceEpoch", args=[3, 2])
+
+
+def test_get_order_hashes():
+    orders = [build_order(MakerTraits.default().with_nonce(i), salt=i + 1) for i in range(3)]
+
+    assert LimitOrder.get_order_hashes(orders, CHAIN_ID) == [order.get_order_hash(CHAIN_ID) for order in orders]
+
+
+def test_single_order_is_cancelled_by_hash():
+    order = build_order(MakerTraits.default().with_nonce(1))
+
+    calls = build_cancel_calls([order], CHAIN_ID)
+
+    assert [call.function for call in calls] == [CancelFunction.CANCEL_ORDER]
+    assert calls[0].calldata == LimitOrderContract.get_cancel_order_calldata(order.maker_traits, order.get_order_hash(CHAIN_ID))
+
+
+def test_bit_invalidator_slot_is_invalidated_at_once():
+    # 10 nonces of slot 0, 2 nonces of slot 1 and 2 multiple-fill orders
+    bit_orders = [build_order(MakerTraits.default().with_nonce(nonce), salt=nonce + 1) for nonce in list(range(10)) + [256, 300]]
+    hash_orders = [build_order(MakerTraits.default().allow_multiple_fills(), salt=1000 + i) for i in range(2)]
+    orders = bit_orders + hash_orders
+
+    calls = build_cancel_calls(orders, CHAIN_ID)
+
+    assert [call.function for call in calls] == [CancelFunction.CANCEL_ORDERS, CancelFunction.BITS_INVALIDATE_FOR_ORDER]
+    assert len(calls[0].order_hashes) == 4
+    assert calls[1].calldata == LimitOrderContract.get_bits_invalidate_for_order_calldata(bit_orders[0].maker_traits, 0b1111111110)
+    assert sorted(sum((call.order_hashes for call in calls), [])) == sorted(LimitOrder.get_order_hashes(orders, CHAIN_ID))
+
+    # Replaying the calls invalidates every order
+    tracker = OrderStateTracker()
+    for call in calls:
+        if call.function == CancelFunction.BITS_INVALIDATE_FOR_ORDER:
+            tracker.apply_bits_invalidate(MAKER, bit_orders[0].maker_traits, 0b1111111110)
+        else:
+            for order, order_hash in zip(orders, LimitOrder.get_order_hashes(orders, CHAIN_ID)):
+                if order_hash in call.order_hashes:
+                    tracker.apply_cancel(MAKER, order.maker_traits, order_hash)
+    assert not any(tracker.is_fillable(order, order_hash) for order, order_hash in zip(orders, LimitOrder.get_order_hashes(orders, CHAIN_ID)))
+
+
+def test_epoch_bump_is_opt_in():
+    orders = [build_order(MakerTraits.default().allow_multiple_fills().with_epoch(5, 2), salt=i + 1) for i in range(3)]
+
+    assert [call.function for call in build_cancel_calls(orders, CHAIN_ID)] == [CancelFunction.CANCEL_ORDERS]
+
+    calls = build_cancel_calls(orders, CHAIN_ID, allow_epoch_bump=True)
+    assert [call.function for call in calls] == [CancelFunction.INCREASE_EPOCH]
+    assert calls[0].calldata == LimitOrderContract.get_increase_epoch_calldata(5)
+
+
+def test_epoch_bump_skips_series_with_several_epochs():
+    orders = [build_order(MakerTraits.default().allow_multiple_fills().with_epoch(5, epoch), salt=i + 1) for i, epoch in enumerate([2, 2, 3])]
+
+    calls = build_cancel_calls(orders, CHAIN_ID, allow_epoch_bump=True)
+
+    assert [call.function for call in calls] == [CancelFunction.CANCEL_ORDERS]
+    assert len(calls[0].order_hashes) == 3
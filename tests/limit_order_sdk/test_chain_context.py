@@ -0,0 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from eth_account import Account
+
+from limit_order_sdk import ChainContext, LimitOrder, MakerTraits, OrderTemplate, get_chain_context
+from limit_order_sdk.constants import ONE_INCH_LIMIT_ORDER_V4_ZK_SYNC
+from tests.limit_order_sdk.helpers import MAKER, USDC, WETH, build_order
+
+
+def signed_message_hash(order: LimitOrder, chain_id: int) -> str:
+    typed_data = order.get_typed_data(chain_id)
+    full_message = {"primaryType": typed_data.primaryType, "types": typed_data.types, "domain": typed_data.domain, "message": typed_data.message}
+    signed = Account.sign_typed_data(Account.create().key, full_message=full_message)
+    return "0x" + bytes(signed.messageHash).hex()
+
+
+def test_contexts_are_shared_and_immutable():
+    context = get_chain_context(324)
+
+    assert get_chain_context(324) is context
+    assert get_chain_context(context) is context
+    assert context.verifying_contract == ONE_INCH_LIMIT_ORDER_V4_ZK_SYNC
+    assert context.domain["chainId"] == 324
+    with pytest.raises(AttributeError):
+        context.chain_id = 1
+    with pytest.raises(TypeError):
+        context.domain["chainId"] = 1
+
+
+def test_contexts_are_built_once_across_threads():
+    with ThreadPoolExecutor(8) as executor:
+        contexts = list(executor.map(get_chain_context, [8453] * 64))
+
+    assert all(context is contexts[0] for context in contexts)
+
+
+@pytest.mark.parametrize("chain_id", [1, 56, 324])
+def test_order_hash_is_signed_digest(chain_id):
+    order = build_order(MakerTraits.default().with_nonce(1))
+
+    assert order.get_order_hash(chain_id) == signed_message_hash(order, chain_id)
+    assert order.get_order_hash(get_chain_context(chain_id)) == order.get_order_hash(chain_id)
+    assert LimitOrder.get_order_hashes([order], get_chain_context(chain_id)) == [order.get_order_hash(chain_id)]
+
+
+def test_order_hash_known_vector():
+    # Computed independently: keccak256(0x1901 || domainSeparator || hashStruct(order)), the contract `hashOrder` of the order on mainnet
+    order = build_order(MakerTraits.default().with_nonce(1))
+
+    assert get_chain_context(1).domain_separator_hex() == "0xd999e213f11c7bfa3e796c3409e316f25e02aa3e25e5c207a92e381c7d22b6de"
+    assert order.get_order_hash(1) == "0x6c25fdf59031bcd289eea2693970cfbc0b445003e536fe75f1558bca2b78d86d"
+    assert LimitOrder.get_order_hashes([order], 1) == ["0x6c25fdf59031bcd289eea2693970cfbc0b445003e536fe75f1558bca2b78d86d"]
+
+
+def test_order_hash_depends_on_chain():
+    order = build_order(MakerTraits.default().with_nonce(1))
+
+    assert order.get_order_hash(1) != order.get_order_hash(324)
+
+
+def test_template_accepts_context():
+    context = get_chain_context(1)
+    template = OrderTemplate(MAKER, WETH, USDC)
+    orders = template.stamp([10**18], [1420 * 10**6])
+
+    assert template.get_order_hashes(orders, context) == [orders[0].get_order_hash(1)]
+    assert template.get_typed_data(orders, context)[0] == orders[0].get_typed_data(1)
+    assert isinstance(context, ChainContext)
@@ -0,0 +1,102 @@
+import json
+import os
+import subprocess
+import sys
+
+from limit_order_sdk import LimitOrder
+from limit_order_sdk.cli import main
+from limit_order_sdk.cli.bench import KINDS, OPERATIONS, format_stats, run_bench
+from limit_order_sdk.cli.order_stream import StreamSummary, order_to_json, stream_process
+from tests.limit_order_sdk.helpers import build_numbered_order
+
+
+def api_line(order: LimitOrder, order_hash=None) -> str:
+    return json.dumps({"orderHash": order_hash, "signature": "0x1b", "data": order_to_json(order)})
+
+
+def read_jsonl(path) -> list:
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_validate_reports_errors_and_exit_code(tmp_path, capsys):
+    orders = [build_numbered_order(i, with_extension=i % 2 == 1) for i in range(4)]
+    lines = [api_line(orders[0], orders[0].get_order_hash(1)), api_line(orders[1], "0x" + "00" * 32), "not an order", "", orders[2].to_calldata()]
+    source, target = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    source.write_text("\n".join(lines) + "\n")
+
+    assert main(["validate", str(source), "-o", str(target)]) == 1
+
+    results = read_jsonl(target)
+    assert [result["line"] for result in results] == [1, 2, 3, 5]
+    assert [result["valid"] for result in results] == [True, False, False, True]
+    assert results[1]["error"].startswith("orderHash mismatch")
+    assert "2 orders, 2 errors" in capsys.readouterr().err
+
+
+def test_validate_without_asserts(tmp_path):
+    order = build_numbered_order(1, with_extension=True)
+    data = order_to_json(order)
+    data["salt"] = str(order.salt + 1)
+    source, target = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    source.write_text(api_line(order) + "\n" + json.dumps({"data": data}) + "\n")
+
+    # Under `python -O` the salt is not checked when the order is parsed
+    code = f"import sys; from limit_order_sdk.cli import main; sys.exit(main(['validate', {str(source)!r}, '-o', {str(target)!r}]))"
+    assert subprocess.run([sys.executable, "-O", "-c", code], env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}).returncode == 1
+
+    results = read_jsonl(target)
+    assert [result["valid"] for result in results] == [True, False]
+    assert results[1]["error"] == "invalid order: SALT_EXTENSION_MISMATCH"
+
+
+def test_truncated_calldata_is_reported_per_line():
+    order = build_numbered_order(2)
+    lines = [order.to_calldata(), "0x1234", order.to_calldata()[:-2]]
+
+    summary = StreamSummary()
+    results = [json.loads(line) for line in stream_process("hash", lines, 1, summary=summary)]
+
+    assert results[0] == {"line": 1, "orderHash": order.get_order_hash(1)}
+    assert [result["line"] for result in results[1:]] == [2, 3] and all("error" in result for result in results[1:])
+    assert summary.errors == 2
+
+
+def test_decode_round_trips_api_json(tmp_path):
+    orders = [build_numbered_order(i, with_extension=i % 2 == 1) for i in range(6)]
+    source, target = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    source.write_text("".join(api_line(order) + "\n" for order in orders))
+
+    assert main(["decode", str(source), "-o", str(target), "--chain-id", "137", "--chunk-size", "4"]) == 0
+
+    results = read_jsonl(target)
+    assert [result["orderHash"] for result in results] == LimitOrder.get_order_hashes(orders, 137)
+    assert [result["data"] for result in results] == [order_to_json(order) for order in orders]
+
+
+def test_encode_and_parallel_hash_match_sequential():
+    orders = [build_numbered_order(i, with_extension=i % 2 == 1) for i in range(30)]
+    lines = [api_line(order) for order in orders]
+
+    encoded = [json.loads(line) for line in stream_process("encode", lines, 1)]
+    assert [result["calldata"] for result in encoded] == [order.to_calldata() for order in orders]
+    assert [result["extension"] for result in encoded] == [order.extension.encode() for order in orders]
+
+    summary = StreamSummary()
+    parallel = list(stream_process("hash", lines, 1, workers=2, chunk_size=7, summary=summary))
+    assert parallel == list(stream_process("hash", lines, 1))
+    assert (summary.lines, summary.orders, summary.errors) == (30, 30, 0)
+
+
+def test_bench_reports_every_operation_and_kind(capsys):
+    assert main(["bench", "--count", "3", "--json"]) == 0
+    rows = json.loads(capsys.readouterr().out)
+
+    assert {(row["operation"], row["kind"]) for row in rows} == {(operation, kind) for operation in OPERATIONS for kind in KINDS if operation != "extension_decode" or kind == "extension"}
+    assert all(row["count"] == 3 and row["orders_per_s"] > 0 and row["p50_us"] <= row["p99_us"] <= row["max_us"] for row in rows)
+
+
+def test_bench_table_has_selected_operations():
+    table = format_stats(run_bench(2, operations=["hash"], kinds=["rfq", "limit"]))
+
+    assert [line.split()[:2] for line in table.splitlines()[1:]] == [["hash", "rfq"], ["hash", "limit"]]
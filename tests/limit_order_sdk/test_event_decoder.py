@@ -0,0 +1,82 @@
+import io
+import json
+
+import pytest
+from eth_abi import encode
+from hexbytes import HexBytes
+
+from limit_order_sdk import (
+    BitInvalidatorUpdatedEvent,
+    EpochIncreasedEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderStateTracker,
+    decode_jsonl_logs,
+    decode_log,
+    decode_logs,
+)
+from limit_order_sdk.events.event_decoder import BIT_INVALIDATOR_UPDATED_TOPIC, EPOCH_INCREASED_TOPIC, ORDER_CANCELLED_TOPIC, ORDER_FILLED_TOPIC
+from limit_order_sdk.limit_order_contract.limit_order_contract import get_lop_contract
+
+ROUTER = "0x111111125421ca6dc452d289314280a0f8842a65"
+MAKER = "0x00000000219ab540356cbb839cbe05303d7705fa"
+ORDER_HASH = "0x" + "ab" * 32
+
+
+def build_log(topics: list, types: list, values: list, block_number: int = 1, log_index: int = 0) -> dict:
+    return {"address": ROUTER, "topics": topics, "data": "0x" + encode(types, values).hex(), "blockNumber": hex(block_number), "logIndex": hex(log_index), "removed": False}
+
+
+def maker_topic(maker: str) -> str:
+    return "0x" + maker[2:].zfill(64)
+
+
+def build_logs() -> list:
+    return [
+        build_log([ORDER_FILLED_TOPIC], ["bytes32", "uint256"], [bytes.fromhex(ORDER_HASH[2:]), 70], log_index=0),
+        build_log([ORDER_CANCELLED_TOPIC], ["bytes32"], [bytes.fromhex(ORDER_HASH[2:])], log_index=1),
+        build_log([BIT_INVALIDATOR_UPDATED_TOPIC, maker_topic(MAKER)], ["uint256", "uint256"], [1, 1 << 44], log_index=2),
+        build_log([EPOCH_INCREASED_TOPIC, maker_topic(MAKER)], ["uint256", "uint256"], [2, 5], log_index=3),
+        build_log(["0x" + "00" * 32], ["uint256"], [1]),  # unrelated event
+    ]
+
+
+def test_topics_match_abi():
+    contract = get_lop_contract()
+    for event, topic in [("OrderFilled", ORDER_FILLED_TOPIC), ("OrderCancelled", ORDER_CANCELLED_TOPIC), ("BitInvalidatorUpdated", BIT_INVALIDATOR_UPDATED_TOPIC), ("EpochIncreased", EPOCH_INCREASED_TOPIC)]:
+        abi = next(item for item in contract.abi if item.get("type") == "event" and item["name"] == event)
+        signature = f"{event}({','.join(i['type'] for i in abi['inputs'])})"
+        assert "0x" + contract.w3.keccak(text=signature).hex()[-64:] == topic
+
+
+def test_decode_logs():
+    assert list(decode_logs(build_logs())) == [
+        OrderFilledEvent(ORDER_HASH, 70, 1, 0),
+        OrderCancelledEvent(ORDER_HASH, 1, 1),
+        BitInvalidatorUpdatedEvent(MAKER, 1, 1 << 44, 1, 2),
+        EpochIncreasedEvent(MAKER, 2, 5, 1, 3),
+    ]
+    assert list(decode_logs(build_logs(), address="0x" + "00" * 20)) == []
+
+
+def test_decode_web3_log():
+    log = build_logs()[2]
+    web3_log = {**log, "topics": [HexBytes(topic) for topic in log["topics"]], "data": HexBytes(log["data"]), "blockNumber": 1, "logIndex": 2}
+    assert decode_log(web3_log) == decode_log(log)
+
+
+def test_malformed_log():
+    log = build_logs()[0]
+    with pytest.raises(ValueError, match="Malformed order_filled"):
+        decode_log({**log, "data": log["data"][:-64]})
+
+
+def test_replay_jsonl_into_tracker():
+    dump = io.StringIO("\n".join(json.dumps(log) for log in build_logs()))
+    tracker = OrderStateTracker()
+    tracker.apply_events(decode_jsonl_logs(dump))
+
+    assert tracker.remaining[ORDER_HASH] == 0
+    assert ORDER_HASH in tracker.cancelled
+    assert tracker.bit_invalidator(MAKER, 1) == 1 << 44
+    assert tracker.epoch(MAKER, 2) == 5
@@ -0,0 +1,82 @@
+import threading
+from limit_order_sdk import ExpiryScheduler, LimitOrder, MakerTraits
+from tests.limit_order_sdk.helpers import build_order
+
+
+def expiring_order(salt: int, expiration: int = 0) -> LimitOrder:
+    return build_order(MakerTraits.default().with_expiration(expiration), salt=salt)
+
+
+def test_sweep_evicts_expired_orders_in_order():
+    evicted = []
+    scheduler = ExpiryScheduler(on_expire=lambda key, order: evicted.append((key, order.salt)))
+    scheduler.register("c", expiring_order(3, 300))
+    scheduler.register("a", expiring_order(1, 100))
+    scheduler.register("b", expiring_order(2, 200))
+    assert not scheduler.register("never", expiring_order(4))
+
+    assert scheduler.next_expiration() == 100
+    assert scheduler.sweep(now=100) == []
+    assert scheduler.sweep(now=201) == ["a", "b"]
+    assert evicted == [("a", 1), ("b", 2)]
+    assert len(scheduler) == 1 and "c" in scheduler
+    assert scheduler.next_expiration() == 300
+
+
+def test_unregister_and_reregister():
+    scheduler = ExpiryScheduler()
+    scheduler.register("a", expiring_order(1, 100))
+    scheduler.register("b", expiring_order(2, 100))
+    assert scheduler.unregister("a").salt == 1
+    assert scheduler.unregister("a") is None
+
+    # Re-registering moves the order to its new expiration
+    scheduler.register("b", expiring_order(2, 500))
+    assert scheduler.sweep(now=200) == []
+    assert scheduler.next_expiration() == 500
+    assert scheduler.sweep(now=501) == ["b"]
+    assert len(scheduler) == 0
+
+
+def test_heap_is_compacted():
+    scheduler = ExpiryScheduler()
+    for i in range(1000):
+        scheduler.register(i, expiring_order(i + 1, 1000 + i))
+    for i in range(990):
+        scheduler.unregister(i)
+    assert len(scheduler._heap) < 200
+    assert scheduler.sweep(now=10_000) == list(range(990, 1000))
+
+
+def test_background_sweep():
+    evicted = threading.Event()
+    scheduler = ExpiryScheduler(on_expire=lambda key, order: evicted.set(), clock=lambda: 1000)
+    scheduler.register("a", expiring_order(1, 10))
+    scheduler.start(interval=0.01)
+    try:
+        assert evicted.wait(timeout=5)
+    finally:
+        scheduler.stop()
+    assert len(scheduler) == 0
+
+
+def test_raising_callback_does_not_stop_the_sweeper(caplog):
+    evicted = []
+    done = threading.Event()
+
+    def on_expire(key, order):
+        if key == "a":
+            raise RuntimeError("store unavailable")
+        evicted.append(key)
+        done.set()
+
+    scheduler = ExpiryScheduler(on_expire=on_expire, clock=lambda: 1000)
+    scheduler.register("a", expiring_order(1, 10))
+    scheduler.start(interval=0.01)
+    try:
+        scheduler.register("b", expiring_order(2, 20))
+        assert done.wait(timeout=5)
+    finally:
+        scheduler.stop()
+    assert evicted == ["b"] and len(scheduler) == 0
+    assert "on_expire failed for order 'a'" in caplog.text
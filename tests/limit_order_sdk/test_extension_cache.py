@@ -0,0 +1,65 @@
+import pytest
+
+from limit_order_sdk import Extension, ExtensionBuilder, ExtensionCache, FrozenExtension, Interaction, default_extension_cache
+from tests.limit_order_sdk.helpers import MAKER
+
+
+def build_extension(predicate: str = "0xdeadbeef") -> Extension:
+    return ExtensionBuilder().with_predicate(predicate).with_post_interaction(Interaction(MAKER, "0xcafe")).build()
+
+
+def test_decode_returns_interned_instance():
+    cache = ExtensionCache()
+    data = build_extension().encode()
+
+    first = cache.decode(data)
+    assert cache.decode(data) is first
+    assert first == Extension.decode(data)
+    assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+
+
+def test_intern_shares_equal_extensions():
+    cache = ExtensionCache()
+    first = cache.intern(build_extension())
+    assert cache.intern(build_extension()) is first
+    assert cache.decode(first.encode()) is first
+
+
+def test_cache_is_bounded():
+    cache = ExtensionCache(maxsize=2)
+    extensions = [ExtensionBuilder().with_custom_data(f"0x0{i}").build() for i in range(3)]
+    interned = [cache.intern(ext) for ext in extensions]
+    assert len(cache) == 2 and cache.misses == 3
+
+    # The least recently used extension was evicted, the others are still interned
+    assert cache.intern(extensions[2]) is interned[2] and cache.misses == 3
+    assert cache.intern(extensions[0]) is not interned[0] and cache.misses == 4
+    assert len(cache) == 2
+
+
+def test_cached_encoding_follows_field_changes():
+    ext = build_extension()
+    encoded, hash_ = ext.encode(), ext.keccak256()
+
+    ext.predicate = "0xbeef"
+    assert ext.encode() != encoded
+    assert ext.keccak256() != hash_
+    assert ext.encode() == build_extension("0xbeef").encode()
+
+
+def test_interned_extensions_are_immutable():
+    cache = ExtensionCache()
+    ext = build_extension()
+    interned = cache.intern(ext)
+    decoded = default_extension_cache.decode(build_extension("0xcafe").encode())
+
+    assert isinstance(interned, FrozenExtension) and isinstance(decoded, FrozenExtension)
+    assert interned is not ext and interned == ext and ext == interned
+    with pytest.raises(AttributeError):
+        interned.predicate = "0xbeef"
+    with pytest.raises(AttributeError):
+        decoded.custom_data = "0x00"
+
+    ext.predicate = "0xbeef"  # the source extension stays mutable and independent
+    assert interned.predicate == "0xdeadbeef"
+    assert hash(interned) == hash(build_extension().freeze())
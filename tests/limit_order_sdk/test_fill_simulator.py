@@ -0,0 +1,46 @@
+from limit_order_sdk import AmountMode, FillSimulator, LimitOrder, MakerTraits, TakerTraits
+from limit_order_sdk.limit_order.amounts import calc_making_amount, calc_taking_amount
+from tests.limit_order_sdk.helpers import build_order
+
+
+def priced_order(making_amount: int, taking_amount: int, partial: bool = True) -> LimitOrder:
+    traits = MakerTraits.default() if partial else MakerTraits.default().disable_partial_fills()
+    return build_order(traits, making_amount=making_amount, taking_amount=taking_amount)
+
+
+def test_fills_best_rate_first():
+    orders = [priced_order(10, 30), priced_order(10, 20), priced_order(10, 25)]
+    plan = FillSimulator(orders).simulate(30)
+
+    assert [(fill.index, fill.making_amount, fill.taking_amount) for fill in plan.fills] == [(1, 10, 20), (2, 4, 10)]
+    assert (plan.making_amount, plan.taking_amount, plan.unfilled_amount) == (14, 30, 0)
+
+
+def test_protocol_rounding_and_thresholds():
+    orders = [priced_order(7, 3), priced_order(100, 70)]
+    plan = FillSimulator(orders).simulate(5)
+
+    full, partial = plan.fills
+    assert (full.making_amount, full.taking_amount) == (7, calc_taking_amount(7, 7, 3))
+    assert (partial.making_amount, partial.taking_amount) == (calc_making_amount(2, 100, 70), 2)
+    assert partial.taker_traits().flags.value == TakerTraits.default().set_amount_threshold(partial.making_amount).flags.value
+
+
+def test_remaining_amounts_and_partial_fills():
+    orders = [priced_order(10, 10, partial=False), priced_order(10, 20, partial=False), priced_order(10, 30)]
+    simulator = FillSimulator(orders, remaining_making_amounts=[5, None, None])
+
+    # The first order is partially filled and the second one can't be used partially
+    plan = simulator.simulate(15)
+    assert [(fill.index, fill.making_amount) for fill in plan.fills] == [(2, 5)]
+
+    simulator.set_remaining(2, 0)
+    assert simulator.simulate(15).unfilled_amount == 15
+
+
+def test_maker_amount_mode():
+    orders = [priced_order(10, 20), priced_order(10, 30)]
+    plan = FillSimulator(orders).simulate(15, AmountMode.MAKER)
+
+    assert [(fill.making_amount, fill.taking_amount, fill.amount, fill.threshold) for fill in plan.fills] == [(10, 20, 10, 20), (5, 15, 5, 15)]
+    assert plan.fills[0].taker_traits().get_amount_mode() == AmountMode.MAKER
@@ -0,0 +1,90 @@
+import pytest
+
+from limit_order_sdk import ExtensionBuilder, FrozenInteraction, FrozenLimitOrder, FrozenMakerTraits, Interaction, LimitOrder, MakerTraits, OrderInfoData
+from tests.limit_order_sdk.helpers import MAKER, USDC, WETH
+
+
+def build_order_info(salt: int = 1) -> OrderInfoData:
+    return OrderInfoData(maker_asset=WETH, taker_asset=USDC, making_amount=10**18, taking_amount=1420 * 10**6, maker=MAKER, salt=salt)
+
+
+def test_default_maker_traits_are_not_shared():
+    extension = ExtensionBuilder().with_maker_permit(USDC, "0xdeadbeef").build()
+    with_extension = LimitOrder(build_order_info(salt=None), extension=extension)
+    without_extension = LimitOrder(build_order_info())
+
+    assert with_extension.maker_traits.has_extension()
+    assert not without_extension.maker_traits.has_extension()
+    assert with_extension.maker_traits is not without_extension.maker_traits
+
+
+def test_frozen_maker_traits():
+    traits = MakerTraits.default().freeze()
+    expiring = traits.with_expiration(1000).with_nonce(5)
+
+    assert isinstance(expiring, FrozenMakerTraits)
+    assert traits.as_int() == 0
+    assert expiring.expiration() == 1000 and expiring.nonce_or_epoch() == 5
+    assert expiring == MakerTraits.default().with_expiration(1000).with_nonce(5).freeze()
+    assert len({expiring, expiring.thaw().freeze(), traits}) == 2
+    assert traits.allow_multiple_fills().enable_epoch_manager_check().is_epoch_manager_enabled()
+    with pytest.raises(AttributeError):
+        traits.value = None
+
+
+def test_frozen_interaction():
+    interaction = Interaction(MAKER, "0xDEADBEEF").freeze()
+
+    assert interaction == FrozenInteraction.decode(interaction.encode())
+    assert hash(interaction) == hash(FrozenInteraction(MAKER, "0xdeadbeef"))
+    assert interaction.with_data("0x01").data == "0x01" and interaction.data == "0xDEADBEEF"
+    with pytest.raises(AttributeError):
+        interaction.data = "0x"
+
+
+def test_frozen_limit_order():
+    order = LimitOrder(build_order_info(), MakerTraits.default().with_nonce(3))
+    frozen = order.freeze()
+
+    assert isinstance(frozen.maker_traits, FrozenMakerTraits)
+    assert frozen == order
+    assert frozen.get_order_hash(1) == order.get_order_hash(1)
+    assert frozen.get_order_hash(1) is frozen.get_order_hash(1)
+    assert frozen.get_order_hash(324) == order.get_order_hash(324)
+    assert {frozen: 1}[FrozenLimitOrder(build_order_info(), MakerTraits.default().with_nonce(3))] == 1
+    with pytest.raises(AttributeError):
+        frozen.making_amount = 1
+
+    cheaper = frozen.with_taking_amount(1)
+    assert cheaper.taking_amount == 1 and frozen.taking_amount == 1420 * 10**6
+    assert cheaper.get_order_hash(1) != frozen.get_order_hash(1)
+    assert frozen.with_maker_traits(MakerTraits.default().with_nonce(4)).maker_traits.nonce_or_epoch() == 4
+
+    thawed = frozen.thaw()
+    thawed.making_amount = 1
+    assert frozen.making_amount == 10**18
+
+
+def test_frozen_order_with_extension_keeps_salt():
+    extension = ExtensionBuilder().with_maker_permit(USDC, "0xdeadbeef").build()
+    order = LimitOrder(build_order_info(salt=None), extension=extension).freeze()
+
+    assert order.maker_traits.has_extension()
+    assert order.with_making_amount(5).salt == order.salt
+
+
+def test_frozen_order_does_not_share_extension():
+    extension = ExtensionBuilder().with_custom_data("0xdeadbeef").build()
+    order = LimitOrder(build_order_info(salt=None), extension=extension)
+    frozen = order.freeze()
+    order_hash = frozen.get_order_hash(1)
+
+    extension.custom_data = "0xcafe"
+    assert frozen.extension.custom_data == "0xdeadbeef"
+    assert frozen.get_order_hash(1) == order_hash
+    with pytest.raises(AttributeError):
+        frozen.extension.custom_data = "0xcafe"
+
+    thawed = frozen.thaw()
+    thawed.extension.custom_data = "0xcafe"
+    assert frozen.extension.custom_data == "0xdeadbeef"
@@ -0,0 +1,43 @@
+import json
+import os
+import subprocess
+import sys
+
+# Cold-start budget for `import limit_order_sdk` plus the core order classes, in milliseconds.
+# Loading web3 alone takes several hundred milliseconds, so this catches heavy imports creeping back in.
+IMPORT_TIME_BUDGET_MS = 150
+HEAVY_MODULES = ["web3", "eth_abi", "eth_account", "eth_utils", "requests"]
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import limit_order_sdk
+from limit_order_sdk import Address, LimitOrder, MakerTraits, TakerTraits, OrderInfoData, Extension, ExtensionBuilder, RfqOrder, Api, FetchProviderConnector, LimitOrderContract
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({"elapsed_ms": elapsed_ms, "modules": sorted(sys.modules)}))
+"""
+
+
+def run_import_script() -> dict:
+    output = subprocess.check_output([sys.executable, "-c", IMPORT_SCRIPT], cwd=ROOT_DIR)
+    return json.loads(output)
+
+
+def test_import_does_not_load_heavy_dependencies():
+    modules = run_import_script()["modules"]
+    for heavy in HEAVY_MODULES:
+        assert heavy not in modules, f"{heavy} must be imported lazily"
+
+
+def test_import_time_budget():
+    # Best of several runs, to keep the check stable on noisy machines
+    elapsed_ms = min(run_import_script()["elapsed_ms"] for _ in range(3))
+    assert elapsed_ms < IMPORT_TIME_BUDGET_MS, f"import took {elapsed_ms:.1f}ms, budget is {IMPORT_TIME_BUDGET_MS}ms"
+
+
+def test_lazy_attributes_resolve():
+    import limit_order_sdk
+
+    for name in limit_order_sdk.__all__:
+        assert getattr(limit_order_sdk, name) is not None
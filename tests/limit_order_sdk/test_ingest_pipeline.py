@@ -0,0 +1,97 @@
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import pytest
+
+from limit_order_sdk import IngestPipeline, LimitOrder, OrderArchiveReader, OrderArchiveWriter, encode_order_record
+from tests.limit_order_sdk.helpers import build_numbered_order
+
+SIGNATURE = "0x" + "11" * 32 + "22" * 32 + "1b"
+
+
+def reject_odd_making_amount(order: LimitOrder) -> Optional[str]:
+    return "odd making amount" if order.making_amount % 2 else None
+
+
+def raise_on_order(order: LimitOrder) -> Optional[str]:
+    raise RuntimeError("validator failed")
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_results_are_in_input_order(workers):
+    orders = [build_numbered_order(i, with_extension=i % 3 == 0) for i in range(50)]
+    records = [encode_order_record(order, SIGNATURE) for order in orders]
+
+    with IngestPipeline(chain_id=1, workers=workers, batch_size=7) as pipeline:
+        results = list(pipeline.run(records))
+
+    assert [result.record for result in results] == records
+    assert [result.order_hash for result in results] == LimitOrder.get_order_hashes(orders, 1)
+    assert all(result.error is None for result in results)
+
+
+def test_invalid_records_are_reported():
+    orders = [build_numbered_order(i, with_extension=i % 3 == 0) for i in range(10)]
+    records = [encode_order_record(order, SIGNATURE) for order in orders]
+    records[2] = records[2][:-1]  # truncated signature
+    records[4] = records[4][:-20]
+
+    with IngestPipeline(chain_id=1, workers=2, batch_size=3, validator=reject_odd_making_amount) as pipeline:
+        results = list(pipeline.run(records))
+
+    errors = {i: result.error for i, result in enumerate(results) if result.error is not None}
+    assert set(errors) == {1, 2, 3, 4, 5, 7, 9}
+    assert errors[1] == "odd making amount"
+    assert errors[2].startswith("Malformed record")
+    assert all(results[i].order_hash == orders[i].get_order_hash(1) for i in (0, 6, 8))
+
+
+def test_input_is_read_with_backpressure():
+    read = []
+
+    def source():
+        for i in range(40):
+            read.append(i)
+            yield encode_order_record(build_numbered_order(i, with_extension=i % 3 == 0), SIGNATURE)
+
+    with IngestPipeline(chain_id=1, workers=0, batch_size=4, max_in_flight=2) as pipeline:
+        results = pipeline.run(source())
+        next(results)
+        assert len(read) == 8  # two batches in flight
+
+        results.close()
+
+
+def test_failed_batch_segment_is_unlinked(monkeypatch):
+    from limit_order_sdk.ingest import ingest_pipeline
+
+    names = []
+
+    def write_batch(records):
+        shm = _write_batch(records)
+        names.append(shm.name)
+        return shm
+
+    _write_batch = ingest_pipeline._write_batch
+    monkeypatch.setattr(ingest_pipeline, "_write_batch", write_batch)
+
+    with IngestPipeline(chain_id=1, workers=0, batch_size=4, validator=raise_on_order) as pipeline:
+        with pytest.raises(RuntimeError, match="validator failed"):
+            list(pipeline.run(encode_order_record(build_numbered_order(i, with_extension=i % 3 == 0), SIGNATURE) for i in range(8)))
+
+    assert len(names) == 1
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=names[0])
+
+
+def test_index_stage_writes_archive(tmp_path):
+    orders = [build_numbered_order(i, with_extension=i % 3 == 0) for i in range(20)]
+    path = str(tmp_path / "orders.bin")
+
+    with IngestPipeline(chain_id=1, workers=2, batch_size=6) as pipeline, OrderArchiveWriter(path, chain_id=1) as writer:
+        for result in pipeline.run(encode_order_record(order, SIGNATURE) for order in orders):
+            writer.append_record(result.record, result.order_hash)
+
+    with OrderArchiveReader(path) as archive:
+        assert len(archive) == 20
+        assert archive.get_by_hash(orders[7].get_order_hash(1)).order == orders[7]
@@ -0,0 +1,120 @@
+import pytest
+
+from limit_order_sdk import LadderLevel, LadderManager, NonceAllocator, RfqPair, RfqQuoter
+from tests.limit_order_sdk.helpers import NOW, PRIVATE_KEY, USDC, WETH
+
+
+def ladder(*prices: int):
+    return [LadderLevel(10**18, price * 10**6) for price in prices]
+
+
+def build_manager(submitted: list, cancelled: list, refresh_margin: int = 0) -> LadderManager:
+    quoter = RfqQuoter(PRIVATE_KEY, chain_id=1, nonce_allocator=NonceAllocator())
+    return LadderManager(quoter, RfqPair(WETH, USDC, ttl=60), submit=submitted.append, cancel=cancelled.extend, refresh_margin=refresh_margin)
+
+
+def test_only_changed_levels_are_requoted():
+    submitted, cancel_calls = [], []
+    manager = build_manager(submitted, cancel_calls)
+
+    first = manager.refresh(ladder(1400, 1410, 1420, 1430), now=NOW)
+    assert len(first.created) == 4 and not first.kept and not first.cancel_calls
+
+    second = manager.refresh(ladder(1410, 1420, 1430, 1440), now=NOW + 1)
+    assert second.saved == 3
+    assert [quote.order.taking_amount for quote in second.created] == [1440 * 10**6]
+    assert [quote.order.taking_amount for quote in second.cancelled] == [1400 * 10**6]
+    assert [order_hash for call in second.cancel_calls for order_hash in call.order_hashes] == [second.cancelled[0].order_hash]
+
+    assert submitted == first.created + second.created
+    assert cancel_calls == second.cancel_calls
+    assert sorted(quote.order.taking_amount for quote in manager.live) == [level.taking_amount for level in ladder(1410, 1420, 1430, 1440)]
+    assert (manager.stats.levels, manager.stats.kept, manager.stats.created, manager.stats.cancelled) == (8, 3, 5, 1)
+
+
+def test_duplicate_levels_and_expiring_quotes():
+    submitted, cancel_calls = [], []
+    manager = build_manager(submitted, cancel_calls, refresh_margin=10)
+
+    manager.refresh(ladder(1400, 1400, 1410), now=NOW)
+    same = manager.refresh(ladder(1400, 1400, 1410), now=NOW + 30)
+    assert same.saved == 3 and not same.created and not same.cancelled
+
+    # Quotes expire at NOW + 60, within the margin every level is quoted again
+    renewed = manager.refresh(ladder(1400, 1410), now=NOW + 55)
+    assert renewed.saved == 0
+    assert len(renewed.created) == 2 and len(renewed.cancelled) == 3
+    assert len({quote.order.maker_traits.nonce_or_epoch() for quote in submitted}) == len(submitted) == 5
+
+
+def test_expired_quotes_are_dropped_without_cancelling():
+    submitted, cancel_calls = [], []
+    manager = build_manager(submitted, cancel_calls, refresh_margin=10)
+
+    manager.refresh(ladder(1400, 1410), now=NOW)
+    manager.refresh(ladder(1400, 1410, 1420), now=NOW + 20)
+
+    # The first two quotes expired at NOW + 60, the third one expires within the margin
+    refresh = manager.refresh(ladder(1400, 1410, 1420), now=NOW + 75)
+    assert [quote.order.taking_amount for quote in refresh.expired] == [1400 * 10**6, 1410 * 10**6]
+    assert [quote.order.taking_amount for quote in refresh.cancelled] == [1420 * 10**6]
+    assert [order_hash for call in refresh.cancel_calls for order_hash in call.order_hashes] == [refresh.cancelled[0].order_hash]
+    assert len(refresh.created) == 3 and manager.stats.expired == 2
+
+
+def test_failed_quoting_does_not_cancel_twice():
+    submitted, cancel_calls = [], []
+    quoter = RfqQuoter(PRIVATE_KEY, chain_id=1, nonce_allocator=NonceAllocator(end=3))
+    manager = LadderManager(quoter, RfqPair(WETH, USDC, ttl=60), submit=submitted.append, cancel=cancel_calls.extend)
+    manager.refresh(ladder(1400, 1410), now=NOW)
+
+    with pytest.raises(AssertionError, match="nonces exhausted"):
+        manager.refresh(ladder(1410, 1420, 1430), now=NOW + 1)
+    assert [quote.order.taking_amount for quote in manager.live] == [1410 * 10**6]
+    assert len(cancel_calls) == 1
+
+    retry = manager.refresh(ladder(1410), now=NOW + 2)
+    assert not retry.cancelled and len(cancel_calls) == 1
+
+
+def test_unsubmitted_quotes_are_quoted_again():
+    submitted, failed = [], []
+
+    def submit(quote):
+        if len(submitted) == 1 and not failed:
+            failed.append(quote)
+            raise ConnectionError("orderbook unavailable")
+        submitted.append(quote)
+
+    quoter = RfqQuoter(PRIVATE_KEY, chain_id=1, nonce_allocator=NonceAllocator())
+    manager = LadderManager(quoter, RfqPair(WETH, USDC, ttl=60), submit=submit)
+
+    with pytest.raises(ConnectionError):
+        manager.refresh(ladder(1400, 1410, 1420, 1430), now=NOW)
+    assert manager.live == submitted and len(submitted) == 1
+
+    retry = manager.refresh(ladder(1400, 1410, 1420, 1430), now=NOW + 1)
+    assert len(retry.kept) == 1 and len(retry.created) == 3
+    assert sorted(quote.order.taking_amount for quote in submitted) == [level.taking_amount for level in ladder(1400, 1410, 1420, 1430)]
+
+
+def test_failed_cancel_calls_are_retried():
+    sent, failed = [], []
+
+    def cancel(calls):
+        if not failed:
+            failed.append(calls)
+            raise ConnectionError("rpc unavailable")
+        sent.extend(calls)
+
+    quoter = RfqQuoter(PRIVATE_KEY, chain_id=1, nonce_allocator=NonceAllocator())
+    manager = LadderManager(quoter, RfqPair(WETH, USDC, ttl=60), cancel=cancel)
+    stale = manager.refresh(ladder(1400, 1410), now=NOW).created[0]
+
+    with pytest.raises(ConnectionError):
+        manager.refresh(ladder(1410), now=NOW + 1)
+    assert [order_hash for call in manager.pending_cancel_calls for order_hash in call.order_hashes] == [stale.order_hash]
+
+    retry = manager.refresh(ladder(1420), now=NOW + 2)
+    assert retry.cancel_calls == sent and len(sent) == 2
+    assert sent[0] == failed[0][0] and not manager.pending_cancel_calls
@@ -1,3 +1,4 @@
+import dataclasses
 import pytest
 from unittest.mock import patch
 from limit_order_sdk import LimitOrder, MakerTraits, ExtensionBuilder, OrderInfoData, Address
@@ -60,3 +61,33 @@ def test_create_limit_order_with_extension_and_salt(mock_random, mock_datetime):
     )
 
     assert LimitOrder.from_data_and_extension(order.build(), ext) == order
+
+
+def test_built_data_is_cached_until_fields_change():
+    from eth_abi import encode
+
+    order_info = OrderInfoData(
+        maker_asset=Address("0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"),
+        taker_asset=Address("0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"),
+        making_amount=1000000000000000000,
+        taking_amount=1420000000,
+        maker=Address("0x00000000219ab540356cbb839cbe05303d7705fa"),
+        salt=10,
+    )
+    order = LimitOrder(order_info=order_info)
+    struct, calldata, order_hash = order.build(), order.to_calldata(), order.get_order_hash(1)
+
+    assert order.build() is struct
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        struct.makingAmount = 1
+    assert calldata == "0x" + encode(LimitOrder.web3_types, list(struct.to_dict().values())).hex()
+    assert order.get_order_hash(1) is order_hash
+
+    order.making_amount += 1
+    assert order.build().makingAmount == struct.makingAmount + 1
+    assert order.to_calldata() != calldata
+    assert order.get_order_hash(1) != order_hash
+
+    order.maker_traits.allow_multiple_fills()  # changed in place
+    assert order.build().makerTraits == order.maker_traits.as_int()
+    assert LimitOrder.from_calldata(order.to_calldata()) == order
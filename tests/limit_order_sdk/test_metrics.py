@@ -0,0 +1,73 @@
+import pytest
+from limit_order_sdk import Api, ApiConfig, CallbackSink, ExtensionBuilder, HttpProviderConnector, InMemoryRecorder, LimitOrderContract, PrometheusSink, TakerTraits, get_metrics_sink, set_metrics_sink
+from tests.limit_order_sdk.helpers import build_order
+
+SIGNATURE = "0x" + "11" * 32 + "22" * 32 + "1b"
+
+
+class StubConnector(HttpProviderConnector):
+    def get(self, url, headers):
+        return {"url": url}
+
+    def post(self, url, data, headers):
+        raise ConnectionError("offline")
+
+
+@pytest.fixture
+def recorder():
+    recorder = InMemoryRecorder()
+    set_metrics_sink(recorder)
+    yield recorder
+    set_metrics_sink(None)
+
+
+def test_records_hot_paths(recorder):
+    order = build_order()
+    order.get_order_hash(1)
+    ExtensionBuilder().with_custom_data("0xdeadbeef").build().keccak256()
+    LimitOrderContract.get_fill_order_calldata(order.build(), SIGNATURE, TakerTraits.default(), 1)
+
+    assert recorder.counts["limit_order.get_order_hash"] == 1
+    assert recorder.counts["extension.keccak256"] == 1
+    assert recorder.counts["extension.encode"] == 1
+    assert recorder.counts["limit_order_contract.get_fill_order_calldata"] == 1
+    assert recorder.total_time("limit_order.get_order_hash") > 0
+
+
+def test_records_connector_calls_and_errors(recorder):
+    api = Api(ApiConfig(auth_key="key", http_connector=StubConnector(), chain_id=1))
+    api.get_order_by_hash("0x01")
+    with pytest.raises(ConnectionError):
+        api.submit_order(build_order(), SIGNATURE)
+
+    assert recorder.counts["api.http_get"] == 1
+    assert recorder.counts["api.http_post"] == 1
+    assert recorder.errors["api.http_post"] == 1
+    assert "api.http_get" not in recorder.errors
+
+
+def test_callback_sink():
+    calls = []
+    set_metrics_sink(CallbackSink(lambda name, duration, error: calls.append((name, error))))
+    try:
+        build_order().get_order_hash(1)
+    finally:
+        set_metrics_sink(None)
+
+    assert ("limit_order.get_order_hash", False) in calls
+
+
+def test_disabled_by_default():
+    assert get_metrics_sink() is None
+
+
+def test_prometheus_sink():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    set_metrics_sink(PrometheusSink(registry))
+    try:
+        build_order().get_order_hash(1)
+    finally:
+        set_metrics_sink(None)
+
+    assert registry.get_sample_value("limit_order_sdk_calls_total", {"operation": "limit_order.get_order_hash"}) == 1
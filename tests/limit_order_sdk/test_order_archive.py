@@ -0,0 +1,60 @@
+import os
+import pytest
+from limit_order_sdk import OrderArchiveReader, OrderArchiveWriter, decode_order_head, decode_order_record, encode_order_head, encode_order_record
+from tests.limit_order_sdk.helpers import build_numbered_order
+
+SIGNATURE = "0x" + "11" * 32 + "22" * 32 + "1b"
+
+
+def test_order_head_matches_calldata():
+    order = build_numbered_order(1)
+    head = encode_order_head(order.build())
+    assert "0x" + head.hex() == order.to_calldata()
+    assert decode_order_head(head) == order.build()
+
+
+def test_order_record_encode_decode():
+    order = build_numbered_order(1, with_extension=True)
+    encoded = encode_order_record(order, SIGNATURE)
+
+    record, end = decode_order_record(encoded)
+
+    assert end == len(encoded)
+    assert record.order == order
+    assert record.order.extension.encode() == order.extension.encode()
+    assert record.signature == SIGNATURE
+
+
+def test_archive_random_access(tmp_path):
+    path = os.path.join(tmp_path, "orders.bin")
+    orders = [build_numbered_order(i, with_extension=i % 2 == 0) for i in range(50)]
+
+    with OrderArchiveWriter(path, chain_id=1) as writer:
+        for order in orders:
+            writer.append(order, SIGNATURE)
+
+    with OrderArchiveReader(path) as archive:
+        assert len(archive) == len(orders)
+        assert archive.chain_id == 1
+        assert archive[7].order == orders[7]
+        assert archive[-1].order == orders[-1]
+        assert [record.order for record in archive] == orders
+
+        for i in (0, 13, 49):
+            record = archive.get_by_hash(orders[i].get_order_hash(1))
+            assert record is not None and record.order == orders[i]
+        assert archive.get_by_hash("0x" + "00" * 32) is None
+
+        with pytest.raises(IndexError):
+            archive[50]
+
+
+def test_archive_rejects_foreign_file(tmp_path):
+    path = os.path.join(tmp_path, "orders.bin")
+    with OrderArchiveWriter(path, chain_id=1):
+        pass
+    with open(path, "r+b") as f:
+        f.write(b"NOTANARC")
+
+    with pytest.raises(ValueError):
+        OrderArchiveReader(path)
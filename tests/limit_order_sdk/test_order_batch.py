@@ -0,0 +1,57 @@
+from limit_order_sdk import MakerTraits, OrderBatch
+from tests.limit_order_sdk.helpers import MAKER, USDC, WETH, build_order
+
+
+def build_batch() -> OrderBatch:
+    return OrderBatch(
+        [
+            build_order(MakerTraits.default(), salt=1),
+            build_order(MakerTraits.default().with_expiration(100), salt=2),
+            build_order(MakerTraits.default().with_expiration(200).with_allowed_sender(MAKER), salt=3),
+            build_order(MakerTraits.default().disable_partial_fills().enable_permit2(), salt=4, maker_asset=USDC, taker_asset=WETH),
+            build_order(MakerTraits.default().allow_multiple_fills().with_expiration(300), salt=5),
+        ]
+    )
+
+
+def test_trait_predicates():
+    batch = build_batch()
+    assert batch.indices(batch.is_private()) == [2]
+    assert batch.indices(batch.allows_partial_fills()) == [0, 1, 2, 4]
+    assert batch.indices(batch.allows_multiple_fills()) == [4]
+    assert batch.indices(batch.is_bit_invalidator_mode()) == [0, 1, 2, 3]
+    assert batch.indices(batch.is_permit2()) == [3]
+
+
+def test_expired_at():
+    batch = build_batch()
+    assert batch.indices(batch.expired_at(100)) == []
+    assert batch.indices(batch.expired_at(101)) == [1]
+    assert batch.indices(batch.expired_at(1000)) == [1, 2, 4]
+    assert batch.indices(batch.invert(batch.expired_at(250))) == [0, 3, 4]
+
+
+def test_for_pair_and_combination():
+    batch = build_batch()
+    assert batch.indices(batch.for_pair(WETH, USDC)) == [0, 1, 2, 4]
+    assert batch.indices(batch.for_pair(USDC, WETH)) == [3]
+    assert batch.for_pair(WETH, MAKER) == 0
+
+    mask = batch.for_pair(WETH, USDC) & batch.invert(batch.expired_at(150)) & batch.invert(batch.is_private())
+    assert [order.salt for order in batch.select(mask)] == [1, 5]
+    assert batch.count(mask) == 2
+
+
+def test_expired_at_matches_maker_traits():
+    orders = [build_order(MakerTraits.default().with_expiration((i * 7919) % 1000), salt=i + 1) for i in range(500)]
+    batch = OrderBatch(orders)
+    for timestamp in (0, 1, 250, 999, 1000):
+        expected = [i for i, order in enumerate(orders) if order.maker_traits.expiration() is not None and order.maker_traits.expiration() < timestamp]
+        assert batch.indices(batch.expired_at(timestamp)) == expected
+
+
+def test_empty_batch():
+    batch = OrderBatch([])
+    assert batch.is_private() == 0
+    assert batch.expired_at(1) == 0
+    assert batch.select(batch.all()) == []
@@ -0,0 +1,32 @@
+import random
+
+import pytest
+from eth_account import Account
+
+from limit_order_sdk import Address, OrderSigner, get_chain_context
+from tests.limit_order_sdk.helpers import build_random_order, sign_typed_data
+
+
+@pytest.mark.parametrize("chain_id", [1, 56, 324])
+def test_signatures_match_sign_typed_data(chain_id):
+    rnd = random.Random(chain_id)
+    for i in range(8):
+        key = rnd.randbytes(32)
+        signer = OrderSigner(key)
+        order = build_random_order(rnd, signer.address, with_extension=i % 2 == 1)
+
+        assert signer.address == Address(Account.from_key(key).address.lower())
+        assert signer.sign(order, chain_id) == sign_typed_data(key, order, chain_id)
+
+
+def test_batch_and_hex_key():
+    rnd = random.Random(7)
+    key = rnd.randbytes(32)
+    signer = OrderSigner("0x" + key.hex())
+    orders = [build_random_order(rnd, signer.address, with_extension=i % 2 == 0) for i in range(4)]
+    context = get_chain_context(137)
+
+    signatures = signer.sign_orders(orders, context)
+
+    assert signatures == [sign_typed_data(key, order, 137) for order in orders]
+    assert signatures[0] == signer.sign_order_hash(orders[0].get_order_hash(137))
@@ -0,0 +1,68 @@
+from limit_order_sdk import MakerTraits, OrderStateTracker, PredicateEvaluator, PredicateResolver, EpochEquals
+from tests.limit_order_sdk.helpers import MAKER, build_order
+
+HASH = "0x" + "ab" * 32
+
+
+def test_remaining_amount_of_multiple_fill_order():
+    tracker = OrderStateTracker()
+    order = build_order(MakerTraits.default().allow_multiple_fills(), making_amount=100)
+
+    assert tracker.remaining_amount(order, HASH) == 100
+    tracker.apply_fill(order, HASH, 30)
+    assert tracker.remaining_amount(order, HASH) == 70
+    tracker.apply_order_filled(HASH.upper().replace("0X", "0x"), 10)
+    assert tracker.remaining_amount(order, HASH) == 10
+
+    tracker.apply_order_cancelled(HASH)
+    assert tracker.remaining_amount(order, HASH) == 0
+    assert tracker.is_cancelled(order, HASH)
+
+
+def test_bit_invalidator():
+    tracker = OrderStateTracker()
+    order = build_order(MakerTraits.default().with_nonce(300))
+    other = build_order(MakerTraits.default().with_nonce(301))
+
+    tracker.apply_fill(order, HASH, 100)
+    assert not tracker.is_fillable(order, HASH)
+    assert tracker.is_fillable(other, "0x" + "cd" * 32)
+    assert tracker.bit_invalidator(MAKER, 1) == 1 << 44
+
+    # Event carries the whole slot value
+    tracker.apply_bit_invalidator_updated(str(MAKER), 1, (1 << 44) | (1 << 45))
+    assert not tracker.is_fillable(other, "0x" + "cd" * 32)
+
+
+def test_cancel_by_nonce_and_mask():
+    tracker = OrderStateTracker()
+    tracker.apply_cancel(MAKER, MakerTraits.default().with_nonce(1), HASH)
+    tracker.apply_bits_invalidate(MAKER, MakerTraits.default().with_nonce(256), 1 << 7)
+
+    assert tracker.is_cancelled(build_order(MakerTraits.default().with_nonce(1)), HASH)
+    assert tracker.is_bit_invalidated(MAKER, 256)
+    assert tracker.is_bit_invalidated(MAKER, 263)
+    assert not tracker.is_bit_invalidated(MAKER, 257)
+
+
+def test_epochs():
+    tracker = OrderStateTracker()
+    order = build_order(MakerTraits.default().allow_multiple_fills().with_epoch(2, 1), making_amount=100)
+
+    assert not tracker.is_fillable(order, HASH)
+    tracker.apply_advance_epoch(MAKER, 2)
+    assert tracker.remaining_amount(order, HASH) == 100
+    tracker.apply_epoch_increased(MAKER, 2, 5)
+    assert tracker.is_cancelled(order, HASH)
+
+    # Epochs can feed local predicate checks
+    assert PredicateEvaluator(PredicateResolver(epochs=tracker.epochs)).check(EpochEquals(str(MAKER), 2, 5)) is True
+
+
+def test_partial_fill_event_of_single_fill_order():
+    tracker = OrderStateTracker()
+    order = build_order(MakerTraits.default(), making_amount=100)
+
+    tracker.apply_order_filled(HASH, 50)
+    assert tracker.remaining_amount(order, HASH) == 0
+    assert not tracker.is_fillable(order, HASH)
@@ -0,0 +1,67 @@
+import pytest
+
+from limit_order_sdk import Address, ExtensionBuilder, LimitOrder, MakerTraits, OrderInfoData, OrderTemplate
+from tests.limit_order_sdk.helpers import MAKER, USDC as TAKER_ASSET, WETH as MAKER_ASSET
+
+RECEIVER = Address("0x0000000000000000000000000000000000000001")
+
+
+def build_template(**kwargs) -> OrderTemplate:
+    return OrderTemplate(MAKER, MAKER_ASSET, TAKER_ASSET, **kwargs)
+
+
+def build_order(order: LimitOrder, maker_traits: MakerTraits, **kwargs) -> LimitOrder:
+    # The same order built one by one with the regular constructor
+    info = OrderInfoData(maker_asset=MAKER_ASSET, taker_asset=TAKER_ASSET, making_amount=order.making_amount, taking_amount=order.taking_amount, maker=MAKER, salt=order.salt, **kwargs)
+    return LimitOrder(info, maker_traits, order.extension)
+
+
+def test_stamped_orders_match_regular_orders():
+    ext = ExtensionBuilder().with_custom_data("0xdeadbeef").build()
+    template = build_template(receiver=RECEIVER, extension=ext, maker_traits=MakerTraits.default().allow_multiple_fills().with_nonce(7).with_expiration(100))
+    orders = template.stamp([10, 20, 30], [1, 2, 3], expirations=[1000, 2000, 3000])
+
+    assert [order.making_amount for order in orders] == [10, 20, 30]
+    assert len({order.salt for order in orders}) == 3
+    for order, expiration in zip(orders, [1000, 2000, 3000]):
+        expected = build_order(order, MakerTraits.default().allow_multiple_fills().with_nonce(7).with_expiration(expiration), receiver=RECEIVER)
+        assert order == expected
+        assert order.maker_traits.has_extension()
+        assert order.to_calldata() == expected.to_calldata()
+
+
+def test_hashes_and_typed_data_match_regular_orders():
+    template = build_template(maker_traits=MakerTraits.default().disable_multiple_fills())
+    orders = template.stamp([10, 20], [1, 2], nonces=[1, 2], expirations=[1000, 2000])
+
+    assert template.get_order_hashes(orders, 1) == [order.get_order_hash(1) for order in orders]
+    assert template.get_typed_data(orders, 1) == [order.get_typed_data(1) for order in orders]
+
+
+def test_explicit_salts_are_verified():
+    ext = ExtensionBuilder().with_custom_data("0xdeadbeef").build()
+    template = build_template(extension=ext)
+
+    salts = template.salts(2)
+    assert [order.salt for order in template.stamp([1, 2], [1, 2], salts=salts)] == salts
+    with pytest.raises(AssertionError, match="invalid salt"):
+        template.stamp([1], [1], salts=[123])
+
+
+def test_vector_validation():
+    template = build_template()
+    with pytest.raises(AssertionError, match="length mismatch"):
+        template.stamp([1, 2], [1])
+    with pytest.raises(AssertionError, match="expiration too big"):
+        template.stamp([1], [1], expirations=[1 << 40])
+
+
+def test_receiver_equal_to_maker_is_zero():
+    orders = build_template(receiver=MAKER).stamp([1], [1])
+    assert str(orders[0].receiver) == "0x0000000000000000000000000000000000000000"
+
+
+def test_order_hashes_of_orders_from_other_templates():
+    orders = build_template().stamp([10], [1]) + OrderTemplate(RECEIVER, TAKER_ASSET, MAKER_ASSET).stamp([10], [1])
+
+    assert build_template().get_order_hashes(orders, 1) == [order.get_order_hash(1) for order in orders]
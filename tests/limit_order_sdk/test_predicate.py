@@ -0,0 +1,92 @@
+import pytest
+from web3 import Web3
+
+from limit_order_sdk import (
+    And,
+    ArbitraryStaticCall,
+    Call,
+    EpochEquals,
+    ExtensionBuilder,
+    Gt,
+    Lt,
+    Not,
+    Or,
+    PredicateEvaluator,
+    PredicateResolver,
+    StaticCallFailed,
+    TimestampBelow,
+    decode_predicate,
+)
+from limit_order_sdk.limit_order_contract.limit_order_contract import get_lop_contract
+
+MAKER = "0x00000000219ab540356cbb839cbe05303d7705fa"
+HELPER = "0x303389f541ff2d620e42832f180a08e767b28e10"
+ORACLE = "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"
+
+
+def encode_abi(fn_name: str, args: list) -> str:
+    args = [Web3.to_checksum_address(arg) if isinstance(arg, str) and len(arg) == 42 else arg for arg in args]
+    return get_lop_contract().encodeABI(fn_name=fn_name, args=args)
+
+
+def test_decode_predicate_encoded_with_web3():
+    timestamp_below = encode_abi("arbitraryStaticCall", [HELPER, "0x63592c2b" + (1700000000).to_bytes(32, "big").hex()])
+    epoch_equals = encode_abi("epochEquals", [MAKER, 1, 5])
+    price = encode_abi("lt", [1000, encode_abi("arbitraryStaticCall", [ORACLE, "0xfeaf968c"])])
+    operands = [timestamp_below, epoch_equals, price]
+
+    offsets, end = 0, 0
+    for i, operand in enumerate(operands):
+        end += len(operand) // 2 - 1
+        offsets |= end << (32 * i)
+    predicate = encode_abi("and", [offsets, "0x" + "".join(operand[2:] for operand in operands)])
+
+    tree = decode_predicate(predicate)
+    assert tree == And((TimestampBelow(HELPER, 1700000000), EpochEquals(MAKER, 1, 5), Lt(1000, ArbitraryStaticCall(ORACLE, "0xfeaf968c"))))
+    assert tree.encode() == predicate
+
+
+def test_encode_matches_web3():
+    tree = Or((Not(Call("0x12345678")), Gt(7, ArbitraryStaticCall(ORACLE, "0xdeadbeef"))))
+    expected_not = encode_abi("not", ["0x12345678"])
+    expected_gt = encode_abi("gt", [7, encode_abi("arbitraryStaticCall", [ORACLE, "0xdeadbeef"])])
+    offsets = (len(expected_not) // 2 - 1) | ((len(expected_not) // 2 - 1 + len(expected_gt) // 2 - 1) << 32)
+    assert tree.encode() == encode_abi("or", [offsets, "0x" + expected_not[2:] + expected_gt[2:]])
+
+
+def test_decode_invalid_predicate():
+    with pytest.raises(ValueError):
+        decode_predicate("0x")
+    with pytest.raises(ValueError):
+        decode_predicate("0xbfa75143" + "00" * 16)
+
+
+def test_evaluate_time_and_epoch():
+    predicate = And((TimestampBelow(HELPER, 1000), EpochEquals(MAKER, 1, 5))).encode()
+
+    assert PredicateEvaluator(PredicateResolver(timestamp=999, epochs={(MAKER, 1): 5})).check(predicate) is True
+    assert PredicateEvaluator(PredicateResolver(timestamp=1000, epochs={(MAKER, 1): 5})).check(predicate) is False
+    assert PredicateEvaluator(PredicateResolver(timestamp=999, epochs={(MAKER, 1): 6})).check(predicate) is False
+    # Unknown epoch, but the expired timestamp alone fails the predicate
+    assert PredicateEvaluator(PredicateResolver(timestamp=1000)).check(predicate) is False
+    assert PredicateEvaluator(PredicateResolver(timestamp=999)).check(predicate) is None
+
+
+def test_evaluate_static_calls():
+    def static_call(target, data):
+        if data == "0x00000000":
+            raise StaticCallFailed()
+        return 500 if target == ORACLE else None
+
+    evaluator = PredicateEvaluator(PredicateResolver(static_call=static_call))
+    assert evaluator.check(Lt(1000, ArbitraryStaticCall(ORACLE, "0xfeaf968c"))) is True
+    assert evaluator.check(Gt(1000, ArbitraryStaticCall(ORACLE, "0xfeaf968c"))) is False
+    assert evaluator.check(Not(ArbitraryStaticCall(ORACLE, "0x00000000"))) is False  # reverted call is not 0
+    assert evaluator.check(Or((Call("0x12345678"), Lt(1000, ArbitraryStaticCall(ORACLE, "0xfeaf968c"))))) is True
+    assert evaluator.check(Call("0x12345678")) is None
+
+
+def test_check_extension():
+    evaluator = PredicateEvaluator(PredicateResolver(timestamp=2000))
+    assert evaluator.check_extension(ExtensionBuilder().build()) is True
+    assert evaluator.check_extension(ExtensionBuilder().with_predicate(TimestampBelow(HELPER, 1000).encode()).build()) is False
@@ -0,0 +1,43 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from eth_account import Account
+
+from limit_order_sdk import Address, NonceAllocator, OrderInfoData, RfqOrder, RfqPair, RfqQuoter
+from tests.limit_order_sdk.helpers import MAKER as TAKER, NOW, PRIVATE_KEY, USDC, WETH, sign_typed_data
+
+
+def test_quotes_match_rfq_orders_and_typed_data_signatures():
+    quoter = RfqQuoter(PRIVATE_KEY, chain_id=137, nonce_allocator=NonceAllocator(start=500))
+    pair = RfqPair(WETH, USDC, ttl=30, allowed_sender=TAKER, use_permit2=True)
+
+    quotes = quoter.quotes(pair, [10**18, 2 * 10**18], [1420 * 10**6, 2840 * 10**6], now=NOW)
+
+    for i, quote in enumerate(quotes):
+        info = OrderInfoData(maker_asset=WETH, taker_asset=USDC, making_amount=quote.order.making_amount, taking_amount=quote.order.taking_amount, maker=quoter.maker, salt=quote.order.salt)
+        expected = RfqOrder(info, {"nonce": 500 + i, "expiration": NOW + 30, "allowed_sender": TAKER, "use_permit2": True})
+        assert isinstance(quote.order, RfqOrder)
+        assert quote.order == expected
+        assert quote.order_hash == expected.get_order_hash(137)
+        assert quote.signature == sign_typed_data(PRIVATE_KEY, expected, 137)
+    assert quoter.maker == Address(Account.from_key(PRIVATE_KEY).address.lower())
+
+
+def test_nonces_are_unique_across_threads():
+    allocator = NonceAllocator()
+    quoter = RfqQuoter(bytes.fromhex(PRIVATE_KEY[2:]), chain_id=1, nonce_allocator=allocator)
+    pair = RfqPair(WETH, USDC)
+
+    with ThreadPoolExecutor(4) as executor:
+        quotes = list(executor.map(lambda i: quoter.quote(pair, 10**18 + i, 1420 * 10**6), range(16)))
+
+    assert sorted(quote.order.maker_traits.nonce_or_epoch() for quote in quotes) == list(range(16))
+    assert allocator.next_nonce == 16
+
+
+def test_allocator_stops_at_range_end():
+    allocator = NonceAllocator(start=10, end=12)
+
+    assert list(allocator.allocate(2)) == [10, 11]
+    with pytest.raises(AssertionError):
+        allocator.allocate()
@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+from limit_order_sdk import ExtensionBuilder, LimitOrder, OrderInfoData, SaltGenerator
+from tests.limit_order_sdk.helpers import MAKER, USDC, WETH
+
+
+def build_order_info() -> OrderInfoData:
+    return OrderInfoData(maker_asset=WETH, taker_asset=USDC, making_amount=10**18, taking_amount=1420 * 10**6, maker=MAKER)
+
+
+def test_orders_without_salt_get_distinct_salts():
+    salts = {LimitOrder(build_order_info()).salt for _ in range(100)}
+    assert len(salts) == 100
+
+
+def test_base_salts_are_distinct_96_bit_values():
+    generator = SaltGenerator(chunk_size=100)  # smaller than a single batch, forces a refill
+    salts = generator.base_salts(1000) + [generator.base_salt() for _ in range(100)]
+    assert len(set(salts)) == len(salts)
+    assert all(0 <= salt < 1 << 96 for salt in salts)
+
+
+def test_salts_are_valid_for_extension():
+    ext = ExtensionBuilder().with_custom_data("0xdeadbeef").build()
+    for salt in SaltGenerator().salts(10, ext):
+        assert LimitOrder.verify_salt(salt, ext) == salt
+        assert salt >> 160 < 1 << 96
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_processes_get_distinct_salts():
+    generator = SaltGenerator()
+    generator.base_salt()  # fill the buffer before forking
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        os.write(write_fd, generator.base_salt().to_bytes(12, "big"))
+        os._exit(0)
+
+    os.close(write_fd)
+    child_salt = int.from_bytes(os.read(read_fd, 12), "big")
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+    assert child_salt != generator.base_salt()